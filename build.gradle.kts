@@ -217,7 +217,7 @@ val isDevBuild = project.hasProperty("devMode") ||
 
 tasks {
     register("generateThemes", Exec::class) {
-        commandLine("python3", "scripts/generate-themes.py")
+        commandLine("python3", "scripts/monokai-islands.py", "generate", "--all")
     }
 
     buildPlugin {
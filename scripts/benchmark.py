@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""Benchmark the theme generator and contrast validator hot paths.
+
+Measures throughput of theme generation, flattening, color derivation and the contrast
+functions at several scales (one palette up to 100,000 random palettes), writes the
+results as JSON and optionally fails when they regress past a stored baseline.
+"""
+
+import argparse
+from collections.abc import Callable
+import gc
+import json
+from pathlib import Path
+import platform
+import random
+import sys
+import time
+from typing import NamedTuple
+
+from monokai_islands import generate as generator
+from monokai_islands import validate as validator
+from monokai_islands.paths import BUILD_DIR, DEFAULT_PALETTE_PATH
+
+# Palette counts measured by the per-palette benchmarks
+PALETTE_SCALES = (1, 1_000, 100_000)
+
+# UI map multipliers measured by the flattening benchmark
+UI_MAP_SCALES = (1, 10)
+
+# Short workloads are looped until one measurement takes at least this long
+MIN_MEASURE_SECONDS = 0.05
+
+# Random palettes are drawn from a pool of this size, so large scales stay within memory
+PALETTE_POOL_SIZE = 10_000
+
+RESULTS_VERSION = 1
+
+
+class Benchmark(NamedTuple):
+    """Workload measured as a whole: "run" processes "size" items per call."""
+
+    name: str
+    size: int
+    run: Callable[[], object]
+
+
+class Result(NamedTuple):
+    """Best time of one benchmark call over its repeats."""
+
+    name: str
+    size: int
+    seconds: float
+
+    @property
+    def key(self) -> str:
+        """Identify the result across runs (e.g., "generate_theme_json[1000]")."""
+        return f"{self.name}[{self.size}]"
+
+
+def random_color(rng: random.Random) -> str:
+    """Draw a random opaque "#rrggbb" color."""
+    return f"#{rng.getrandbits(24):06x}"
+
+
+def random_palettes(base: dict, count: int, rng: random.Random) -> list[dict]:
+    """Build random palettes with the same keys as the base palette.
+
+    At most PALETTE_POOL_SIZE distinct palettes are created; larger counts reuse them.
+    """
+    keys = [key for key in base if not key.startswith("_")]
+    pool = [{key: random_color(rng) for key in keys} for _ in range(min(count, PALETTE_POOL_SIZE))]
+    return [pool[i % len(pool)] for i in range(count)]
+
+
+def scaled_ui_map(ui_map: dict, scale: int) -> dict:
+    """Repeat a flat UI map under distinct prefixes to get a map of the given multiple."""
+    if scale == 1:
+        return dict(ui_map)
+    return {f"Scale{i}.{key}": value for i in range(scale) for key, value in ui_map.items()}
+
+
+def flat_ui_map(nested: dict, prefix: str = "") -> dict:
+    """Flatten a nested "ui" block back to dotted keys ("" keys map to their parent)."""
+    flat = {}
+    for key, value in nested.items():
+        path = f"{prefix}.{key}" if prefix and key else prefix or key
+        if isinstance(value, dict):
+            flat.update(flat_ui_map(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def build_benchmarks(max_size: int, seed: int) -> list[Benchmark]:
+    """Set up every benchmark up to the given number of items."""
+    rng = random.Random(seed)
+
+    with DEFAULT_PALETTE_PATH.open() as f:
+        base = json.load(f)
+    ui_map = flat_ui_map(generator.generate_theme_json(base, "dark")["ui"])
+
+    benchmarks = []
+    for size in (s for s in PALETTE_SCALES if s <= max_size):
+        palettes = [base] if size == 1 else random_palettes(base, size, rng)
+        colors = [random_color(rng) for _ in range(min(size, PALETTE_POOL_SIZE))]
+        colors = [colors[i % len(colors)] for i in range(size)]
+        pairs = list(zip(colors, reversed(colors), strict=True))
+
+        benchmarks += [
+            Benchmark(
+                "generate_theme_json",
+                size,
+                lambda palettes=palettes: [
+                    generator.generate_theme_json(palette, "dark") for palette in palettes
+                ],
+            ),
+            Benchmark(
+                "calculate_lighter_color",
+                size,
+                lambda colors=colors: [
+                    generator.calculate_lighter_color(color, 0.12) for color in colors
+                ],
+            ),
+            Benchmark(
+                "calculate_contrast_ratio",
+                size,
+                lambda pairs=pairs: [
+                    validator.calculate_contrast_ratio(fg, bg) for fg, bg in pairs
+                ],
+            ),
+            Benchmark(
+                "validate_palette",
+                size,
+                lambda palettes=palettes: [
+                    validator.validate_palette(palette) for palette in palettes
+                ],
+            ),
+        ]
+
+    for scale in UI_MAP_SCALES:
+        scaled = scaled_ui_map(ui_map, scale)
+        benchmarks.append(
+            Benchmark(
+                "flatten_to_nested",
+                len(scaled),
+                lambda scaled=scaled: generator.flatten_to_nested(scaled),
+            )
+        )
+    return benchmarks
+
+
+def time_loops(run: Callable[[], object], loops: int) -> float:
+    """Time several back-to-back calls of a workload."""
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(loops):
+        run()
+    return time.perf_counter() - start
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Result:
+    """Run a benchmark several times and keep the best wall-clock time per call.
+
+    Like timeit's autorange, short workloads are looped (doubling the loop count) until a
+    measurement takes MIN_MEASURE_SECONDS, so microsecond-scale calls are not just noise.
+    """
+    loops = 1
+    while (elapsed := time_loops(benchmark.run, loops)) < MIN_MEASURE_SECONDS:
+        loops *= 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        best = min(best, time_loops(benchmark.run, loops) / loops)
+    return Result(benchmark.name, benchmark.size, best)
+
+
+def load_results(path: Path) -> dict[str, float]:
+    """Load seconds per result key from a results or baseline file."""
+    with path.open() as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        msg = f"{path} has results version {data.get('version')}, expected {RESULTS_VERSION}"
+        raise ValueError(msg)
+    return {f"{r['name']}[{r['size']}]": r["seconds"] for r in data["results"]}
+
+
+def save_results(path: Path, results: list[Result]) -> None:
+    """Write results with the interpreter and machine they were measured on."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": RESULTS_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": [
+            {
+                "name": r.name,
+                "size": r.size,
+                "seconds": round(r.seconds, 9),
+                "per_item_us": round(r.seconds / r.size * 1e6, 4),
+            }
+            for r in results
+        ],
+    }
+    with path.open("w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def find_regressions(
+    results: list[Result],
+    baseline: dict[str, float],
+    tolerance: float,
+) -> list[str]:
+    """Compare results to a baseline and describe those slower than the tolerance allows."""
+    regressions = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+        change = result.seconds / reference - 1
+        if change > tolerance:
+            regressions.append(
+                f"  ❌ {result.key}: {result.seconds:.6f}s vs {reference:.6f}s baseline "
+                f"(+{change:.0%}, tolerance: {tolerance:.0%})"
+            )
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=BUILD_DIR / "benchmarks" / "results.json",
+        help="Where to write results (default: build/benchmarks/results.json)",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Results file to compare against; exits non-zero on regressions",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Also write the results to --baseline instead of comparing against it",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline as a fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=max(PALETTE_SCALES),
+        help="Skip palette scales above this many items (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per benchmark; the best one is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--filter",
+        help="Only run benchmarks whose name contains this text",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random palette seed (default: 0)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks and check them against the baseline."""
+    args = parse_args()
+    if args.save_baseline and args.baseline is None:
+        print("❌ --save-baseline requires --baseline PATH")
+        sys.exit(1)
+
+    benchmarks = build_benchmarks(args.max_size, args.seed)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.name]
+
+    results = []
+    for benchmark in benchmarks:
+        result = measure(benchmark, args.repeat)
+        results.append(result)
+        per_item = result.seconds / result.size * 1e6
+        print(f"  {result.key:<36} {result.seconds:>12.6f}s {per_item:>10.3f}µs/item")
+
+    save_results(args.output, results)
+    print(f"\n✓ Wrote {len(results)} result(s) to {args.output}")
+
+    if args.baseline is None:
+        return
+    if args.save_baseline:
+        save_results(args.baseline, results)
+        print(f"✓ Saved baseline to {args.baseline}")
+        return
+
+    try:
+        baseline = load_results(args.baseline)
+    except (OSError, ValueError) as e:
+        print(f"❌ Cannot read baseline: {e}")
+        sys.exit(1)
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\nRegressions against {args.baseline}:")
+        for regression in regressions:
+            print(regression)
+        print(f"\n❌ Found {len(regressions)} performance regression(s)")
+        sys.exit(1)
+
+    print(f"\n✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
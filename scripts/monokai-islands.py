@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""Monokai Islands theme tooling (see monokai_islands/cli.py).
+
+Usage: python3 scripts/monokai-islands.py {generate,validate,diff} [ARGS...]
+"""
+
+from monokai_islands.cli import main
+
+if __name__ == "__main__":
+    main()
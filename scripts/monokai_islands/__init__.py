@@ -0,0 +1,6 @@
+"""Monokai Islands theme tooling: theme generation, contrast validation and theme diffs.
+
+Run it through scripts/monokai-islands.py (or "python3 -m monokai_islands" with scripts/
+on the path). Importing the package loads nothing else; commands and their NumPy-backed
+helpers are imported only when used.
+"""
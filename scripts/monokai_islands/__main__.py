@@ -0,0 +1,5 @@
+"""Run the command line interface with "python3 -m monokai_islands"."""
+
+from .cli import main
+
+main()
@@ -0,0 +1,55 @@
+"""Single command line entry point: generate, validate and diff.
+
+Only the selected command's module is imported, so "generate" never loads the validator,
+the diff or NumPy, and commands parse their own arguments.
+"""
+
+import argparse
+import importlib
+from pathlib import Path
+
+# Command -> (module in this package, summary)
+COMMANDS = {
+    "generate": ("generate", "Generate themes, editor schemes and stylesheets from palettes"),
+    "validate": ("validate", "Validate WCAG contrast of palettes and generated files"),
+    "diff": ("diff", "Compare generated themes and editor schemes by key path"),
+}
+
+
+def add_palette_arguments(parser: argparse.ArgumentParser, verb: str) -> None:
+    """Add the palette selection shared by commands (resolve with paths.resolve_palettes)."""
+    parser.add_argument(
+        "palettes",
+        nargs="*",
+        type=Path,
+        help=f"Palette files to {verb} (default: palettes/monokai-dark.json)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help=f"{verb.capitalize()} every palette in the palettes/ directory",
+    )
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command and leave its arguments to the command."""
+    parser = argparse.ArgumentParser(
+        prog="monokai-islands",
+        description="Monokai Islands theme tooling",
+        epilog="\n".join(f"  {name:<10}{summary}" for name, (_, summary) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("command", choices=COMMANDS, help="Command to run (see below)")
+    parser.add_argument(
+        "args",
+        nargs=argparse.REMAINDER,
+        help='Arguments of the command (see "monokai-islands COMMAND --help")',
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run a command."""
+    args = parse_args(argv)
+    module, _ = COMMANDS[args.command]
+    importlib.import_module(f".{module}", __package__).main(args.args)
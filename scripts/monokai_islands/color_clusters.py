@@ -0,0 +1,149 @@
+"""Near-duplicate color detection in OKLab (requires NumPy).
+
+Every distinct color of a theme (its "colors" block plus the literal colors of its editor
+scheme) is converted to OKLab at once and the full pairwise distance matrix is computed
+in a single pass. Colors closer than a perceptual threshold are grouped into clusters
+around the most important color among them, which the others should merge into.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_space import hex_to_rgba_array, srgb_to_oklab
+from .color_table import format_hex, parse_hex
+
+# OKLab distance below which two colors are hard to tell apart (about one JND)
+DEFAULT_THRESHOLD = 0.02
+
+# Scheme options listed per merge suggestion (the rest are counted)
+MAX_LISTED_OPTIONS = 3
+
+
+class ColorUse(NamedTuple):
+    """Distinct color with the theme color names and scheme options using it."""
+
+    color: str
+    names: list[str]
+    options: list[str]
+
+
+class Merge(NamedTuple):
+    """Theme color name or scheme literal to replace with the cluster's kept color."""
+
+    source: str
+    color: str
+    distance: float
+
+
+class DuplicateCluster(NamedTuple):
+    """Colors within the threshold of each other and the color they should merge into.
+
+    "keep" is a theme color name, or scheme options when only scheme literals are involved.
+    """
+
+    keep: str
+    color: str
+    merges: list[Merge]
+
+
+def collect_uses(
+    colors: Mapping[str, str],
+    literals: Iterable[tuple[str, str]],
+) -> list[ColorUse]:
+    """Group theme colors and scheme literals by their (normalized) color value.
+
+    Args:
+        colors: Theme "colors" block (name -> hex), in palette order
+        literals: (scheme option, hex) pairs; colors equal to a theme color count as
+            references to it and are not listed as options
+    """
+    uses: dict[str, ColorUse] = {}
+    for name, value in colors.items():
+        color = format_hex(parse_hex(value))
+        uses.setdefault(color, ColorUse(color, [], [])).names.append(name)
+    for option, value in literals:
+        color = format_hex(parse_hex(value))
+        use = uses.setdefault(color, ColorUse(color, [], []))
+        if not use.names and option not in use.options:
+            use.options.append(option)
+    return list(uses.values())
+
+
+def describe_options(options: list[str]) -> str:
+    """List scheme options of a literal (e.g., "TEXT, CARET_ROW_COLOR (+2 more)")."""
+    listed = ", ".join(options[:MAX_LISTED_OPTIONS])
+    if len(options) > MAX_LISTED_OPTIONS:
+        listed += f" (+{len(options) - MAX_LISTED_OPTIONS} more)"
+    return f"scheme {listed}"
+
+
+def distance_matrix(hex_colors: list[str]) -> np.ndarray:
+    """Calculate the OKLab distance between every pair of colors.
+
+    Alpha (0-1 range) is treated as a fourth coordinate, so a translucent overlay is
+    never merged with an opaque color of the same hue.
+    """
+    rgba = hex_to_rgba_array(hex_colors)
+    points = np.concatenate([srgb_to_oklab(rgba[:, :3]), rgba[:, 3:] / 255], axis=1)
+    return np.linalg.norm(points[:, None, :] - points[None, :, :], axis=-1)
+
+
+def leader_clusters(distances: np.ndarray, order: list[int], threshold: float) -> list[list[int]]:
+    """Group colors around leaders, taken in priority order.
+
+    Each color not yet assigned becomes a leader and takes every unassigned color closer
+    than the threshold to it. Unlike connected components, clusters cannot chain: every
+    member is within the threshold of the color it merges into.
+
+    Returns:
+        Clusters as [leader, *members] index lists (including single colors)
+    """
+    assigned = np.zeros(len(distances), dtype=bool)
+    clusters = []
+    for leader in order:
+        if assigned[leader]:
+            continue
+        members = np.flatnonzero((distances[leader] < threshold) & ~assigned)
+        assigned[members] = True
+        clusters.append([leader, *(int(i) for i in members if i != leader)])
+    return clusters
+
+
+def find_duplicates(
+    uses: list[ColorUse],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[list[DuplicateCluster], int]:
+    """Cluster near-duplicate colors and suggest what to merge into what.
+
+    Exact duplicates (several theme names for one value) are reported with distance 0.
+    A cluster keeps its earliest theme color name (palette colors come first), or its
+    most used scheme literal when no theme color is involved (see leader_clusters).
+
+    Returns:
+        Clusters found and the number of color distances evaluated
+    """
+    if not uses:
+        return [], 0
+
+    distances = distance_matrix([use.color for use in uses])
+    # Theme colors keep their palette order and take precedence over scheme literals
+    order = sorted(range(len(uses)), key=lambda i: (not uses[i].names, -len(uses[i].options)))
+
+    clusters = []
+    for keep, *members in leader_clusters(distances, order, threshold):
+        kept = uses[keep]
+        merges = [Merge(name, kept.color, 0.0) for name in kept.names[1:]]
+        for i in members:
+            distance = float(distances[keep, i])
+            merges += [Merge(name, uses[i].color, distance) for name in uses[i].names]
+            if uses[i].options:
+                merges.append(Merge(describe_options(uses[i].options), uses[i].color, distance))
+        if not merges:
+            continue
+
+        label = kept.names[0] if kept.names else describe_options(kept.options)
+        clusters.append(DuplicateCluster(label, kept.color, merges))
+
+    return clusters, distances.size
@@ -0,0 +1,301 @@
+"""Derived colors declared as a dependency graph, evaluated lazily with memoization.
+
+A palette's "_derived" block maps color names to expressions over the palette colors
+and other derived colors:
+
+    "#rrggbb" or "#rrggbbaa"          literal color
+    "accent5"                         reference to another color
+    {"lighten": [color, 0.12]}        move towards white by a factor (0.0 to 1.0)
+    {"darken": [color, 0.12]}         move towards black by a factor
+    {"mix": [color, color, 0.1]}      blend, weighted towards the second color
+    {"alpha": [color, "80"]}          replace the alpha channel (hex byte)
+
+Every color argument may be a nested expression. Expressions are checked (including for
+cycles) and compiled once per "_derived" block. A color is evaluated the first time it is
+read and memoized, and changing a palette color only invalidates the derived colors that
+depend on it, directly or through other derived colors.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+from typing import NamedTuple, Self
+
+from .color_table import darken, lighten, mix, parse_hex, with_alpha
+
+
+def parse_factor(value: object) -> float:
+    """Parse a 0.0 to 1.0 factor argument."""
+    if isinstance(value, bool) or not isinstance(value, int | float) or not 0 <= value <= 1:
+        msg = f"expected a factor between 0 and 1, got {value!r}"
+        raise ValueError(msg)
+    return float(value)
+
+
+def parse_byte(value: object) -> int:
+    """Parse a two-digit hex byte argument (e.g., "80")."""
+    if not isinstance(value, str) or len(value) != 2:
+        msg = f'expected a hex byte like "80", got {value!r}'
+        raise ValueError(msg)
+    return int(value, 16)
+
+
+class Operation(NamedTuple):
+    """Color function taking "colors" color arguments, then one argument per parser."""
+
+    function: Callable[..., int]
+    colors: int
+    parsers: tuple[Callable[[object], object], ...]
+
+    @property
+    def arity(self) -> int:
+        """Number of arguments the operation takes."""
+        return self.colors + len(self.parsers)
+
+
+OPERATIONS: dict[str, Operation] = {
+    "lighten": Operation(lighten, 1, (parse_factor,)),
+    "darken": Operation(darken, 1, (parse_factor,)),
+    "mix": Operation(mix, 2, (parse_factor,)),
+    "alpha": Operation(with_alpha, 1, (parse_byte,)),
+}
+
+
+# Compiled expression: packed literal, referenced color name, or (function, colors, extra)
+Node = int | str | tuple
+
+
+def compile_expression(expression: object, name: str) -> Node:
+    """Check and compile an expression of a derived color, so evaluating it is cheap."""
+    if isinstance(expression, str):
+        return parse_hex(expression) if expression.startswith("#") else expression
+
+    if not isinstance(expression, Mapping) or len(expression) != 1:
+        msg = f"{name}: invalid color expression {expression!r}"
+        raise ValueError(msg)
+
+    ((operation, arguments),) = expression.items()
+    if operation not in OPERATIONS or not isinstance(arguments, list):
+        msg = f"{name}: invalid color expression {expression!r}"
+        raise ValueError(msg)
+    spec = OPERATIONS[operation]
+    if len(arguments) != spec.arity:
+        msg = f"{name}: {operation} takes {spec.arity} arguments"
+        raise ValueError(msg)
+
+    colors = tuple(compile_expression(argument, name) for argument in arguments[: spec.colors])
+    try:
+        values = arguments[spec.colors :]
+        extra = tuple(parse(value) for parse, value in zip(spec.parsers, values, strict=True))
+    except ValueError as e:
+        msg = f"{name}: {operation}: {e}"
+        raise ValueError(msg) from e
+    return spec.function, colors, extra
+
+
+def references(node: Node) -> Iterator[str]:
+    """Yield the color names a compiled expression reads."""
+    if type(node) is str:
+        yield node
+    elif type(node) is tuple:
+        for color in node[1]:
+            yield from references(color)
+
+
+def evaluate(node: Node, values: Mapping[str, int]) -> int:
+    """Evaluate a compiled expression whose references are all in values."""
+    if type(node) is int:
+        return node
+    if type(node) is str:
+        return values[node]
+    function, colors, extra = node
+    return function(*[evaluate(color, values) for color in colors], *extra)
+
+
+class CompiledBlock(NamedTuple):
+    """Compiled "_derived" block with its static dependency graph."""
+
+    nodes: dict[str, Node]
+    order: list[tuple[str, Node]]  # dependencies first
+    dependents: dict[str, set[str]]
+    external: frozenset[str]
+
+
+def compile_block(derived: Mapping[str, object]) -> CompiledBlock:
+    """Compile every expression of a "_derived" block and check it for cycles."""
+    nodes = {name: compile_expression(expression, name) for name, expression in derived.items()}
+    dependencies = {name: set(references(node)) for name, node in nodes.items()}
+    dependents: dict[str, set[str]] = {}
+    for name, names in dependencies.items():
+        for dependency in names:
+            dependents.setdefault(dependency, set()).add(name)
+
+    # Depth-first search over derived colors; reaching a color on the path is a cycle
+    done: set[str] = set()
+    order = []
+    for root in nodes:
+        path, stack = [], [(root, iter(dependencies[root]))]
+        while stack:
+            name, children = stack[-1]
+            if len(path) < len(stack):
+                path.append(name)
+            child = next((c for c in children if c in nodes and c not in done), None)
+            if child is None:
+                done.add(name)
+                order.append((name, nodes[name]))
+                stack.pop()
+                path.pop()
+            elif child in path:
+                cycle = " -> ".join([*path[path.index(child) :], child])
+                msg = f"circular color reference: {cycle}"
+                raise ValueError(msg)
+            else:
+                stack.append((child, iter(dependencies[child])))
+
+    external = frozenset(set().union(*dependencies.values()) - nodes.keys())
+    return CompiledBlock(nodes, order, dependents, external)
+
+
+# Recently compiled "_derived" blocks by identity (they are shared by palettes using the
+# base palette's block and by every variant of a palette); each entry keeps its block alive
+_COMPILED: dict[int, tuple[Mapping, CompiledBlock]] = {}
+COMPILED_CACHE_SIZE = 8
+
+
+def compile_derived(derived: Mapping[str, object]) -> CompiledBlock:
+    """Compile a "_derived" block, reusing the result for the same block object."""
+    cached = _COMPILED.get(id(derived))
+    if cached is not None and cached[0] is derived:
+        return cached[1]
+
+    compiled = compile_block(derived)
+    if len(_COMPILED) >= COMPILED_CACHE_SIZE:
+        del _COMPILED[next(iter(_COMPILED))]
+    _COMPILED[id(derived)] = (derived, compiled)
+    return compiled
+
+
+class ColorGraph:
+    """Palette colors plus lazily evaluated derived colors (packed 0xRRGGBBAA values)."""
+
+    def __init__(self, base: Mapping[str, str], derived: Mapping[str, object]) -> None:
+        block = compile_derived(derived)
+        overlap = sorted(block.nodes.keys() & base.keys())
+        if overlap:
+            msg = f"derived colors shadow palette colors: {', '.join(overlap)}"
+            raise ValueError(msg)
+        missing = sorted(block.external - base.keys())
+        if missing:
+            msg = f"derived colors reference unknown colors: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        self.base = {name: parse_hex(value) for name, value in base.items()}
+        self.derived = derived
+        self.evaluations = 0
+        self._nodes = block.nodes
+        self._order = block.order
+        self._dependents = block.dependents
+        self._external = block.external
+        self._memo: dict[str, int] = {}
+
+    @classmethod
+    def from_palette(cls, palette: Mapping, default_derived: Mapping[str, object]) -> Self:
+        """Build the graph of a palette (its "_derived" block, or the default one)."""
+        base = {key: value for key, value in palette.items() if not key.startswith("_")}
+        return cls(base, palette.get("_derived", default_derived))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.base or name in self._nodes
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over derived color names in declaration order."""
+        return iter(self._nodes)
+
+    def __getitem__(self, name: str) -> int:
+        """Get a color, evaluating (and memoizing) it and its dependencies when needed."""
+        value = self.base.get(name)
+        if value is None:
+            value = self._memo.get(name)
+            if value is None:
+                value = self._memo[name] = self._evaluate(self._nodes[name])
+                self.evaluations += 1
+        return value
+
+    def dependencies(self, name: str) -> set[str]:
+        """Get every color a color reads, directly or through other derived colors.
+
+        Palette colors read nothing; a derived color that would read one of these in
+        its place is a cycle.
+        """
+        found: set[str] = set()
+        pending = [name]
+        while pending:
+            node = self._nodes.get(pending.pop())
+            if node is None:
+                continue
+            for reference in references(node):
+                if reference not in found:
+                    found.add(reference)
+                    pending.append(reference)
+        return found
+
+    def _evaluate(self, node: Node) -> int:
+        """Evaluate a compiled expression."""
+        if type(node) is int:
+            return node
+        if type(node) is str:
+            return self[node]
+        function, colors, extra = node
+        return function(*[self._evaluate(color) for color in colors], *extra)
+
+    def update(self, base: Mapping[str, str]) -> set[str]:
+        """Replace the palette colors and forget every derived color depending on changes.
+
+        Args:
+            base: Every palette color; colors missing from it are dropped
+
+        Returns:
+            Derived color names that will be re-evaluated on their next read
+
+        Raises:
+            ValueError: When the new colors shadow derived colors or drop referenced ones
+                (the graph is left unchanged)
+        """
+        overlap = sorted(self._nodes.keys() & base.keys())
+        if overlap:
+            msg = f"derived colors shadow palette colors: {', '.join(overlap)}"
+            raise ValueError(msg)
+        missing = sorted(self._external - base.keys())
+        if missing:
+            msg = f"derived colors reference unknown colors: {', '.join(missing)}"
+            raise ValueError(msg)
+
+        invalidated: set[str] = set()
+        pending = [name for name in self.base if name not in base]
+        for name in pending:
+            del self.base[name]
+        for name, value in base.items():
+            packed = parse_hex(value)
+            if self.base.get(name) != packed:
+                self.base[name] = packed
+                pending.append(name)
+
+        while pending:
+            for dependent in self._dependents.get(pending.pop(), ()):
+                if dependent not in invalidated:
+                    invalidated.add(dependent)
+                    self._memo.pop(dependent, None)
+                    pending.append(dependent)
+        return invalidated
+
+    def to_dict(self) -> dict[str, int]:
+        """Evaluate every derived color, in declaration order.
+
+        Colors not memoized yet are evaluated in dependency order against one flat dict,
+        which avoids the per-read lookups of __getitem__ for whole-palette runs.
+        """
+        values = self.base | self._memo
+        memo = self._memo
+        for name, node in self._order:
+            if name not in values:
+                values[name] = memo[name] = evaluate(node, values)
+                self.evaluations += 1
+        return {name: values[name] for name in self._nodes}
@@ -0,0 +1,105 @@
+"""Index of UI keys -> color names -> resolved colors for a generated theme.
+
+Theme "ui" values are either names from the "colors" block (e.g., "tab_active_border"),
+inline hex colors or non-color literals (e.g., 2, "3,3,1,3", True). The index resolves
+every key once, so lookups are constant time and dangling or unused names are known
+without rescanning the theme.
+"""
+
+from collections.abc import Iterable, Iterator, Mapping
+import re
+from typing import NamedTuple, Self
+
+from .color_table import ColorTable, composite, parse_hex
+
+# Values that can only be meant as color names (literals contain digits-only, commas, ...)
+COLOR_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+HEX_COLOR = re.compile(r"#[0-9a-fA-F]{6}(?:[0-9a-fA-F]{2})?")
+
+
+class SurfacePair(NamedTuple):
+    """Foreground and background UI keys of the same component."""
+
+    fg_key: str
+    bg_key: str
+
+
+def iter_ui_keys(node: Mapping, prefix: str = "") -> Iterator[tuple[str, object]]:
+    """Yield (dotted key, value) for a nested "ui" block ("" keys belong to their parent)."""
+    for key, value in node.items():
+        path = f"{prefix}.{key}" if prefix and key else prefix or key
+        if isinstance(value, Mapping):
+            yield from iter_ui_keys(value, path)
+        else:
+            yield path, value
+
+
+class ColorIndex:
+    """UI keys resolved to color table entries, built once per theme."""
+
+    def __init__(self, colors: Mapping[str, str], ui: Iterable[tuple[str, object]]) -> None:
+        self.table = ColorTable(colors)
+        self.names: dict[str, str] = {}  # UI key -> color name
+        self.inline: dict[str, int] = {}  # UI key -> packed inline hex color
+        self.literals: dict[str, object] = {}  # UI key -> non-color value
+        self.dangling: dict[str, str] = {}  # UI key -> unknown color name
+
+        for key, value in ui:
+            if isinstance(value, str) and value in self.table:
+                self.names[key] = value
+            elif isinstance(value, str) and HEX_COLOR.fullmatch(value):
+                self.inline[key] = parse_hex(value)
+            elif isinstance(value, str) and COLOR_NAME.fullmatch(value):
+                self.dangling[key] = value
+            else:
+                self.literals[key] = value
+
+    @classmethod
+    def from_theme(cls, theme: Mapping) -> Self:
+        """Build the index from a generated theme (nested "ui" block)."""
+        return cls(theme["colors"], iter_ui_keys(theme.get("ui", {})))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.names or key in self.inline
+
+    def resolve(self, key: str) -> int:
+        """Get the packed 0xRRGGBBAA color of a UI key."""
+        if key in self.names:
+            return self.table.packed(self.names[key])
+        return self.inline[key]
+
+    def unused(self, extra_references: Iterable[str] = ()) -> list[str]:
+        """Get color names referenced by no UI key (nor by the extra references)."""
+        used = set(self.names.values()) | set(extra_references)
+        return [name for name in self.table if name not in used]
+
+    def flat(self) -> dict[str, int]:
+        """Get the resolved flat view: UI key -> packed color, for every color UI key.
+
+        Non-color literals stay in "literals" and dangling names in "dangling".
+        """
+        view = {key: self.table.packed(name) for key, name in self.names.items()}
+        view.update(self.inline)
+        return view
+
+    def surface_pairs(self) -> list[SurfacePair]:
+        """Find foreground keys with a background key on the same component.
+
+        "Tree.foreground" pairs with "Tree.background" and "Tab.selectedForeground"
+        with "Tab.selectedBackground".
+        """
+        pairs = []
+        for key in (*self.names, *self.inline):
+            prefix, _, last = key.rpartition(".")
+            stem, found, suffix = last.rpartition("oreground")
+            if not found or suffix or stem[-1:] not in ("f", "F"):
+                continue
+            background = stem[:-1] + ("B" if stem[-1] == "F" else "b") + "ackground"
+            bg_key = f"{prefix}.{background}" if prefix else background
+            if bg_key in self:
+                pairs.append(SurfacePair(key, bg_key))
+        return pairs
+
+    def displayed(self, key: str, underlay: int) -> int:
+        """Get a UI key's color as displayed over an opaque underlay."""
+        return composite(self.resolve(key), underlay)
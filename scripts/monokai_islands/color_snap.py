@@ -0,0 +1,190 @@
+"""Nearest palette-derived color for off-palette literals (requires NumPy).
+
+Every color reachable from the palette with one "_derived" expression (see
+color_graph.py) is enumerated as a candidate: references to palette and derived colors,
+palette colors lightened and darkened in 5% steps and surfaces mixed with palette colors
+in 1% steps. Candidates are computed with the same integer rounding as color_table and
+converted to OKLab once per palette, so every literal snaps to its nearest candidate in
+one batched distance pass.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_space import hex_channels, srgb_to_oklab
+from .color_table import format_hex
+
+# Surfaces accents and text are mixed into (tints like "error_bg" are such mixes)
+MIX_SURFACES = ("background", "dark1", "dark2")
+
+# lighten/darken factors (1.0 reaches white and black) and mix weights tried for every
+# palette color; linspace keeps both endpoints, which float arange steps can drop
+SHADE_FACTORS = np.round(np.linspace(0.05, 1.0, 20), 2)
+MIX_WEIGHTS = np.round(np.linspace(0.01, 0.5, 50), 2)
+
+# OKLab distance below which a literal can be replaced without a visible change
+DEFAULT_MAX_DISTANCE = 0.02
+
+# Sources listed per literal (the rest are counted)
+MAX_LISTED_SOURCES = 3
+
+
+class Candidate(NamedTuple):
+    """One-expression color derivation: reference, lighten, darken or mix."""
+
+    operation: str  # "ref", "lighten", "darken" or "mix"
+    first: str
+    second: str | None
+    factor: float
+
+    def expression(self, alpha: int = 0xFF) -> object:
+        """Get the "_derived" expression (e.g., {"darken": ["accent4", 0.4]})."""
+        if self.operation == "ref":
+            expression: object = self.first
+        elif self.operation == "mix":
+            expression = {"mix": [self.first, self.second, self.factor]}
+        else:
+            expression = {self.operation: [self.first, self.factor]}
+        if alpha != 0xFF:
+            expression = {"alpha": [expression, f"{alpha:02x}"]}
+        return expression
+
+    def describe(self) -> str:
+        """Describe the derivation (e.g., "accent4 darkened 40%")."""
+        if self.operation == "ref":
+            return self.first
+        if self.operation == "mix":
+            return f"{self.first} mixed with {self.factor:.0%} {self.second}"
+        return f"{self.first} {self.operation}ed {self.factor:.0%}"
+
+
+class Snap(NamedTuple):
+    """Literal color with its nearest candidate."""
+
+    literal: str
+    sources: list[str]
+    candidate: Candidate
+    color: str
+    distance: float
+
+
+def describe_sources(sources: list[str]) -> str:
+    """List the places a literal appears (e.g., "scheme TEXT, CARET_COLOR (+2 more)")."""
+    listed = ", ".join(sources[:MAX_LISTED_SOURCES])
+    if len(sources) > MAX_LISTED_SOURCES:
+        listed += f" (+{len(sources) - MAX_LISTED_SOURCES} more)"
+    return listed
+
+
+class CandidateIndex:
+    """Palette-derived candidate colors in OKLab, built once per palette.
+
+    Args:
+        base: Palette colors (name -> packed 0xRRGGBBAA)
+        derived: Evaluated derived colors (name -> packed); only opaque ones are kept
+            as references, since literals are matched on their RGB channels
+        dependencies: Colors each derived color reads (see ColorGraph.dependencies), so
+            a derived color is never suggested as the replacement of one it reads
+    """
+
+    def __init__(
+        self,
+        base: Mapping[str, int],
+        derived: Mapping[str, int],
+        dependencies: Mapping[str, set[str]] | None = None,
+    ) -> None:
+        names = list(base)
+        rgb = hex_channels(np.array(list(base.values()), dtype=np.uint32))[:, :3]
+
+        references = [*names, *(n for n, packed in derived.items() if packed & 0xFF == 0xFF)]
+        colors = [*base.values(), *(derived[name] for name in references[len(names) :])]
+        self.candidates = [Candidate("ref", name, None, 0.0) for name in references]
+
+        # Reference candidates by every derived color they read (shades and mixes only
+        # read palette colors, which never depend on derived ones)
+        self._readers: dict[str, list[int]] = {}
+        for i, name in enumerate(references[len(names) :], len(names)):
+            for read in (dependencies or {}).get(name, set()):
+                self._readers.setdefault(read, []).append(i)
+        parts = [hex_channels(np.array(colors, dtype=np.uint32))[:, :3]]
+
+        # lighten/darken truncate like color_table (factors x colors, row-major)
+        factors = SHADE_FACTORS[:, None, None]
+        parts.append(np.trunc(rgb + (255 - rgb) * factors).reshape(-1, 3))
+        parts.append(np.trunc(rgb * (1 - factors)).reshape(-1, 3))
+        for operation in ("lighten", "darken"):
+            self.candidates += [
+                Candidate(operation, name, None, float(factor))
+                for factor in SHADE_FACTORS
+                for name in names
+            ]
+
+        # mix rounds half to even like Python's round() (surfaces x weights x colors)
+        surfaces = [names.index(name) for name in MIX_SURFACES if name in base]
+        weights = MIX_WEIGHTS[None, :, None, None]
+        first = rgb[surfaces][:, None, None]
+        parts.append(np.rint(first + (rgb - first) * weights).reshape(-1, 3))
+        self.candidates += [
+            Candidate("mix", names[surface], name, float(weight))
+            for surface in surfaces
+            for weight in MIX_WEIGHTS
+            for name in names
+        ]
+
+        self.rgb = np.concatenate(parts).astype(np.intp)
+        self.lab = srgb_to_oklab(self.rgb)
+        self._norms = (self.lab**2).sum(axis=1)
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def nearest(
+        self, packed: Iterable[int], excluded: Iterable[Iterable[str]] = ()
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the nearest candidate of every color (alpha is ignored).
+
+        Equally near candidates resolve to the simplest one, since references come first,
+        then shades, then mixes.
+
+        Args:
+            packed: Colors to match
+            excluded: Per color, names whose readers are no candidates for it (a derived
+                color cannot become a reference to a color that reads it)
+
+        Returns:
+            Candidate indexes and OKLab distances, one per color
+        """
+        lab = srgb_to_oklab(hex_channels(np.array(list(packed), dtype=np.uint32))[:, :3])
+        # |a - b|^2 = |a|^2 + |b|^2 - 2ab, as one matrix product over all candidates
+        squared = (lab**2).sum(axis=1)[:, None] + self._norms[None, :] - 2 * lab @ self.lab.T
+        for row, names in enumerate(excluded):
+            for name in names:
+                squared[row, self._readers.get(name, [])] = np.inf
+        best = squared.argmin(axis=1)
+        distances = np.sqrt(np.maximum(squared[np.arange(len(best)), best], 0.0))
+        return best, distances
+
+    def snap(self, literals: Mapping[int, list[str]]) -> list[Snap]:
+        """Snap literal colors (packed -> sources) to their nearest candidates.
+
+        Candidates reading a source (a derived color name) are skipped for its literal.
+        """
+        packed = list(literals)
+        if not packed:
+            return []
+        best, distances = self.nearest(packed, (literals[color] for color in packed))
+        snaps = []
+        for color, index, distance in zip(packed, best.tolist(), distances.tolist(), strict=True):
+            r, g, b = self.rgb[index].tolist()
+            snaps.append(
+                Snap(
+                    format_hex(color),
+                    literals[color],
+                    self.candidates[index],
+                    f"#{r:02x}{g:02x}{b:02x}",
+                    distance,
+                )
+            )
+        return snaps
@@ -0,0 +1,138 @@
+"""Vectorized sRGB <-> OKLab/OKLCH conversions (requires NumPy).
+
+All functions take and return arrays with colors along the first axis and channels
+along the last one, so whole palettes convert in a single call.
+OKLab reference: https://bottosson.github.io/posts/oklab/
+"""
+
+import numpy as np
+
+from .color_table import SRGB_TO_LINEAR, parse_hex
+
+# Shared sRGB linearization table as an array for vectorized lookups
+LINEARIZE = np.array(SRGB_TO_LINEAR)
+
+# WCAG 2.1 luminance weights for linear sRGB channels
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+_LINEAR_TO_LMS = np.array(
+    [
+        [0.4122214708, 0.5363325363, 0.0514459929],
+        [0.2119034982, 0.6806995451, 0.1073969566],
+        [0.0883024619, 0.2817188376, 0.6299787005],
+    ]
+)
+_LMS_TO_OKLAB = np.array(
+    [
+        [0.2104542553, 0.7936177850, -0.0040720468],
+        [1.9779984951, -2.4285922050, 0.4505937099],
+        [0.0259040371, 0.7827717662, -0.8086757660],
+    ]
+)
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR = np.linalg.inv(_LINEAR_TO_LMS)
+
+
+def hex_to_rgb_array(hex_colors: list[str]) -> np.ndarray:
+    """Convert hex colors to an (n, 3) integer array of RGB values (0-255 range)."""
+    return hex_to_rgba_array(hex_colors)[:, :3]
+
+
+def hex_to_rgba_array(hex_colors: list[str]) -> np.ndarray:
+    """Convert hex colors to an (n, 4) integer array of RGBA values (0-255 range)."""
+    packed = np.array([parse_hex(color) for color in hex_colors], dtype=np.uint32)
+    return hex_channels(packed)
+
+
+def hex_channels(packed: np.ndarray) -> np.ndarray:
+    """Split packed 0xRRGGBBAA colors into an (n, 4) array of channels."""
+    shifts = np.array([24, 16, 8, 0], dtype=np.uint32)
+    return ((packed[:, None] >> shifts) & 0xFF).astype(np.intp)
+
+
+def rgb_array_to_hex(rgb: np.ndarray) -> list[str]:
+    """Convert an (n, 3) array of RGB values (0-255 range) to "#rrggbb" strings."""
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in np.asarray(rgb, dtype=int)]
+
+
+def composite(top: np.ndarray, alpha: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+    """Alpha-composite 8-bit sRGB colors over opaque ones, rounding to 8-bit pixels.
+
+    Arrays broadcast against each other; alpha is in the 0-1 range with one value
+    per top color (shape of top without the channel axis).
+    """
+    alpha = alpha[..., None]
+    return np.rint(top * alpha + bottom * (1 - alpha)).astype(np.intp)
+
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Linearize 8-bit sRGB values using the shared lookup table."""
+    return LINEARIZE[rgb]
+
+
+def linear_to_srgb(linear: np.ndarray) -> np.ndarray:
+    """Encode linear light as 8-bit sRGB values, clipping out-of-gamut colors."""
+    return np.rint(encode_srgb(linear)).astype(np.intp)
+
+
+def encode_srgb(linear: np.ndarray) -> np.ndarray:
+    """Encode linear light as unrounded sRGB values (0-255 range), clipping out of gamut."""
+    linear = np.clip(linear, 0.0, 1.0)
+    encoded = np.where(
+        linear <= 0.0031308,
+        linear * 12.92,
+        1.055 * np.power(linear, 1 / 2.4) - 0.055,
+    )
+    return encoded * 255
+
+
+def decode_srgb(srgb: np.ndarray) -> np.ndarray:
+    """Linearize sRGB values (0-255 range) that may be fractional, like the shared table."""
+    value = np.asarray(srgb, dtype=float) / 255
+    return np.where(value <= 0.03928, value / 12.92, ((value + 0.055) / 1.055) ** 2.4)
+
+
+def luminance(linear: np.ndarray) -> np.ndarray:
+    """Calculate WCAG relative luminance of linear sRGB colors."""
+    return linear @ LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(l1: np.ndarray, l2: np.ndarray) -> np.ndarray:
+    """Calculate WCAG contrast ratios between relative luminances element-wise."""
+    return (np.maximum(l1, l2) + 0.05) / (np.minimum(l1, l2) + 0.05)
+
+
+def linear_to_oklab(linear: np.ndarray) -> np.ndarray:
+    """Convert linear sRGB to OKLab (L, a, b)."""
+    return np.cbrt(linear @ _LINEAR_TO_LMS.T) @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_linear(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab (L, a, b) to linear sRGB (may be out of gamut)."""
+    return ((lab @ _OKLAB_TO_LMS.T) ** 3) @ _LMS_TO_LINEAR.T
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """Convert 8-bit sRGB values to OKLab."""
+    return linear_to_oklab(srgb_to_linear(rgb))
+
+
+def oklab_to_srgb(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab to 8-bit sRGB values, clipping out-of-gamut colors."""
+    return linear_to_srgb(oklab_to_linear(lab))
+
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab to OKLCH (L, chroma, hue in degrees)."""
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    """Convert OKLCH (L, chroma, hue in degrees) to OKLab."""
+    hue = np.radians(lch[..., 2])
+    return np.stack(
+        [lch[..., 0], lch[..., 1] * np.cos(hue), lch[..., 1] * np.sin(hue)],
+        axis=-1,
+    )
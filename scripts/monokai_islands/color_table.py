@@ -0,0 +1,176 @@
+"""Compact color storage shared by the theme generator and contrast validator.
+
+Colors are parsed once into packed 0xRRGGBBAA integers and addressed by name, so
+derivation and contrast checks work on integers instead of re-slicing hex strings.
+"""
+
+from array import array
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from typing import Self
+
+# sRGB channel value (0-255) -> linear light, per the WCAG 2.1 relative luminance formula
+SRGB_TO_LINEAR: tuple[float, ...] = tuple(
+    c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    for c in (i / 255.0 for i in range(256))
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_hex(hex_color: str) -> int:
+    """Parse a hex color into a packed 0xRRGGBBAA integer.
+
+    Accepts "#rrggbb" and "#rrggbbaa". Shorter values are zero-padded like editor
+    scheme values (e.g., "da19e" is "#0da19e"). Colors without alpha are opaque.
+    """
+    digits = hex_color.lstrip("#")
+    if len(digits) <= 6:
+        return int(digits, 16) << 8 | 0xFF
+    return int(digits[:8], 16)
+
+
+def format_hex(packed: int) -> str:
+    """Format a packed color as "#rrggbb", or "#rrggbbaa" when it is translucent."""
+    if packed & 0xFF == 0xFF:
+        return f"#{packed >> 8:06x}"
+    return f"#{packed:08x}"
+
+
+def unpack(packed: int) -> tuple[int, int, int, int]:
+    """Split a packed color into (red, green, blue, alpha) channels (0-255 range)."""
+    return packed >> 24, (packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF
+
+
+def pack(r: int, g: int, b: int, a: int = 0xFF) -> int:
+    """Combine (red, green, blue, alpha) channels into a packed color."""
+    return r << 24 | g << 16 | b << 8 | a
+
+
+@lru_cache(maxsize=4096)
+def relative_luminance(packed: int) -> float:
+    """Calculate WCAG 2.1 relative luminance of a packed color (alpha is ignored)."""
+    return (
+        0.2126 * SRGB_TO_LINEAR[packed >> 24]
+        + 0.7152 * SRGB_TO_LINEAR[(packed >> 16) & 0xFF]
+        + 0.0722 * SRGB_TO_LINEAR[(packed >> 8) & 0xFF]
+    )
+
+
+def contrast_ratio(l1: float, l2: float) -> float:
+    """Calculate the WCAG contrast ratio between two relative luminances."""
+    return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+
+
+def lighten(packed: int, factor: float) -> int:
+    """Move a color towards white by a factor (0.0 to 1.0). The result is opaque."""
+    r, g, b, _ = unpack(packed)
+    return pack(
+        int(r + (255 - r) * factor),
+        int(g + (255 - g) * factor),
+        int(b + (255 - b) * factor),
+    )
+
+
+def darken(packed: int, factor: float) -> int:
+    """Move a color towards black by a factor (0.0 to 1.0). The result is opaque."""
+    r, g, b, _ = unpack(packed)
+    return pack(int(r * (1 - factor)), int(g * (1 - factor)), int(b * (1 - factor)))
+
+
+def mix(first: int, second: int, weight: float) -> int:
+    """Blend two colors channel by channel (weight 0.0 is the first, 1.0 the second)."""
+    r1, g1, b1, a1 = unpack(first)
+    r2, g2, b2, a2 = unpack(second)
+    return pack(
+        round(r1 + (r2 - r1) * weight),
+        round(g1 + (g2 - g1) * weight),
+        round(b1 + (b2 - b1) * weight),
+        round(a1 + (a2 - a1) * weight),
+    )
+
+
+def with_alpha(packed: int, alpha: int) -> int:
+    """Replace the alpha channel of a packed color."""
+    return (packed & ~0xFF) | alpha
+
+
+def composite(top: int, bottom: int) -> int:
+    """Alpha-composite a packed color over another one ("source over", in sRGB space)."""
+    top_alpha = (top & 0xFF) / 255
+    if top_alpha == 1.0:
+        return top
+    bottom_alpha = (bottom & 0xFF) / 255 * (1 - top_alpha)
+    out_alpha = top_alpha + bottom_alpha
+    if out_alpha == 0.0:
+        return 0
+    channels = [
+        round((t * top_alpha + b * bottom_alpha) / out_alpha)
+        for t, b in zip(unpack(top)[:3], unpack(bottom)[:3], strict=True)
+    ]
+    return pack(*channels, round(out_alpha * 255))
+
+
+class ColorTable:
+    """Named colors stored as packed RGBA integers.
+
+    Names map to indexes into a flat array, so lookups, derivation and contrast checks
+    never touch hex strings after a color is added.
+    """
+
+    def __init__(self, colors: Mapping[str, str | int] | None = None) -> None:
+        self._packed = array("L")
+        self._names: list[str] = []
+        self._index: dict[str, int] = {}
+        for name, value in (colors or {}).items():
+            self[name] = value
+
+    @classmethod
+    def from_palette(cls, palette: Mapping[str, str]) -> Self:
+        """Build a table from a palette, skipping metadata keys (e.g., "_comment")."""
+        return cls({key: value for key, value in palette.items() if not key.startswith("_")})
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __getitem__(self, name: str) -> str:
+        return format_hex(self._packed[self._index[name]])
+
+    def __setitem__(self, name: str, value: str | int) -> None:
+        packed = parse_hex(value) if isinstance(value, str) else value
+        if name in self._index:
+            self._packed[self._index[name]] = packed
+        else:
+            self._index[name] = len(self._names)
+            self._names.append(name)
+            self._packed.append(packed)
+
+    def index(self, name: str) -> int:
+        """Get the array index of a named color."""
+        return self._index[name]
+
+    def packed(self, name: str) -> int:
+        """Get a named color as a packed 0xRRGGBBAA integer."""
+        return self._packed[self._index[name]]
+
+    def rgba(self, name: str) -> tuple[int, int, int, int]:
+        """Get a named color as (red, green, blue, alpha) channels."""
+        return unpack(self.packed(name))
+
+    def luminance(self, name: str) -> float:
+        """Get the (memoized) relative luminance of a named color."""
+        return relative_luminance(self.packed(name))
+
+    def contrast_ratio(self, fg: str, bg: str) -> float:
+        """Calculate the WCAG contrast ratio between two named colors."""
+        return contrast_ratio(self.luminance(fg), self.luminance(bg))
+
+    def to_dict(self) -> dict[str, str]:
+        """Export the table as a name -> hex color mapping."""
+        packed_colors = zip(self._names, self._packed, strict=True)
+        return {name: format_hex(packed) for name, packed in packed_colors}
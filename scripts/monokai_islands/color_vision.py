@@ -0,0 +1,125 @@
+"""Color vision deficiency simulation for palette checks (requires NumPy).
+
+Colors are simulated for protanopia, deuteranopia and tritanopia with the full-severity
+matrices of Machado, Oliveira and Fernandes (2009), which act on linear sRGB. All
+simulations are stacked with normal vision and applied to every color in one batched
+matrix multiply, so contrast and distinguishability checks run for all of them at once.
+Reference: https://www.inf.ufrgs.br/~oliveira/pubs_files/CVD_Simulation/CVD_Simulation.html
+"""
+
+from collections.abc import Mapping
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_space import (
+    contrast_ratio,
+    hex_to_rgb_array,
+    linear_to_oklab,
+    luminance,
+    srgb_to_linear,
+)
+
+# Linear sRGB transforms per simulated vision (normal vision first, as the reference)
+SIMULATIONS: dict[str, np.ndarray] = {
+    "normal vision": np.eye(3),
+    "protanopia": np.array(
+        [
+            [0.152286, 1.052583, -0.204868],
+            [0.114503, 0.786281, 0.099216],
+            [-0.003882, -0.048116, 1.051998],
+        ]
+    ),
+    "deuteranopia": np.array(
+        [
+            [0.367322, 0.860646, -0.227968],
+            [0.280085, 0.672501, 0.047413],
+            [-0.011820, 0.042940, 0.968881],
+        ]
+    ),
+    "tritanopia": np.array(
+        [
+            [1.255528, -0.076749, -0.178779],
+            [-0.078411, 0.930809, 0.147602],
+            [0.004733, 0.691367, 0.303900],
+        ]
+    ),
+}
+
+# Transposed once, so (n, 3) colors times (k, 3, 3) gives (k, n, 3) in one matmul
+_SIMULATION_STACK = np.stack([matrix.T for matrix in SIMULATIONS.values()])
+
+
+class DistinctPair(NamedTuple):
+    """Colors with different meanings that must stay apart under every simulation."""
+
+    first: str
+    second: str
+    min_distance: float
+    meaning: str
+
+
+# Accent pairs carrying different states (OKLab distance; about 2.5 JNDs)
+DEFAULT_DISTINCT_PAIRS: list[DistinctPair] = [
+    DistinctPair("accent1", "accent4", 0.05, "error vs added"),
+    DistinctPair("accent1", "accent3", 0.05, "error vs warning"),
+    DistinctPair("accent3", "accent4", 0.05, "warning vs added"),
+]
+
+
+def simulate(linear: np.ndarray) -> np.ndarray:
+    """Simulate linear sRGB colors (n, 3) under every vision in SIMULATIONS: (k, n, 3)."""
+    return np.clip(linear @ _SIMULATION_STACK, 0.0, 1.0)
+
+
+def validate_color_vision(
+    colors: Mapping[str, str],
+    contrast_pairs: list[tuple[str, str, float]],
+    distinct_pairs: list[DistinctPair] = DEFAULT_DISTINCT_PAIRS,
+) -> tuple[list[str], int]:
+    """Check contrast pairs and distinct pairs of a palette under every simulation.
+
+    Args:
+        colors: Palette colors (name -> hex)
+        contrast_pairs: (foreground, background, minimum ratio) name pairs
+        distinct_pairs: Color pairs that must stay apart in OKLab
+
+    Returns:
+        Issues found and the number of pairs evaluated
+    """
+    contrast_pairs = [p for p in contrast_pairs if p[0] in colors and p[1] in colors]
+    distinct_pairs = [p for p in distinct_pairs if p[0] in colors and p[1] in colors]
+    names = list(colors)
+    index = {name: i for i, name in enumerate(names)}
+
+    simulated = simulate(srgb_to_linear(hex_to_rgb_array([colors[name] for name in names])))
+    visions = list(SIMULATIONS)
+    issues = []
+
+    if contrast_pairs:
+        lum = luminance(simulated)
+        fg = [index[fg] for fg, _, _ in contrast_pairs]
+        bg = [index[bg] for _, bg, _ in contrast_pairs]
+        min_ratios = np.array([min_ratio for _, _, min_ratio in contrast_pairs])
+        ratios = contrast_ratio(lum[:, fg], lum[:, bg])
+        for k, p in zip(*np.nonzero(ratios < min_ratios), strict=True):
+            fg_key, bg_key, min_ratio = contrast_pairs[p]
+            issues.append(
+                f"  ❌ {fg_key} on {bg_key} ({visions[k]}): {ratios[k, p]:.2f}:1 "
+                f"(required: {min_ratio}:1)"
+            )
+
+    if distinct_pairs:
+        lab = linear_to_oklab(simulated)
+        first = [index[pair.first] for pair in distinct_pairs]
+        second = [index[pair.second] for pair in distinct_pairs]
+        min_distances = np.array([pair.min_distance for pair in distinct_pairs])
+        distances = np.linalg.norm(lab[:, first] - lab[:, second], axis=-1)
+        for k, p in zip(*np.nonzero(distances < min_distances), strict=True):
+            pair = distinct_pairs[p]
+            issues.append(
+                f"  ❌ {pair.first} vs {pair.second} ({visions[k]}, {pair.meaning}): "
+                f"OKLab distance {distances[k, p]:.3f} (required: {pair.min_distance})"
+            )
+
+    return issues, len(visions) * (len(contrast_pairs) + len(distinct_pairs))
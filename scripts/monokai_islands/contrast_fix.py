@@ -0,0 +1,296 @@
+"""Suggest the nearest compliant color for failing contrast pairs (requires NumPy).
+
+Each failing color is moved along OKLCH lightness only, keeping hue and chroma, until it
+meets its threshold against the other color of the pair. Translucent colors are measured as
+displayed, like the contrast matrix does: composited over every underlay, with the worst
+one deciding. All failures are solved together by one batched binary search, and the
+results are emitted as a unified diff against the palette JSON files (palette colors and
+literal derived colors).
+"""
+
+import difflib
+from pathlib import Path
+import re
+from typing import NamedTuple, Self
+
+import numpy as np
+
+from .color_space import (
+    contrast_ratio,
+    decode_srgb,
+    encode_srgb,
+    hex_to_rgb_array,
+    hex_to_rgba_array,
+    luminance,
+    oklab_to_linear,
+    oklab_to_srgb,
+    rgb_array_to_hex,
+    srgb_to_oklab,
+)
+
+# Bisection steps: 2^-24 of the lightness range is far below 8-bit quantization
+SEARCH_STEPS = 24
+
+# Extra steps of 1/256 of the range to recover ratios lost to 8-bit rounding
+ROUNDING_STEPS = 16
+
+
+class FixRequest(NamedTuple):
+    """Color that must reach a contrast ratio against another color.
+
+    "adjust" tells whether the color is the foreground ("fg") or the background ("bg")
+    of the pair; translucent colors are composited over each of "underlays" (opaque
+    surfaces) and the worst one counts.
+    """
+
+    name: str
+    color: str
+    other: str
+    min_ratio: float
+    source: Path | None
+    adjust: str = "fg"
+    underlays: tuple[str, ...] = ()
+
+
+class PairLayout(NamedTuple):
+    """Fixed side of every pair and how the adjusted colors are displayed (see FixRequest).
+
+    Requests without underlays are measured as opaque colors, like the contrast matrix.
+    """
+
+    alpha: np.ndarray  # (n,) alpha of each adjusted color, 0-1
+    other: np.ndarray  # (n, 3) RGB of the other color
+    other_alpha: np.ndarray  # (n,)
+    adjust_bg: np.ndarray  # (n,) whether the adjusted color is the background
+    underlays: np.ndarray  # (n, k, 3) underlay RGB, padded by repeating the last one
+
+    @classmethod
+    def build(
+        cls,
+        colors: list[str],
+        others: list[str],
+        adjust_bg: list[bool] | None = None,
+        underlays: list[tuple[str, ...]] | None = None,
+    ) -> Self:
+        """Lay out pairs of (possibly translucent) colors."""
+        n = len(colors)
+        rgba = hex_to_rgba_array(colors)
+        other = hex_to_rgba_array(others)
+        underlays = underlays or [()] * n
+        opaque = np.array([not surfaces for surfaces in underlays])
+        k = max(1, *(len(surfaces) for surfaces in underlays))
+        padded = [
+            [*surfaces, *[surfaces[-1]] * (k - len(surfaces))] if surfaces else ["#000000"] * k
+            for surfaces in underlays
+        ]
+        return cls(
+            np.where(opaque, 1.0, rgba[:, 3] / 255),
+            other[:, :3],
+            np.where(opaque, 1.0, other[:, 3] / 255),
+            np.zeros(n, dtype=bool) if adjust_bg is None else np.array(adjust_bg, dtype=bool),
+            hex_to_rgb_array([color for row in padded for color in row]).reshape(n, k, 3),
+        )
+
+    def tile(self, times: int) -> Self:
+        """Repeat every pair (e.g., once per search direction)."""
+        return type(self)(*(np.concatenate([field] * times) for field in self))
+
+    def ratios(self, rgb: np.ndarray, rounded: bool = True) -> np.ndarray:
+        """Worst contrast ratio over the underlays with each candidate as adjusted color.
+
+        Args:
+            rgb: (n, 3) candidate RGB values (fractional when not rounded)
+            rounded: Round blends to 8-bit pixels like color_space.composite; otherwise
+                measure continuously (for the bisection)
+        """
+
+        def blend(top: np.ndarray, alpha: np.ndarray, bottom: np.ndarray) -> np.ndarray:
+            mixed = top * alpha[:, None, None] + bottom * (1 - alpha[:, None, None])
+            return np.rint(mixed) if rounded else mixed
+
+        candidate, other = rgb[:, None, :], self.other[:, None, :]
+        # Adjusted foreground: drawn over the other color as displayed over each underlay
+        shown_bg = blend(other, self.other_alpha, self.underlays)
+        shown_fg = blend(candidate, self.alpha, shown_bg)
+        # Adjusted background: displayed over each underlay, the other color drawn over it
+        own_bg = blend(candidate, self.alpha, self.underlays)
+        own_fg = blend(other, self.other_alpha, own_bg)
+
+        adjust_bg = self.adjust_bg[:, None, None]
+        fg = np.where(adjust_bg, own_fg, shown_fg)
+        bg = np.where(adjust_bg, own_bg, shown_bg)
+        lum_fg, lum_bg = luminance(decode_srgb(fg)), luminance(decode_srgb(bg))
+        return contrast_ratio(lum_fg, lum_bg).min(axis=1)
+
+
+class ContrastFix(NamedTuple):
+    """Suggested replacement for a color, or None when no lightness meets every pair."""
+
+    name: str
+    source: Path | None
+    old: str
+    new: str | None
+
+
+def search_lightness(
+    colors: list[str],
+    others: list[str],
+    min_ratios: np.ndarray,
+    layout: PairLayout | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the smallest OKLCH lightness change that meets each contrast threshold.
+
+    Both directions (lighter and darker) are searched in the same batch and the
+    feasible one with the smaller change wins. Candidates are measured as displayed
+    (see PairLayout), so a translucent color only changes as much as its worst
+    underlay needs.
+
+    Args:
+        colors: Colors to adjust (the alpha of "#rrggbbaa" colors is kept)
+        others: Other color of each pair
+        min_ratios: Ratio each pair must reach
+        layout: How the pairs are displayed (default: colors as opaque foregrounds)
+
+    Returns:
+        (n, 3) array of fixed RGB values and a mask of pairs that could be fixed
+    """
+    lab = srgb_to_oklab(hex_to_rgb_array(colors))
+    n = len(colors)
+    layout = (layout or PairLayout.build(colors, others)).tile(2)
+
+    # Rows 0..n-1 search towards white, rows n..2n-1 towards black
+    start = np.concatenate([lab[:, 0], lab[:, 0]])
+    end = np.concatenate([np.ones(n), np.zeros(n)])
+    ab = np.concatenate([lab[:, 1:], lab[:, 1:]])
+    required = np.concatenate([min_ratios, min_ratios])
+
+    def candidates(t: np.ndarray) -> np.ndarray:
+        lightness = start + (end - start) * t
+        return np.column_stack([lightness, ab])
+
+    def ratios(rgb: np.ndarray) -> np.ndarray:
+        return layout.ratios(rgb)
+
+    def continuous_ratios(t: np.ndarray) -> np.ndarray:
+        return layout.ratios(encode_srgb(oklab_to_linear(candidates(t))), rounded=False)
+
+    # Along each path the pair fails until some point and passes from there on (towards
+    # the other color contrast drops before it rises), so bisect on the path fraction
+    feasible = continuous_ratios(np.ones(2 * n)) >= required
+    lo, hi = np.zeros(2 * n), np.ones(2 * n)
+    for _ in range(SEARCH_STEPS):
+        mid = (lo + hi) / 2
+        passing = continuous_ratios(mid) >= required
+        hi = np.where(passing, mid, hi)
+        lo = np.where(passing, lo, mid)
+
+    # Quantize to 8-bit and nudge further where rounding lost the threshold
+    rgb = oklab_to_srgb(candidates(hi))
+    for _ in range(ROUNDING_STEPS):
+        failing = feasible & (ratios(rgb) < required)
+        if not failing.any():
+            break
+        hi = np.where(failing, np.minimum(hi + 1 / 256, 1.0), hi)
+        rgb = oklab_to_srgb(candidates(hi))
+    feasible &= ratios(rgb) >= required
+
+    # Pick the feasible direction with the smaller lightness change
+    change = np.where(feasible, np.abs(end - start) * hi, np.inf)
+    darker = change[n:] < change[:n]
+    fixed = np.where(darker[:, None], rgb[n:], rgb[:n])
+    return fixed, feasible[:n] | feasible[n:]
+
+
+def suggest_fixes(requests: list[FixRequest]) -> list[ContrastFix]:
+    """Suggest one replacement per color that satisfies all of its failing pairs.
+
+    A color failing several pairs gets candidates from each of them, and the smallest
+    candidate change that passes every pair is chosen.
+    """
+    if not requests:
+        return []
+
+    colors = [r.color for r in requests]
+    others = [r.other for r in requests]
+    layout = PairLayout.build(
+        colors, others, [r.adjust == "bg" for r in requests], [r.underlays for r in requests]
+    )
+    fixed, ok = search_lightness(colors, others, np.array([r.min_ratio for r in requests]), layout)
+    candidates = rgb_array_to_hex(fixed)
+
+    groups: dict[tuple[Path | None, str], list[int]] = {}
+    for i, request in enumerate(requests):
+        groups.setdefault((request.source, request.name), []).append(i)
+
+    fixes = []
+    for (source, name), indexes in groups.items():
+        old = requests[indexes[0]].color
+        options = sorted(
+            {candidates[i] for i in indexes if ok[i]},
+            key=lambda color: lightness_distance(old, color),
+        )
+        new = next(
+            (color for color in options if passes_all(color, layout, requests, indexes)), None
+        )
+        if new and len(old.lstrip("#")) == 8:
+            new += old[-2:]  # Keep the original alpha
+        fixes.append(ContrastFix(name, source, old, new))
+    return fixes
+
+
+def lightness_distance(color1: str, color2: str) -> float:
+    """Calculate the OKLab lightness difference between two colors."""
+    lab = srgb_to_oklab(hex_to_rgb_array([color1, color2]))
+    return float(abs(lab[0, 0] - lab[1, 0]))
+
+
+def passes_all(
+    color: str, layout: PairLayout, requests: list[FixRequest], indexes: list[int]
+) -> bool:
+    """Check whether a replacement color meets every pair it takes part in (as displayed)."""
+    pairs = PairLayout(*(field[indexes] for field in layout))
+    rgb = np.repeat(hex_to_rgb_array([color]), len(indexes), axis=0)
+    required = np.array([requests[i].min_ratio for i in indexes])
+    return bool((pairs.ratios(rgb) >= required).all())
+
+
+def replace_color(text: str, name: str, old: str, new: str) -> str | None:
+    """Replace a literal color definition in a palette JSON file."""
+    pattern = rf'("{re.escape(name)}"\s*:\s*")({re.escape(old)})(")'
+    patched, count = re.subn(pattern, rf"\g<1>{new}\g<3>", text, flags=re.IGNORECASE)
+    return patched if count else None
+
+
+def build_patch(fixes: list[ContrastFix], project_root: Path) -> tuple[str, list[ContrastFix]]:
+    """Build a unified diff applying the fixes to their source files.
+
+    Returns:
+        The patch and the fixes whose color is not defined literally in its source
+    """
+    by_source: dict[Path, list[ContrastFix]] = {}
+    for fix in fixes:
+        if fix.new and fix.source:
+            by_source.setdefault(fix.source, []).append(fix)
+
+    patch = []
+    unpatched = [fix for fix in fixes if fix.new and not fix.source]
+    for source, source_fixes in sorted(by_source.items()):
+        original = source.read_text()
+        patched = original
+        for fix in source_fixes:
+            result = replace_color(patched, fix.name, fix.old, fix.new)
+            if result is None:
+                unpatched.append(fix)
+            else:
+                patched = result
+
+        relative = source.relative_to(project_root).as_posix()
+        patch.extend(
+            difflib.unified_diff(
+                original.splitlines(keepends=True),
+                patched.splitlines(keepends=True),
+                f"a/{relative}",
+                f"b/{relative}",
+            )
+        )
+    return "".join(patch), unpatched
@@ -0,0 +1,216 @@
+"""Vectorized WCAG contrast matrix for generated themes.
+
+Requires NumPy. Every color of a theme's "colors" block is linearized at once and the
+full foreground x background contrast matrix is computed in a single pass, so role
+pairs can be audited by lookup instead of one calculation per pair.
+"""
+
+from dataclasses import dataclass
+from fnmatch import fnmatch
+import json
+from pathlib import Path
+from typing import NamedTuple, Self
+
+import numpy as np
+
+from .color_space import (
+    composite,
+    contrast_ratio,
+    hex_to_rgba_array,
+    luminance,
+    srgb_to_linear,
+)
+
+
+class RolePair(NamedTuple):
+    """Foreground/background name globs that must reach a minimum contrast ratio.
+
+    "adjust" names the side a contrast fix should change ("fg" or "bg").
+    """
+
+    fg: str
+    bg: str
+    min_ratio: float
+    adjust: str = "fg"
+
+
+class Violation(NamedTuple):
+    """Named color pair below its role pair's minimum ratio.
+
+    "underlay" is the surface a translucent color was composited over for the worst ratio.
+    """
+
+    fg: str
+    bg: str
+    ratio: float
+    min_ratio: float
+    adjust: str
+    underlay: str | None = None
+
+
+# Opaque surfaces translucent colors are composited over before measuring contrast
+DEFAULT_UNDERLAYS = ["background", "dark1", "popup_bg"]
+
+
+# Default role pairs audited on every theme
+DEFAULT_ROLE_PAIRS: list[RolePair] = [
+    RolePair("text", "background", 4.5),
+    RolePair("text", "dark1", 4.5),
+    RolePair("text", "input_bg", 4.5, "bg"),
+    RolePair("text", "popup_bg", 4.5, "bg"),
+    RolePair("text", "selection_bg", 4.5, "bg"),
+    RolePair("text", "tab_active_bg", 4.5, "bg"),
+    RolePair("text", "diff_*", 4.5, "bg"),
+    RolePair("text", "file_*", 4.5, "bg"),
+    # Translucent overlays (composited over each underlay)
+    RolePair("text", "*_bg_90", 4.5, "bg"),
+    RolePair("text", "dimmed5_80", 4.5, "bg"),
+    RolePair("text", "accent3_40", 4.5, "bg"),
+    RolePair("tree_selection_fg", "list_selection_alpha", 4.5, "bg"),
+    RolePair("accent?", "background", 3.0),
+    RolePair("accent?", "popup_bg", 3.0),
+    RolePair("dimmed3", "background", 4.5),
+    RolePair("dimmed2", "dark1", 3.0),
+    RolePair("dark1", "accent5", 4.5),  # Default button text on cyan
+]
+
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """Calculate WCAG 2.1 relative luminance for an (..., 3) RGB array."""
+    return luminance(srgb_to_linear(rgb))
+
+
+def contrast_ratios(fg_luminance: np.ndarray, bg_luminance: np.ndarray) -> np.ndarray:
+    """Calculate the WCAG contrast ratio of every foreground against every background."""
+    return contrast_ratio(fg_luminance[:, None], bg_luminance[None, :])
+
+
+@dataclass
+class ContrastMatrix:
+    """Contrast ratios between every pair of named colors.
+
+    Translucent colors are composited over each underlay (a translucent foreground over
+    its composited background) and the worst ratio is kept, with the underlay index that
+    produced it in "worst_underlay" (-1 when no translucent color is involved).
+    """
+
+    names: list[str]
+    colors: list[str]
+    ratios: np.ndarray
+    underlays: list[str]
+    worst_underlay: np.ndarray
+    pair_count: int
+
+    @classmethod
+    def from_colors(
+        cls,
+        colors: dict[str, str],
+        underlays: list[str] | None = None,
+    ) -> Self:
+        """Build the matrix from a name -> hex color mapping."""
+        names = list(colors)
+        values = [colors[name] for name in names]
+        rgba = hex_to_rgba_array(values)
+        rgb, alpha = rgba[:, :3], rgba[:, 3] / 255
+
+        lum = relative_luminance(rgb)
+        ratios = contrast_ratios(lum, lum)
+        worst = np.full(ratios.shape, -1, dtype=np.intp)
+        pair_count = ratios.size
+
+        underlay_names = [u for u in DEFAULT_UNDERLAYS if u in colors]
+        if underlays is not None:
+            underlay_names = [u for u in underlays if u in colors]
+        translucent = np.flatnonzero(alpha < 1)
+
+        if translucent.size and underlay_names:
+            under = rgb[[names.index(u) for u in underlay_names]]
+            # Every color as a background, composited over every underlay: (n, k, 3)
+            bg_eff = composite(rgb[:, None, :], alpha[:, None], under[None, :, :])
+            bg_lum = relative_luminance(bg_eff)
+
+            # Opaque foregrounds on translucent backgrounds: (n, t, k)
+            cols = contrast_ratio(lum[:, None, None], bg_lum[None, translucent, :])
+            ratios[:, translucent] = cols.min(axis=2)
+            worst[:, translucent] = cols.argmin(axis=2)
+
+            # Translucent foregrounds drawn over every composited background: (t, n, k)
+            fg_eff = composite(
+                rgb[translucent, None, None, :],
+                alpha[translucent, None, None],
+                bg_eff[None, :, :, :],
+            )
+            rows = contrast_ratio(relative_luminance(fg_eff), bg_lum[None, :, :])
+            ratios[translucent, :] = rows.min(axis=2)
+            worst[translucent, :] = np.where(alpha[None, :] < 1, rows.argmin(axis=2), -1)
+            pair_count += cols.size + rows.size
+
+        return cls(names, values, ratios, underlay_names, worst, pair_count)
+
+    def indexes(self, pattern: str) -> np.ndarray:
+        """Get indexes of colors whose name matches a glob pattern."""
+        return np.array([i for i, name in enumerate(self.names) if fnmatch(name, pattern)], int)
+
+    def violations(self, role_pairs: list[RolePair]) -> list[Violation]:
+        """Find role pairs below their minimum contrast ratio."""
+        found = []
+        for fg_pattern, bg_pattern, min_ratio, adjust in role_pairs:
+            fg_idx = self.indexes(fg_pattern)
+            bg_idx = self.indexes(bg_pattern)
+            if not fg_idx.size or not bg_idx.size:
+                continue
+
+            sub = self.ratios[np.ix_(fg_idx, bg_idx)]
+            failing = (sub < min_ratio) & (fg_idx[:, None] != bg_idx[None, :])
+            for i, j in zip(*np.nonzero(failing), strict=True):
+                fg, bg = self.names[fg_idx[i]], self.names[bg_idx[j]]
+                worst = self.worst_underlay[fg_idx[i], bg_idx[j]]
+                underlay = self.underlays[worst] if worst >= 0 else None
+                found.append(Violation(fg, bg, float(sub[i, j]), min_ratio, adjust, underlay))
+        return found
+
+
+def load_role_pairs(path: Path) -> list[RolePair]:
+    """Load role pairs from a JSON file of {"fg", "bg", "min", "adjust"} objects."""
+    with path.open() as f:
+        return [
+            RolePair(pair["fg"], pair["bg"], float(pair["min"]), pair.get("adjust", "fg"))
+            for pair in json.load(f)
+        ]
+
+
+def load_theme_colors(theme_path: Path) -> dict[str, str]:
+    """Load the "colors" block of a generated theme JSON file."""
+    with theme_path.open() as f:
+        return json.load(f)["colors"]
+
+
+def validate_theme_matrix(
+    theme_path: Path,
+    role_pairs: list[RolePair],
+    underlays: list[str] | None = None,
+) -> tuple[list[str], int]:
+    """Validate role pairs of a generated theme using the full contrast matrix.
+
+    Returns:
+        Issues found and the number of contrast pairs evaluated
+    """
+    return validate_colors(load_theme_colors(theme_path), role_pairs, underlays)
+
+
+def validate_colors(
+    colors: dict[str, str],
+    role_pairs: list[RolePair],
+    underlays: list[str] | None = None,
+) -> tuple[list[str], int]:
+    """Validate role pairs of a theme's "colors" block using the full contrast matrix.
+
+    Returns:
+        Issues found and the number of contrast pairs evaluated
+    """
+    matrix = ContrastMatrix.from_colors(colors, underlays)
+    issues = []
+    for fg, bg, ratio, min_ratio, _, underlay in matrix.violations(role_pairs):
+        over = f" over {underlay}" if underlay else ""
+        issues.append(f"  ❌ {fg} on {bg}{over}: {ratio:.2f}:1 (required: {min_ratio}:1)")
+    return issues, matrix.pair_count
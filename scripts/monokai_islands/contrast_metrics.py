@@ -0,0 +1,151 @@
+"""Pluggable contrast metrics evaluated in one batched pass (requires NumPy).
+
+Every metric describes its luminance as a per-channel sRGB lookup table and channel
+weights, plus a contrast function of foreground and background luminance. The tables of
+all metrics are stacked, so a batch of colors is converted to the luminance of every
+metric with one lookup and one weighted sum; adding a metric adds a row, not a pass.
+
+Metrics:
+    WCAG 2.1: https://www.w3.org/WAI/WCAG21/Understanding/contrast-minimum.html
+    APCA (0.0.98G-4g): https://github.com/Myndex/apca-w3
+"""
+
+from collections.abc import Callable, Mapping
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_space import LINEARIZE, LUMINANCE_WEIGHTS, contrast_ratio, hex_to_rgb_array
+
+
+class ContrastMetric(NamedTuple):
+    """Contrast metric with its thresholds for each WCAG 2.1 requirement.
+
+    "contrast" may return signed values (APCA Lc is negative for light text on dark
+    backgrounds); checks compare the magnitude against the threshold.
+    """
+
+    name: str
+    linearize: np.ndarray
+    weights: np.ndarray
+    contrast: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    thresholds: Mapping[float, float]
+    display: str
+
+
+class MetricResult(NamedTuple):
+    """Values of every metric for one foreground/background pair."""
+
+    fg: str
+    bg: str
+    requirement: float
+    values: tuple[float, ...]
+    failing: tuple[bool, ...]
+
+
+# APCA constants (0.0.98G-4g)
+APCA_BLACK_THRESHOLD = 0.022
+APCA_BLACK_CLAMP = 1.414
+APCA_SCALE = 1.14
+APCA_OFFSET = 0.027
+APCA_LOW_CLIP = 0.1
+
+
+def apca_contrast(text: np.ndarray, background: np.ndarray) -> np.ndarray:
+    """Calculate APCA lightness contrast (Lc) from APCA screen luminance.
+
+    Positive for dark text on light backgrounds, negative for light text on dark ones.
+    """
+    text, background = (
+        y + np.maximum(APCA_BLACK_THRESHOLD - y, 0.0) ** APCA_BLACK_CLAMP
+        for y in (text, background)
+    )
+    normal = (background**0.56 - text**0.57) * APCA_SCALE
+    reverse = (background**0.65 - text**0.62) * APCA_SCALE
+    sapc = np.where(background > text, normal, reverse)
+    lc = np.where(sapc > 0, sapc - APCA_OFFSET, sapc + APCA_OFFSET) * 100
+    return np.where(np.abs(sapc) < APCA_LOW_CLIP, 0.0, lc)
+
+
+WCAG = ContrastMetric(
+    name="WCAG 2.1",
+    linearize=LINEARIZE,
+    weights=LUMINANCE_WEIGHTS,
+    contrast=contrast_ratio,
+    thresholds={7.0: 7.0, 4.5: 4.5, 3.0: 3.0, 2.0: 2.0},
+    display="{:.2f}:1",
+)
+
+# APCA uses a plain 2.4 power curve and its own weights. Thresholds follow the APCA
+# readability levels: body text Lc 75, other content text Lc 60, large text Lc 45 and
+# spot-readable text (placeholders, comments) Lc 30.
+APCA = ContrastMetric(
+    name="APCA",
+    linearize=(np.arange(256) / 255) ** 2.4,
+    weights=np.array([0.2126729, 0.7151522, 0.0721750]),
+    contrast=apca_contrast,
+    thresholds={7.0: 75.0, 4.5: 60.0, 3.0: 45.0, 2.0: 30.0},
+    display="Lc {:.1f}",
+)
+
+# Registered metrics by command line name (add a ContrastMetric here to report it)
+METRICS: dict[str, ContrastMetric] = {"wcag": WCAG, "apca": APCA}
+
+
+def luminances(rgb: np.ndarray, metrics: list[ContrastMetric]) -> np.ndarray:
+    """Convert (n, 3) 8-bit sRGB colors to every metric's luminance at once: (m, n)."""
+    tables = np.stack([metric.linearize for metric in metrics])
+    weights = np.stack([metric.weights for metric in metrics])
+    return np.einsum("mnc,mc->mn", tables[:, rgb], weights)
+
+
+def evaluate(
+    pairs: list[tuple[str, str, float]],
+    colors: Mapping[str, str],
+    metrics: list[ContrastMetric],
+) -> list[MetricResult]:
+    """Evaluate (foreground, background, WCAG requirement) pairs with every metric.
+
+    Args:
+        pairs: Color name pairs with the WCAG 2.1 ratio they must reach
+        colors: Colors (name -> hex) the pair names resolve against
+        metrics: Metrics to evaluate, sharing one luminance pass
+    """
+    if not pairs:
+        return []
+
+    # Each distinct color is converted once, however many pairs use it
+    values = sorted({colors[key] for fg, bg, _ in pairs for key in (fg, bg)})
+    index = {value: i for i, value in enumerate(values)}
+    lum = luminances(hex_to_rgb_array(values), metrics)
+
+    fg = [index[colors[fg]] for fg, _, _ in pairs]
+    bg = [index[colors[bg]] for _, bg, _ in pairs]
+    results = np.stack(
+        [metric.contrast(lum[m, fg], lum[m, bg]) for m, metric in enumerate(metrics)]
+    )
+    thresholds = np.array(
+        [[metric.thresholds[requirement] for _, _, requirement in pairs] for metric in metrics]
+    )
+    failing = np.abs(results) < thresholds
+
+    return [
+        MetricResult(
+            fg_key,
+            bg_key,
+            requirement,
+            tuple(results[:, p].tolist()),
+            tuple(failing[:, p].tolist()),
+        )
+        for p, (fg_key, bg_key, requirement) in enumerate(pairs)
+    ]
+
+
+def describe(result: MetricResult, metrics: list[ContrastMetric]) -> str:
+    """Describe a pair with every metric (e.g., "WCAG 2.1 4.66:1, APCA Lc -36.9 < 60")."""
+    parts = []
+    for metric, value, failing in zip(metrics, result.values, result.failing, strict=True):
+        threshold = metric.thresholds[result.requirement]
+        verdict = f" < {threshold:g}" if failing else ""
+        parts.append(f"{metric.name} {metric.display.format(value)}{verdict}")
+    return ", ".join(parts)
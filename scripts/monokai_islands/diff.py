@@ -0,0 +1,213 @@
+"""Compare generated themes and editor schemes by key path instead of by line.
+
+Compares two files, two output directories (matching files by relative path), or the
+working tree against a git revision (--rev). Identical files are skipped without being
+parsed, and changed ones are diffed with subtree hashes (see theme_tree.py), so only
+changed dotted key paths are reported, with their values before and after.
+"""
+
+import argparse
+from pathlib import Path
+import subprocess
+import sys
+import time
+
+from .paths import PROJECT_ROOT, RESOURCES_DIR
+from .theme_tree import Change, diff_documents
+
+# Generated files compared when walking directories
+GENERATED_PATTERNS = ("*.theme.json", "*.xml")
+
+# Directories compared by default with --rev
+DEFAULT_PATHS = (RESOURCES_DIR / "themes", RESOURCES_DIR / "editor-schemes")
+
+
+def collect_files(root: Path) -> dict[str, Path]:
+    """Find generated files under a directory, by path relative to it (or a single file)."""
+    if root.is_file():
+        return {root.name: root}
+    return {
+        path.relative_to(root).as_posix(): path
+        for pattern in GENERATED_PATTERNS
+        for path in sorted(root.rglob(pattern))
+    }
+
+
+def read_revision(
+    revision: str, paths: list[str], repository: Path = PROJECT_ROOT
+) -> dict[str, bytes | None]:
+    """Read files at a git revision with one "git cat-file --batch" process.
+
+    Returns:
+        File contents by path (None for files missing at the revision)
+    """
+    request = "".join(f"{revision}:{path}\n" for path in paths).encode()
+    output = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input=request,
+        capture_output=True,
+        check=True,
+        cwd=repository,
+    ).stdout
+
+    contents: dict[str, bytes | None] = {}
+    offset = 0
+    for path in paths:
+        end = output.index(b"\n", offset)
+        header = output[offset:end].split()
+        offset = end + 1
+        if header[-1] == b"missing":
+            contents[path] = None
+            continue
+        size = int(header[2])
+        contents[path] = output[offset : offset + size]
+        offset += size + 1
+    return contents
+
+
+def compare_directories(old: Path, new: Path) -> dict[str, tuple[bytes | None, bytes | None]]:
+    """Pair generated files of two directories (or two files) by relative path."""
+    old_files = collect_files(old)
+    new_files = collect_files(new)
+    if old.is_file() and new.is_file():
+        return {new.name: (old.read_bytes(), new.read_bytes())}
+    return {
+        name: (
+            old_files[name].read_bytes() if name in old_files else None,
+            new_files[name].read_bytes() if name in new_files else None,
+        )
+        for name in sorted(old_files.keys() | new_files.keys())
+    }
+
+
+def compare_revision(
+    revision: str, roots: list[Path], repository: Path = PROJECT_ROOT
+) -> dict[str, tuple[bytes | None, bytes | None]]:
+    """Pair generated files of the working tree with their version at a git revision.
+
+    Git runs in the repository (the project checkout by default), wherever the command
+    is started from.
+
+    Raises:
+        ValueError: When a root is outside the repository
+        subprocess.CalledProcessError: When git fails (e.g., an unknown revision)
+        FileNotFoundError: When git is not installed
+    """
+    top = Path(
+        subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=repository,
+        ).stdout.strip()
+    )
+    outside = [str(root) for root in roots if not root.resolve().is_relative_to(top)]
+    if outside:
+        msg = f"not inside the repository {top}: {', '.join(outside)}"
+        raise ValueError(msg)
+    roots = [root.resolve().relative_to(top) for root in roots]
+    files = {}
+    for root in roots:
+        for path in collect_files(top / root).values():
+            files[path.relative_to(top).as_posix()] = path
+
+    # Files deleted from the working tree are still listed at the revision
+    listed = subprocess.run(
+        ["git", "ls-tree", "-r", "--name-only", revision, "--", *map(Path.as_posix, roots)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=top,
+    ).stdout.split()
+    names = sorted(
+        files.keys()
+        | {name for name in listed if any(Path(name).match(p) for p in GENERATED_PATTERNS)}
+    )
+
+    before = read_revision(revision, names, top)
+    return {
+        name: (before[name], files[name].read_bytes() if name in files else None) for name in names
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="monokai-islands diff", description=__doc__)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        help="OLD and NEW files or directories, or with --rev, working tree paths "
+        "(default: the generated themes and editor schemes)",
+    )
+    parser.add_argument(
+        "--rev",
+        metavar="REVISION",
+        help="Compare the working tree against a git revision (e.g., HEAD)",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Changed keys printed per file before the rest is summarized (default: all)",
+    )
+    return parser.parse_args(argv)
+
+
+def print_changes(name: str, changes: list[Change], limit: int) -> None:
+    """Print a file's changed keys, up to the limit (0 prints all)."""
+    print(f"~ {name}: {len(changes)} key(s) changed")
+    shown = changes[:limit] if limit else changes
+    for change in shown:
+        print(f"  {change.describe()}")
+    if len(shown) < len(changes):
+        print(f"    … and {len(changes) - len(shown)} more")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Compare generated files and print changed key paths."""
+    args = parse_args(argv)
+    if args.rev is None and len(args.paths) != 2:
+        print("❌ Pass OLD and NEW paths, or --rev REVISION")
+        sys.exit(2)
+
+    start = time.perf_counter()
+    if args.rev is not None:
+        try:
+            pairs = compare_revision(args.rev, args.paths or list(DEFAULT_PATHS))
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode() if isinstance(e.stderr, bytes) else e.stderr or ""
+            print(f"❌ git {e.cmd[1]} failed: {stderr.strip() or f'exit {e.returncode}'}")
+            sys.exit(2)
+        except FileNotFoundError:
+            print("❌ --rev requires git")
+            sys.exit(2)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+    else:
+        missing = [str(path) for path in args.paths if not path.exists()]
+        if missing:
+            print(f"❌ No such file or directory: {', '.join(missing)}")
+            sys.exit(2)
+        pairs = compare_directories(*args.paths)
+
+    changed_files = changed_keys = 0
+    for name, (old, new) in pairs.items():
+        if old is None or new is None:
+            print(f"{'+' if old is None else '-'} {name}")
+            changed_files += 1
+            continue
+        changes = diff_documents(name, old, new)
+        if changes:
+            print_changes(name, changes, args.limit)
+            changed_files += 1
+            changed_keys += len(changes)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(
+        f"\n✓ Compared {len(pairs)} file(s) in {elapsed:.0f}ms: {changed_files} changed, "
+        f"{changed_keys} key(s) changed"
+    )
+    sys.exit(1 if changed_files else 0)
@@ -0,0 +1,151 @@
+"""Generate editor color scheme XML from a palette.
+
+The scheme layout lives in templates/editor-scheme.json, which maps every scheme option
+to either a color name (e.g., "accent4", resolved against the theme colors of each
+variant) or a literal value. The XML is streamed out line by line.
+"""
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+import json
+from pathlib import Path
+import re
+
+from .paths import TEMPLATES_DIR
+
+TEMPLATE_PATH = TEMPLATES_DIR / "editor-scheme.json"
+
+# Attribute value options holding colors (others, like FONT_TYPE, are literals)
+COLOR_OPTIONS = frozenset({"FOREGROUND", "BACKGROUND", "EFFECT_COLOR", "ERROR_STRIPE_COLOR"})
+
+# Literal scheme colors: "rrggbb" or "rrggbbaa" (no "#", either case)
+HEX_LITERAL = re.compile(r"[0-9a-fA-F]{6,8}")
+
+
+@lru_cache(maxsize=4)
+def load_scheme_template(template_path: Path = TEMPLATE_PATH) -> dict:
+    """Load (once per process) the editor scheme template."""
+    with template_path.open() as f:
+        return json.load(f)
+
+
+def escape(value: str) -> str:
+    """Escape "&", "<" and ">" in XML text.
+
+    Replaces xml.sax.saxutils.escape, whose import chain (urllib, http.client) cost more
+    than the rest of a cached generator run.
+    """
+    return value.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def quote(value: str) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(value).replace('"', "&quot;")
+
+
+def resolve_color(value: str, colors: Mapping[str, str], key: str) -> str:
+    """Resolve a color name to a scheme color value (hex without "#"), keeping hex literals.
+
+    Args:
+        value: Color name, hex literal, or "" for no color
+        colors: Theme colors (name -> hex)
+        key: Scheme option the value belongs to (e.g., "TEXT.FOREGROUND"), for errors
+
+    Raises:
+        ValueError: When the value is neither a theme color nor a hex literal
+    """
+    if value in colors:
+        return colors[value].lstrip("#")
+    if not value or HEX_LITERAL.fullmatch(value):
+        return value
+    msg = f"Unknown color for editor scheme option {key}: {value!r}"
+    raise ValueError(msg)
+
+
+def resolve_hex(value: str, colors: Mapping[str, str], key: str) -> str:
+    """Resolve a color name or scheme literal to "#rrggbb" ("" stays "", meaning no color)."""
+    color = resolve_color(value, colors, key)
+    return "#" + color.lower() if color else ""
+
+
+def iter_comment(key: str, indent: str) -> Iterator[str]:
+    """Yield an XML comment for a "// ..." template key (comments need no escaping)."""
+    yield f"{indent}<!-- {key.removeprefix('//').strip()} -->\n"
+
+
+def iter_scheme_xml(template: dict, colors: Mapping[str, str], name: str) -> Iterator[str]:
+    """Stream editor scheme XML lines.
+
+    Args:
+        template: Scheme template (see templates/editor-scheme.json)
+        colors: Theme colors (name -> hex) that color names resolve against
+        name: Scheme name (e.g., "Monokai Islands Dark")
+    """
+    yield f'<scheme name="{quote(name)}" version="{quote(template["version"])}">\n'
+
+    yield "  <metaInfo>\n"
+    for prop, value in {**template["metaInfo"], "originalScheme": name}.items():
+        yield f'    <property name="{quote(prop)}">{escape(value)}</property>\n'
+    yield "  </metaInfo>\n"
+
+    yield "  <colors>\n"
+    for option, value in template["colors"].items():
+        if option.startswith("//"):
+            yield from iter_comment(option, "    ")
+            continue
+        color = quote(resolve_color(value, colors, option))
+        yield f'    <option name="{quote(option)}" value="{color}" />\n'
+    yield "  </colors>\n"
+
+    yield "  <attributes>\n"
+    for attribute, values in template["attributes"].items():
+        if attribute.startswith("//"):
+            yield from iter_comment(attribute, "    ")
+            continue
+        if "baseAttributes" in values:
+            base = quote(values["baseAttributes"])
+            yield f'    <option name="{quote(attribute)}" baseAttributes="{base}" />\n'
+            continue
+
+        yield f'    <option name="{quote(attribute)}">\n'
+        if not values:
+            yield "      <value />\n"
+        else:
+            yield "      <value>\n"
+            for option, value in values.items():
+                if option in COLOR_OPTIONS:
+                    text = resolve_color(value, colors, f"{attribute}.{option}")
+                else:
+                    text = value
+                yield f'        <option name="{quote(option)}" value="{quote(text)}" />\n'
+            yield "      </value>\n"
+        yield "    </option>\n"
+    yield "  </attributes>\n"
+
+    yield "</scheme>\n"
+
+
+def resolve_scheme(template: dict, colors: Mapping[str, str]) -> dict[str, dict]:
+    """Resolve the scheme's colors and attributes to "#rrggbb" values for other formats.
+
+    Returns:
+        {"colors": {option: hex}, "attributes": {attribute: {option: value}}}, where
+        attribute options other than COLOR_OPTIONS keep their literal values and
+        empty colors (e.g., SELECTION_FOREGROUND) stay "" for "no color"
+    """
+    resolved: dict[str, dict] = {"colors": {}, "attributes": {}}
+    for option, value in template["colors"].items():
+        if not option.startswith("//"):
+            resolved["colors"][option] = resolve_hex(value, colors, option)
+    for attribute, values in template["attributes"].items():
+        if attribute.startswith("//") or "baseAttributes" in (values or {}):
+            continue
+        resolved["attributes"][attribute] = {
+            option: (
+                resolve_hex(value, colors, f"{attribute}.{option}")
+                if option in COLOR_OPTIONS
+                else value
+            )
+            for option, value in (values or {}).items()
+        }
+    return resolved
@@ -0,0 +1,226 @@
+"""Output formats rendered from one resolved color model per theme target.
+
+The generator resolves a palette and variant once into a ColorModel: the theme colors
+(palette plus derived colors) and, on first use, the editor scheme resolved against
+them. Every emitter in EMITTERS serializes that shared model into one format, so adding
+a format costs only its serialization.
+
+The VS Code layout lives in templates/vscode-theme.json: workbench colors name a theme
+color or an editor scheme value, and token colors follow editor scheme attributes.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import json
+from pathlib import Path
+from typing import NamedTuple
+
+from .editor_scheme import iter_scheme_xml, load_scheme_template, resolve_scheme
+from .markdown_css import load_css_template, render_markdown_css
+from .paths import TEMPLATES_DIR
+
+VSCODE_TEMPLATE_PATH = TEMPLATES_DIR / "vscode-theme.json"
+
+# Editor scheme FONT_TYPE values as VS Code font styles
+FONT_STYLES = {"1": "bold", "2": "italic", "3": "bold italic"}
+
+# Windows Terminal color scheme keys -> JetBrains terminal attributes (ANSI 16 colors)
+TERMINAL_ANSI_COLORS = {
+    "black": "BLOCK_TERMINAL_BLACK",
+    "red": "BLOCK_TERMINAL_RED",
+    "green": "BLOCK_TERMINAL_GREEN",
+    "yellow": "BLOCK_TERMINAL_YELLOW",
+    "blue": "BLOCK_TERMINAL_BLUE",
+    "purple": "BLOCK_TERMINAL_MAGENTA",
+    "cyan": "BLOCK_TERMINAL_CYAN",
+    "white": "BLOCK_TERMINAL_WHITE",
+    "brightBlack": "BLOCK_TERMINAL_BLACK_BRIGHT",
+    "brightRed": "BLOCK_TERMINAL_RED_BRIGHT",
+    "brightGreen": "BLOCK_TERMINAL_GREEN_BRIGHT",
+    "brightYellow": "BLOCK_TERMINAL_YELLOW_BRIGHT",
+    "brightBlue": "BLOCK_TERMINAL_BLUE_BRIGHT",
+    "brightPurple": "BLOCK_TERMINAL_MAGENTA_BRIGHT",
+    "brightCyan": "BLOCK_TERMINAL_CYAN_BRIGHT",
+    "brightWhite": "BLOCK_TERMINAL_WHITE_BRIGHT",
+}
+
+# Terminal profile keys -> editor scheme colors (defaults, cursor, selection, blocks)
+TERMINAL_SCHEME_COLORS = {
+    "background": "BLOCK_TERMINAL_DEFAULT_BACKGROUND",
+    "foreground": "BLOCK_TERMINAL_DEFAULT_FOREGROUND",
+    "cursorColor": "CARET_COLOR",
+    "selectionBackground": "SELECTION_BACKGROUND",
+    "blockBackgroundStart": "BLOCK_TERMINAL_BLOCK_BACKGROUND_START",
+    "blockBackgroundEnd": "BLOCK_TERMINAL_BLOCK_BACKGROUND_END",
+}
+
+# Prefix of the CSS custom properties (e.g., "--monokai-accent1")
+CSS_VARIABLE_PREFIX = "--monokai-"
+
+
+@lru_cache(maxsize=4)
+def load_vscode_template(template_path: Path = VSCODE_TEMPLATE_PATH) -> dict:
+    """Load (once per process) the VS Code theme template."""
+    with template_path.open() as f:
+        return json.load(f)
+
+
+@dataclass(frozen=True)
+class ColorModel:
+    """Colors of one palette and variant, resolved once and shared by every emitter."""
+
+    variant: str
+    theme: dict  # Generated JetBrains theme ("colors" holds every theme color)
+
+    @property
+    def colors(self) -> dict[str, str]:
+        """Theme colors (name -> hex)."""
+        return self.theme["colors"]
+
+    @cached_property
+    def scheme(self) -> dict[str, dict]:
+        """Editor scheme colors and attributes resolved to hex (see resolve_scheme)."""
+        return resolve_scheme(load_scheme_template(), self.colors)
+
+    def resolve(self, key: str) -> str:
+        """Resolve a theme color name or a "scheme.colors.X" / "scheme.attributes.X.Y" key."""
+        if key in self.colors:
+            return self.colors[key]
+        if key.startswith("scheme.colors."):
+            value = self.scheme["colors"].get(key.removeprefix("scheme.colors."))
+        elif key.startswith("scheme.attributes."):
+            attribute, _, option = key.removeprefix("scheme.attributes.").rpartition(".")
+            value = self.scheme["attributes"].get(attribute, {}).get(option)
+        else:
+            value = None
+        if value is None:
+            msg = f"Unknown color: {key}"
+            raise ValueError(msg)
+        if not value:
+            msg = f"Editor scheme color is unset: {key}"
+            raise ValueError(msg)
+        return value
+
+
+class Emitter(NamedTuple):
+    """Output format written for every target."""
+
+    directory: str  # Under the plugin resources, or the export directory for exports
+    file_name: str  # "{variant}" is replaced with the target's variant
+    label: str  # Printed with generated files (e.g., "editor scheme")
+    render: Callable[[ColorModel], str]
+    export: bool  # Written on request (--export) instead of into the plugin
+
+    def path(self, root: Path, variant: str) -> Path:
+        """Get the output path of a variant."""
+        return root / self.directory / self.file_name.format(variant=variant)
+
+
+def emit_theme_json(model: ColorModel) -> str:
+    """Serialize the JetBrains theme."""
+    return json.dumps(model.theme, indent=2) + "\n"
+
+
+def emit_editor_scheme(model: ColorModel) -> str:
+    """Render the JetBrains editor color scheme XML."""
+    return "".join(iter_scheme_xml(load_scheme_template(), model.colors, model.theme["name"]))
+
+
+def emit_markdown_css(model: ColorModel) -> str:
+    """Render the Markdown preview stylesheet."""
+    return render_markdown_css(load_css_template(), model.colors)
+
+
+def emit_vscode_theme(model: ColorModel) -> str:
+    """Render a VS Code color theme (see templates/vscode-theme.json)."""
+    template = load_vscode_template()
+    token_colors = []
+    for token in template["tokenColors"]:
+        values = model.scheme["attributes"].get(token["attribute"], {})
+        if not values.get("FOREGROUND"):
+            msg = f"Editor scheme attribute without a foreground: {token['attribute']}"
+            raise ValueError(msg)
+        settings = {"foreground": values["FOREGROUND"]}
+        if values.get("FONT_TYPE") in FONT_STYLES:
+            settings["fontStyle"] = FONT_STYLES[values["FONT_TYPE"]]
+        token_colors.append({"name": token["name"], "scope": token["scope"], "settings": settings})
+
+    theme = {
+        "$schema": "vscode://schemas/color-theme",
+        "name": model.theme["name"],
+        "type": "dark" if model.theme["dark"] else "light",
+        "colors": {key: model.resolve(name) for key, name in template["colors"].items()},
+        "tokenColors": token_colors,
+    }
+    return json.dumps(theme, indent=2) + "\n"
+
+
+def emit_terminal_profile(model: ColorModel) -> str:
+    """Render a terminal color profile with the JetBrains terminal's colors.
+
+    Keys follow Windows Terminal color schemes; "blockBackgroundStart" and
+    "blockBackgroundEnd" carry the command block gradient of the JetBrains terminal.
+    """
+    profile = {"name": model.theme["name"]}
+    profile.update(
+        (key, model.resolve(f"scheme.colors.{option}"))
+        for key, option in TERMINAL_SCHEME_COLORS.items()
+    )
+    profile.update(
+        (key, model.resolve(f"scheme.attributes.{attribute}.FOREGROUND"))
+        for key, attribute in TERMINAL_ANSI_COLORS.items()
+    )
+    return json.dumps(profile, indent=2) + "\n"
+
+
+def emit_css_variables(model: ColorModel) -> str:
+    """Render every theme color as a CSS custom property on :root."""
+    lines = [f"/* {model.theme['name']} colors (generated, do not edit) */", ":root {"]
+    lines += [
+        f"  {CSS_VARIABLE_PREFIX}{name.replace('_', '-')}: {value};"
+        for name, value in model.colors.items()
+    ]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+# Registered output formats by name (add an Emitter here to write a new format)
+EMITTERS: dict[str, Emitter] = {
+    "theme": Emitter(
+        "themes", "monokai-islands-{variant}.theme.json", "theme", emit_theme_json, False
+    ),
+    "scheme": Emitter(
+        "editor-schemes",
+        "monokai-islands-{variant}.xml",
+        "editor scheme",
+        emit_editor_scheme,
+        False,
+    ),
+    "stylesheet": Emitter(
+        "styles",
+        "markdown-preview-{variant}.css",
+        "Markdown stylesheet",
+        emit_markdown_css,
+        False,
+    ),
+    "vscode": Emitter(
+        "vscode",
+        "monokai-islands-{variant}-color-theme.json",
+        "VS Code theme",
+        emit_vscode_theme,
+        True,
+    ),
+    "terminal": Emitter(
+        "terminal",
+        "monokai-islands-{variant}.terminal.json",
+        "terminal profile",
+        emit_terminal_profile,
+        True,
+    ),
+    "css-vars": Emitter(
+        "css", "monokai-islands-{variant}.css", "CSS variables", emit_css_variables, True
+    ),
+}
+
+EXPORT_FORMATS = tuple(name for name, emitter in EMITTERS.items() if emitter.export)
@@ -0,0 +1,1227 @@
+"""Generate theme JSON files from palette definitions."""
+
+import argparse
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import json
+import os
+from pathlib import Path
+import sys
+import time
+from typing import NamedTuple
+
+from .cli import add_palette_arguments
+from .color_graph import ColorGraph
+from .color_table import ColorTable, format_hex, lighten, parse_hex
+from .editor_scheme import load_scheme_template
+from .emitters import EMITTERS, EXPORT_FORMATS, ColorModel, load_vscode_template
+from .markdown_css import load_css_template
+from .paths import (
+    BUILD_DIR,
+    DEFAULT_PALETTE_PATH,
+    PACKAGE_DIR,
+    PROJECT_ROOT,
+    RESOURCES_DIR,
+    TEMPLATES_DIR,
+    base_derived_colors,
+    discover_palettes,
+    resolve_palettes,
+)
+from .profiling import PROFILER
+
+# Bump when the manifest layout changes to invalidate old caches
+CACHE_MANIFEST_VERSION = 2
+
+# Generator sources hashed into cache keys
+GENERATOR_SOURCES = (
+    Path(__file__),
+    PACKAGE_DIR / "cli.py",
+    PACKAGE_DIR / "paths.py",
+    PACKAGE_DIR / "profiling.py",
+    PACKAGE_DIR / "color_table.py",
+    PACKAGE_DIR / "color_graph.py",
+    PACKAGE_DIR / "editor_scheme.py",
+    PACKAGE_DIR / "emitters.py",
+    PACKAGE_DIR / "markdown_css.py",
+    TEMPLATES_DIR / "editor-scheme.json",
+    TEMPLATES_DIR / "markdown-preview.css",
+    TEMPLATES_DIR / "vscode-theme.json",
+)
+
+# Palette whose "_derived" block applies to palettes without one
+BASE_PALETTE_PATH = DEFAULT_PALETTE_PATH
+
+# How often --watch polls palettes and generator sources for changes (seconds)
+WATCH_INTERVAL = 0.1
+
+# Changed keys printed per theme by --watch before the rest is summarized
+WATCH_DIFF_LIMIT = 20
+
+# Stored preview baselines (--preview) and where rendered previews and diffs go
+PREVIEW_BASELINE_DIR = PROJECT_ROOT / "previews"
+PREVIEW_OUTPUT_DIR = BUILD_DIR / "previews"
+
+# Where --export writes other editors' formats (one subdirectory per format)
+EXPORT_DIR = BUILD_DIR / "exports"
+
+
+def generate_theme_json(palette: dict, variant: str, graph: ColorGraph | None = None) -> dict:
+    """Generate theme JSON structure from palette.
+
+    Args:
+        palette: Color palette dictionary ("_dark" overrides the variant-based dark flag)
+        variant: Theme variant (e.g., "dark", "dark-light", "dark-darker")
+        graph: Derived colors of the palette, when kept between runs (e.g., by --watch)
+    """
+    is_dark = palette.get("_dark", "dark" in variant)
+    parent = "Islands Dark" if is_dark else "Islands Light"
+    # Each variant has its own editor scheme to sync background colors
+    editor_scheme = f"/editor-schemes/monokai-islands-{variant}.xml"
+
+    # Base palette colors (skip metadata keys), then the palette's derived colors
+    colors = ColorTable.from_palette(palette)
+    if graph is None:
+        graph = ColorGraph.from_palette(palette, base_derived_colors())
+    for name, packed in graph.to_dict().items():
+        colors[name] = packed
+
+    # Palette-independent structure (UI mappings, tab insets) is compiled once
+    template = compile_theme_template()
+
+    return {
+        "name": theme_name(palette, variant),
+        "dark": is_dark,
+        "author": "Bart Smykla",
+        "editorScheme": editor_scheme,
+        "parentTheme": parent,
+        "colors": colors.to_dict(),
+        "ui": copy_nested(template.ui),
+        "icons": {
+            "ColorPalette": {key: palette[name] for key, name in template.icon_slots.items()},
+        },
+    }
+
+
+# UI color mappings (reference color names from the colors block)
+UI_COLORS: dict[str, str | int] = {
+    # Main window backgrounds - use background as base, dark1 for chrome
+    "*.background": "background",
+    "MainWindow.background": "dark1",
+    # Title pane (window header with project tabs on macOS)
+    "TitlePane.background": "dark1",
+    "TitlePane.inactiveBackground": "dark2",
+    "TitlePane.Button.hoverBackground": "input_hover",
+    "TitlePane.infoForeground": "text",
+    "TitlePane.inactiveInfoForeground": "dimmed2",
+    # Project window tabs (macOS merged windows)
+    "MainWindow.Tab.background": "dark1",
+    "MainWindow.Tab.selectedBackground": "project_tab_active",
+    "MainWindow.Tab.selectedInactiveBackground": "project_tab_hover",
+    "MainWindow.Tab.hoverBackground": "project_tab_hover",
+    "MainWindow.Tab.foreground": "project_tab_inactive_text",
+    "MainWindow.Tab.selectedForeground": "text",
+    "MainWindow.Tab.hoverForeground": "dimmed1",
+    "MainWindow.Tab.borderColor": "transparent",
+    "MainWindow.Tab.separatorColor": "dimmed5",
+    # Main toolbar dropdowns (project tabs, run configs, branches)
+    "MainToolbar.Dropdown.background": "dark1",
+    "MainToolbar.Dropdown.hoverBackground": "input_hover",
+    "MainToolbar.Dropdown.pressedBackground": "selection_bg",
+    "MainToolbar.Dropdown.transparentHoverBackground": "dimmed5_80",
+    # Main toolbar icons
+    "MainToolbar.Icon.background": "dark1",
+    "MainToolbar.Icon.hoverBackground": "input_hover",
+    "MainToolbar.Icon.pressedBackground": "selection_bg",
+    # Default tabs (fallback for all tabs)
+    "DefaultTabs.background": "background",
+    "DefaultTabs.hoverBackground": "dimmed5_80",
+    "DefaultTabs.underlineColor": "tab_active_border",
+    "DefaultTabs.inactiveUnderlineColor": "dimmed4",
+    "DefaultTabs.underlineHeight": 2,
+    "DefaultTabs.underlinedTabBackground": "tab_active_bg",
+    "DefaultTabs.underlinedTabForeground": "text",
+    "Panel.background": "background",
+    "SidePanel.background": "background",
+    # Tool windows - editor background (lighter layer)
+    "ToolWindow.background": "background",
+    "ToolWindow.Header.background": "background",
+    "ToolWindow.Header.inactiveBackground": "background",
+    # Tool window stripe buttons (sidebar icons like Project, Commit)
+    "ToolWindow.Button.selectedBackground": "toolwindow_button_selected",
+    "ToolWindow.Button.selectedForeground": "text",
+    "ToolWindow.Button.hoverBackground": "input_hover",
+    # Tool window header tabs
+    "ToolWindow.HeaderTab.selectedBackground": "tab_active_bg",
+    "ToolWindow.HeaderTab.selectedInactiveBackground": "selection_inactive",
+    "ToolWindow.HeaderTab.hoverBackground": "dimmed5_80",
+    "ToolWindow.HeaderTab.hoverInactiveBackground": "dimmed5_80",
+    "ToolWindow.HeaderTab.underlineColor": "tab_active_border",
+    "ToolWindow.HeaderTab.inactiveUnderlineColor": "dimmed4",
+    "ToolWindow.HeaderTab.underlineHeight": 2,
+    # Editor tabs - Islands theme properties
+    "EditorTabs.background": "background",
+    "EditorTabs.underlineColor": "tab_active_border",
+    "EditorTabs.underlinedBorderColor": "tab_active_border",
+    "EditorTabs.inactiveUnderlinedTabBorderColor": "dimmed4",
+    "EditorTabs.underlinedTabBackground": "tab_active_bg",
+    "EditorTabs.inactiveUnderlinedTabBackground": "background",
+    "EditorTabs.selectedBackground": "tab_active_bg",
+    "EditorTabs.selectedForeground": "text",
+    "EditorTabs.borderColor": "tab_active_border",
+    "EditorTabs.hoverBackground": "dimmed5",
+    "EditorTabs.inactiveBackground": "background",
+    "EditorTabs.inactiveForeground": "dimmed2",
+    # Islands styling
+    "Island.borderColor": "background",
+    "Island.arc": 20,
+    "Island.borderWidth": 5,
+    # Transparent borders for clean Islands look
+    "StatusBar.borderColor": "transparent",
+    "ToolWindow.Stripe.borderColor": "transparent",
+    "MainToolbar.borderColor": "transparent",
+    # Selection and focus - warm purple tints (for file trees, settings)
+    "Tree.foreground": "text",  # Normal files use default text color (white)
+    "Tree.selectionBackground": "list_selection_alpha",
+    "Tree.selectionForeground": "tree_selection_fg",  # 80% opacity white
+    "Tree.selectionInactiveBackground": "selection_inactive",
+    "List.foreground": "text",
+    "List.selectionBackground": "list_selection_alpha",
+    "List.selectionForeground": "tree_selection_fg",
+    "List.selectionInactiveBackground": "selection_inactive",
+    # Project tree and file lists (with subtle transparency)
+    "Tree.background": "background",
+    "Tree.hash": "dimmed5",  # Indent guide lines color (very subtle)
+    "ProjectViewTree.selectionBackground": "list_selection",
+    "ProjectViewTree.selectionInactiveBackground": "selection_inactive",
+    "FileChooser.selectionInactiveBackground": "input_bg",
+    # File colors - warm tinted versions
+    "FileColor.Yellow": "file_yellow",
+    "FileColor.Green": "file_green",
+    "FileColor.Gray": "file_gray",
+    "FileColor.Blue": "file_blue",
+    "FileColor.Orange": "file_orange",
+    "FileColor.Rose": "file_rose",
+    "FileColor.Violet": "file_violet",
+    # Default button (primary action) - teal/cyan with dark text
+    "Button.default.startBackground": "accent5",
+    "Button.default.endBackground": "accent5",
+    "Button.default.foreground": "dark1",
+    "Button.default.startBorderColor": "accent5",
+    "Button.default.endBorderColor": "accent5",
+    "Button.default.focusedBorderColor": "button_default_focus",
+    "Button.default.focusColor": "button_default_focus",
+    "Component.focusedBorderColor": "input_focus",
+    "Component.focusColor": "input_focus",
+    "Component.focusWidth": 2,
+    # Code completion
+    "CompletionPopup.selectionBackground": "dimmed5",
+    "CompletionPopup.selectionInactiveBackground": "dimmed5_60",
+    # Search
+    "SearchEverywhere.Tab.selectedBackground": "dimmed5",
+    "SearchMatch.startBackground": "accent3_40",
+    "SearchMatch.endBackground": "accent3_40",
+    # Version control
+    "VersionControl.GitLog.localBranchIconColor": "accent4",
+    "VersionControl.GitLog.remoteBranchIconColor": "accent5",
+    "VersionControl.GitLog.tagIconColor": "accent2",
+    # Notifications and balloons (with transparency)
+    "Notification.background": "notification_bg_90",
+    "Notification.borderColor": "notification_border_90",
+    "Notification.borderInsets": "3,3,1,3",  # top,left,bottom,right
+    "Notification.arc": 12,  # Rounded corners
+    "Notification.errorBackground": "error_bg_90",
+    "Notification.errorBorderColor": "accent1",
+    "Notification.warningBackground": "warning_bg_90",
+    "Notification.warningBorderColor": "accent3",
+    "Notification.ToolWindow.background": "notification_bg_90",
+    "Notification.ToolWindow.borderColor": "notification_border_90",
+    "Notification.ToolWindow.errorBackground": "error_bg_90",
+    "Notification.ToolWindow.errorBorderColor": "accent1",
+    "Notification.ToolWindow.warningBackground": "warning_bg_90",
+    "Notification.ToolWindow.warningBorderColor": "accent3",
+    "Notification.linkForeground": "accent5",
+    "Notification.ToolWindow.linkForeground": "accent5",
+    # Balloon popups (with transparency)
+    "Balloon.background": "notification_bg_90",
+    "Balloon.borderColor": "notification_border_90",
+    "Balloon.error.background": "error_bg_90",
+    "Balloon.error.borderColor": "accent1",
+    "Balloon.warning.background": "warning_bg_90",
+    "Balloon.warning.borderColor": "accent3",
+    # Editor notifications (banners)
+    "EditorNotification.background": "input_bg",
+    "EditorNotification.borderColor": "input_border",
+    "Banner.background": "input_bg",
+    "Banner.borderColor": "input_border",
+    # Error/validation tooltips and hints
+    "ValidationTooltip.errorBackground": "error_bg",
+    "ValidationTooltip.errorBorderColor": "accent1",
+    "ValidationTooltip.warningBackground": "warning_bg",
+    "ValidationTooltip.warningBorderColor": "accent3",
+    "ToolTip.background": "input_bg",
+    "ToolTip.borderColor": "input_border",
+    "ToolTip.foreground": "text",
+    "HintPane.background": "input_bg",
+    "Hint.background": "input_bg",
+    "Hint.borderColor": "input_border",
+    "Hint.foreground": "text",
+    "Editor.ToolTip.background": "input_bg",
+    "Editor.ToolTip.borderColor": "input_border",
+    "EditorPane.background": "input_bg",
+    "EditorPane.selectionBackground": "selection_bg",
+    "EditorPane.selectionForeground": "text",
+    "InformationHint.background": "input_bg",
+    "InformationHint.borderColor": "input_border",
+    "ErrorHint.background": "error_bg",
+    "ErrorHint.borderColor": "accent1",
+    "QuestionHint.background": "input_bg",
+    "SpeedSearchPopup.background": "input_bg",
+    "SpeedSearchPopup.borderColor": "input_border",
+    "SpeedSearchPopup.foreground": "text",
+    "GotItTooltip.background": "input_bg",
+    "GotItTooltip.borderColor": "input_border",
+    # Popups and dropdown menus
+    "Popup.borderColor": "popup_border",
+    "Popup.innerBorderColor": "popup_border",
+    "Popup.paintBorder": True,
+    "Popup.background": "popup_bg",
+    "Popup.Header.activeBackground": "selection_bg",
+    "Popup.Header.inactiveBackground": "background",
+    "PopupMenu.background": "popup_bg",
+    "PopupMenu.selectionBackground": "input_hover",
+    "PopupMenu.selectionForeground": "text",
+    "Menu.background": "popup_bg",
+    "Menu.borderColor": "popup_border",
+    "Menu.selectionBackground": "selection_bg",
+    "Menu.selectionForeground": "text",
+    "MenuItem.background": "popup_bg",
+    "MenuItem.selectionBackground": "selection_bg",
+    "MenuItem.selectionForeground": "text",
+    # List hover for dropdowns
+    "List.background": "background",
+    "List.hoverBackground": "input_hover",
+    "List.hoverForeground": "text",
+    # Progress bar
+    "ProgressBar.progressColor": "accent5",
+    "ProgressBar.indeterminateStartColor": "accent5",
+    "ProgressBar.indeterminateEndColor": "accent6",
+    # Links
+    "Link.foreground": "accent5",
+    "Link.activeForeground": "accent5",
+    "Link.hoverForeground": "accent5",
+    "Link.pressedForeground": "accent5",
+    "Link.visitedForeground": "accent6",
+    # Dialogs and Settings - use regular background
+    "Dialog.background": "background",
+    "DialogWrapper.southPanelBackground": "background",
+    "Table.background": "background",
+    "Table.gridColor": "dimmed5",
+    "Table.selectionBackground": "dimmed5_80",
+    "Table.selectionForeground": "text",
+    # Form controls and inputs - warm purple tints
+    "CheckBox.background": "background",
+    "CheckBox.borderColor1": "input_border",
+    "CheckBox.borderColor2": "input_border",
+    "CheckBox.focusedBorderColor": "input_focus",
+    "CheckBox.disabledBackground": "background",
+    "CheckBox.disabledBorderColor1": "input_bg",
+    "CheckBox.disabledBorderColor2": "input_bg",
+    "ComboBox.background": "input_bg",
+    "ComboBox.selectionBackground": "input_hover",
+    "ComboBox.ArrowButton.background": "input_arrow",
+    # ComboBox popup list
+    "ComboBoxPopup.background": "popup_bg",
+    "ComboBoxPopup.foreground": "text",
+    "ComboBox.ArrowButton.nonEditableBackground": "input_arrow",
+    "ComboBox.ArrowButton.iconColor": "dimmed1",
+    "ComboBox.nonEditableBackground": "input_bg",
+    "ComboBox.borderColor": "input_border",
+    "ComboBox.ArrowButton.disabledBackground": "input_disabled",
+    "ComboBox.ArrowButton.disabledIconColor": "dimmed4",
+    "ComboBox.disabledForeground": "dimmed4",
+    "TextField.background": "background",
+    "TextField.borderColor": "input_border",
+    "TextField.selectionBackground": "selection_bg",
+    "TextField.selectionForeground": "text",
+    "TextField.disabledForeground": "dimmed4",
+    "TextArea.background": "input_bg",
+    "TextArea.borderColor": "input_border",
+    "TextArea.selectionBackground": "selection_bg",
+    "TextArea.selectionForeground": "text",
+    "TextArea.disabledBackground": "input_disabled",
+    "SearchField.background": "input_bg",
+    "SearchField.borderColor": "input_border",
+    "SearchEverywhere.SearchField.background": "input_bg",
+    "SearchEverywhere.SearchField.borderColor": "input_border",
+    "Spinner.background": "input_bg",
+    "Spinner.borderColor": "input_border",
+    "Spinner.disabledBackground": "input_disabled",
+    "FormattedTextField.background": "input_bg",
+    "FormattedTextField.borderColor": "input_border",
+    "FormattedTextField.disabledBackground": "input_disabled",
+    "PasswordField.background": "input_bg",
+    "PasswordField.borderColor": "input_border",
+    # Component-level styling
+    "Component.disabledBorderColor": "input_bg",
+    "Component.borderColor": "input_border",
+    # Text field with a browse button
+    "TextFieldWithBrowseButton.borderColor": "input_border",
+    "TextFieldWithBrowseButton.background": "input_bg",
+    # Buttons - match settings background, warm purple border
+    "Button.startBackground": "background",
+    "Button.endBackground": "background",
+    "Button.background": "background",
+    "Button.foreground": "text",
+    "Button.startBorderColor": "input_border",
+    "Button.endBorderColor": "input_border",
+    "Button.borderColor": "input_border",
+    "Button.shadowColor": "transparent",
+    "Button.shadowWidth": 0,
+    "Button.arc": 8,
+    "Button.margin": "4,14,4,14",
+    # Action buttons (icon buttons like help ?)
+    "ActionButton.background": "background",
+    "ActionButton.hoverBackground": "input_hover",
+    "ActionButton.hoverBorderColor": "input_border",
+    "ActionButton.pressedBackground": "selection_bg",
+    "ActionButton.pressedBorderColor": "input_border",
+    # Help button specifically
+    "HelpButton.background": "background",
+    "HelpButton.borderColor": "input_border",
+    # Counter badges (notification counts on tabs, trees, etc.)
+    # Note: Counter shape is hardcoded as oval - only colors can be customized
+    "Counter.background": "accent1",
+    "Counter.foreground": "text",
+    # Toggle buttons and segmented buttons (for plugin manager, tabs, etc.)
+    "ToggleButton.on.background": "tab_active_bg",
+    "ToggleButton.on.foreground": "text",
+    "ToggleButton.on.borderColor": "tab_active_border",
+    "ToggleButton.off.background": "background",
+    "ToggleButton.off.foreground": "dimmed1",
+    "ToggleButton.off.borderColor": "input_border",
+    # Segmented buttons (Plugin tabs, etc.) - ensure consistent padding
+    "SegmentedButton.selected.startBackground": "tab_active_bg",
+    "SegmentedButton.selected.endBackground": "tab_active_bg",
+    "SegmentedButton.selected.foreground": "text",
+    "SegmentedButton.selected.startBorderColor": "tab_active_border",
+    "SegmentedButton.selected.endBorderColor": "tab_active_border",
+    "SegmentedButton.unselected.startBackground": "background",
+    "SegmentedButton.unselected.endBackground": "background",
+    "SegmentedButton.unselected.foreground": "dimmed1",
+    "SegmentedButton.unselected.startBorderColor": "input_border",
+    "SegmentedButton.unselected.endBorderColor": "input_border",
+    # New-style SegmentedButton properties for consistency
+    "SegmentedButton.selectedButtonColor": "tab_active_bg",
+    "SegmentedButton.focusedSelectedButtonColor": "tab_active_bg",
+    "SegmentedButton.selectedStartBorderColor": "tab_active_border",
+    "SegmentedButton.selectedEndBorderColor": "tab_active_border",
+    # Settings/Preferences panel
+    "Settings.background": "background",
+    "OptionPane.background": "background",
+    "TabbedPane.background": "background",
+    "TabbedPane.contentAreaColor": "background",
+    "ScrollPane.background": "background",
+    "Viewport.background": "background",
+}
+
+# Tab insets (added after flattening to preserve their dot notation).
+# Negative top/bottom for taller tabs, positive left/right for spacing
+EDITOR_TAB_INSETS = {
+    "tabInsets": "-10,6,-10,6",
+    "tabInsets.compact": "-5,4,-5,4",
+    "verticalTabInsets": "-3,8,-3,8",
+    "verticalTabInsets.compact": "-2,6,-2,6",
+}
+
+# Icon color palette for SVG action icons: maps default icon colors (and named icon
+# keys) to the palette colors that replace them
+ICON_COLOR_PALETTE = {
+    # Remap default blue/cyan to dark for high contrast on cyan buttons
+    "#3592C4": "dark1",  # Default blue -> dark (for cyan button icons)
+    "#40B6E0": "dark1",  # Default cyan -> dark (for cyan button icons)
+    # Standard action icon colors -> Monokai palette
+    "#59A869": "accent4",  # Green -> Monokai green
+    "#DB5860": "accent1",  # Red -> Monokai pink/red
+    "#F4AF3D": "accent3",  # Yellow -> Monokai yellow
+    # Named keys for action icons (more targeted than hex colors)
+    # Fix: checkmark icon on cyan Apply button needs dark color for contrast
+    "Actions.Grey": "dark1",  # Gray action icons -> dark
+    "Actions.GreyInline": "dimmed2",  # Inline gray -> medium gray
+    "Actions.GreyInline.Dark": "dimmed1",  # Inline gray dark variant
+    # Checkbox colors - dark checkmark for light colored buttons (new UI)
+    "Checkbox.Foreground.Selected": "dark1",  # Dark checkmark on light buttons
+    "Checkbox.Background.Selected": "accent5",  # Cyan background (matches button)
+    "Checkbox.Border.Selected": "accent5",  # Cyan border (matches button)
+}
+
+
+@dataclass(frozen=True)
+class ThemeTemplate:
+    """Palette-independent part of a theme, compiled once per process.
+
+    "ui" is the cached skeleton; themes get their own copy (see copy_nested) so
+    editing one theme never leaks into the next. "icon_slots" maps icon color
+    keys to the palette colors that fill them.
+    """
+
+    ui: dict
+    icon_slots: dict[str, str]
+
+
+@lru_cache(maxsize=1)
+def compile_theme_template() -> ThemeTemplate:
+    """Build the nested UI skeleton and icon slots once."""
+    ui = flatten_to_nested(UI_COLORS)
+    ui["EditorTabs"].update(EDITOR_TAB_INSETS)
+    return ThemeTemplate(ui, dict(ICON_COLOR_PALETTE))
+
+
+def copy_nested(nested: dict) -> dict:
+    """Copy a nested dictionary, including every sub-dictionary."""
+    return {
+        key: copy_nested(value) if isinstance(value, dict) else value
+        for key, value in nested.items()
+    }
+
+
+def flatten_to_nested(flat_dict: dict) -> dict:
+    """Convert flat dot-notation keys to nested dictionary structure.
+
+    Args:
+        flat_dict: Dictionary with dot-notation keys
+            (e.g., "ToolWindow.Header.background")
+
+    Returns:
+        Nested dictionary structure matching JetBrains theme format
+    """
+    nested = {}
+
+    for key, value in flat_dict.items():
+        parts = key.split(".")
+        current = nested
+
+        # Navigate/create nested structure for all but the last part
+        for part in parts[:-1]:
+            if part not in current:
+                current[part] = {}
+            elif not isinstance(current[part], dict):
+                # Handle case where a key is both a value and a parent
+                # e.g., "Button.background" and "Button.default.background"
+                current[part] = {"": current[part]}
+            current = current[part]
+
+        # Set the final value
+        final_key = parts[-1]
+        if final_key in current and isinstance(current[final_key], dict):
+            # Value already exists as a dict, store value at empty key
+            current[final_key][""] = value
+        else:
+            current[final_key] = value
+
+    return nested
+
+
+def calculate_lighter_color(hex_color: str, factor: float) -> str:
+    """Calculate a lighter version of a hex color.
+
+    Args:
+        hex_color: Hex color string (e.g., "#3d3548")
+        factor: Lightness factor (0.0 to 1.0, where 0.15 = 15% lighter)
+
+    Returns:
+        Hex color string of the lighter color
+    """
+    return format_hex(lighten(parse_hex(hex_color), factor))
+
+
+def theme_name(palette: dict, variant: str) -> str:
+    """Get the display name of a variant (e.g., "dark-darker" -> "Monokai Islands Dark Darker").
+
+    A palette may label its variants under the "_names" key (variant -> label, as written
+    by synthesize-variants.py); other variants are capitalized word by word.
+    """
+    label = palette.get("_names", {}).get(variant)
+    if label is None:
+        label = " ".join(word.capitalize() for word in variant.split("-"))
+    return f"Monokai Islands {label}"
+
+
+def palette_variants(palette: dict, palette_path: Path) -> list[str]:
+    """Get the theme variants to generate for a palette.
+
+    A palette may list its variants under the "_variants" key. Otherwise, the
+    variant is derived from the file name (e.g., "monokai-dark.json" -> "dark").
+    """
+    variants = palette.get("_variants")
+    if variants:
+        return list(variants)
+    return [palette_path.stem.removeprefix("monokai-")]
+
+
+@dataclass(frozen=True)
+class ThemeTarget:
+    """Single palette x variant combination to generate."""
+
+    palette_path: Path
+    variant: str
+    output_path: Path
+    scheme_path: Path
+    stylesheet_path: Path
+    exports: tuple[tuple[str, Path], ...] = ()  # (format, path) of requested exports
+
+    @property
+    def emitted(self) -> tuple[tuple[str, Path], ...]:
+        """(format, path) of every file generated for this target (see EMITTERS)."""
+        plugin = (
+            ("theme", self.output_path),
+            ("scheme", self.scheme_path),
+            ("stylesheet", self.stylesheet_path),
+        )
+        return plugin + self.exports
+
+    @property
+    def outputs(self) -> tuple[Path, ...]:
+        """All files generated for this target."""
+        return tuple(path for _, path in self.emitted)
+
+
+def build_targets(
+    palette_paths: list[Path],
+    resources_dir: Path,
+    variants: list[str] | None = None,
+    exports: list[str] | None = None,
+    export_dir: Path = EXPORT_DIR,
+) -> tuple[list[ThemeTarget], dict[Path, dict]]:
+    """Expand palettes into the palette x variant matrix.
+
+    Args:
+        palette_paths: Palette files to generate themes from
+        resources_dir: Plugin resources directory (themes/, editor-schemes/ and styles/)
+        variants: Variants to generate for every palette (overrides palette defaults)
+        exports: Export formats to write for every target as well (see EXPORT_FORMATS)
+        export_dir: Directory the export formats are written to
+
+    Returns:
+        Generation targets and loaded palettes keyed by their path
+    """
+    targets: list[ThemeTarget] = []
+    palettes: dict[Path, dict] = {}
+    outputs: dict[Path, Path] = {}
+
+    for palette_path in palette_paths:
+        with palette_path.open() as f:
+            palette = json.load(f)
+        palettes[palette_path] = palette
+
+        for variant in variants or palette_variants(palette, palette_path):
+            output_path = EMITTERS["theme"].path(resources_dir, variant)
+            if output_path in outputs:
+                msg = (
+                    f"{output_path.name} would be generated by both "
+                    f"{outputs[output_path].name} and {palette_path.name}"
+                )
+                raise ValueError(msg)
+            outputs[output_path] = palette_path
+            targets.append(
+                ThemeTarget(
+                    palette_path,
+                    variant,
+                    output_path,
+                    EMITTERS["scheme"].path(resources_dir, variant),
+                    EMITTERS["stylesheet"].path(resources_dir, variant),
+                    tuple(
+                        (name, EMITTERS[name].path(export_dir, variant)) for name in exports or ()
+                    ),
+                )
+            )
+
+    return targets, palettes
+
+
+def hash_bytes(data: bytes) -> str:
+    """Return the SHA-256 hex digest of raw bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def generator_digest() -> str:
+    """Hash the generator's own sources so code changes invalidate the cache."""
+    return hash_bytes(b"".join(path.read_bytes() for path in GENERATOR_SOURCES))
+
+
+def target_cache_key(palette: dict, variant: str, generator: str) -> str:
+    """Build the cache key for a target from its palette, variant and generator.
+
+    The palette is hashed in canonical form, so formatting-only edits keep the cache warm.
+    Palettes without derived colors are hashed with the base palette's ones they inherit.
+    """
+    if "_derived" not in palette:
+        palette = {**palette, "_derived": base_derived_colors()}
+    canonical = json.dumps(palette, sort_keys=True, separators=(",", ":"))
+    return hash_bytes(f"{generator}\0{variant}\0{canonical}".encode())
+
+
+def load_manifest(manifest_path: Path) -> dict[str, dict]:
+    """Load cache entries from the manifest, ignoring missing or outdated files."""
+    try:
+        with manifest_path.open() as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get("version") != CACHE_MANIFEST_VERSION:
+        return {}
+    return manifest.get("entries", {})
+
+
+def save_manifest(manifest_path: Path, entries: dict[str, dict]) -> None:
+    """Write cache entries to the manifest."""
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {"version": CACHE_MANIFEST_VERSION, "entries": entries}
+    write_if_changed(manifest_path, json.dumps(manifest, indent=2) + "\n")
+
+
+def write_if_changed(path: Path, content: str | bytes) -> bool:
+    """Atomically replace a file's content, leaving it untouched when it is identical.
+
+    The content goes to a temporary file next to the target that is renamed over it, so
+    readers (Gradle, the IDE) never see a partially written file and unchanged outputs
+    keep their modification time.
+
+    Returns:
+        Whether the file was written
+    """
+    data = content.encode() if isinstance(content, str) else content
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass  # Missing or unreadable: write it
+
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        # os.open applies the umask like a regular file creation would
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def is_up_to_date(target: ThemeTarget, key: str, entry: dict | None) -> bool:
+    """Check whether a target's outputs were generated from the same inputs and are untouched."""
+    if entry is None or entry.get("key") != key:
+        return False
+    digests = entry.get("outputs", {})
+    try:
+        return all(
+            hash_bytes(path.read_bytes()) == digests.get(path.name) for path in target.outputs
+        )
+    except OSError:
+        return False
+
+
+class TargetResult(NamedTuple):
+    """Outcome of generating one target.
+
+    "trace" holds the profiler events and counters recorded in a worker process.
+    """
+
+    target: ThemeTarget
+    digests: dict[str, str]
+    written: list[Path]
+    trace: tuple[list[dict], dict[str, int]] | None = None
+
+
+def generate_target(target: ThemeTarget, palette: dict, profile: bool = False) -> TargetResult:
+    """Generate and write a theme with its other formats (runs in worker processes).
+
+    Args:
+        target: Target to generate
+        palette: Palette of the target
+        profile: Record stages in this (worker) process and return them with the result
+    """
+    if profile:
+        PROFILER.enabled = True
+        PROFILER.drain()  # Drop events a forked worker inherited from the parent
+
+    stage_args = {"palette": target.palette_path.name, "variant": target.variant}
+    with PROFILER.stage("generate target", **stage_args):
+        with PROFILER.stage("compile template"):
+            compile_theme_template()
+        with PROFILER.stage("derive colors"):
+            theme = generate_theme_json(palette, target.variant)
+        PROFILER.count("colors", len(theme["colors"]))
+        digests, written = write_target(target, ColorModel(target.variant, theme))
+
+    return TargetResult(target, digests, written, PROFILER.drain() if profile else None)
+
+
+def write_target(target: ThemeTarget, model: ColorModel) -> tuple[dict[str, str], list[Path]]:
+    """Render every output format of a target from its color model and write the changed ones.
+
+    Returns:
+        Hashes of the outputs keyed by file name and the files that were written
+    """
+    contents = {}
+    for name, path in target.emitted:
+        with PROFILER.stage(f"emit {name}"):
+            contents[path] = EMITTERS[name].render(model)
+
+    digests = {}
+    written = []
+    with PROFILER.stage("write outputs"):
+        for path, content in contents.items():
+            digests[path.name] = hash_bytes(content.encode())
+            if write_if_changed(path, content):
+                written.append(path)
+    PROFILER.count("files written", len(written))
+    return digests, written
+
+
+def generate_all(
+    targets: list[ThemeTarget],
+    palettes: dict[Path, dict],
+    jobs: int,
+) -> list[TargetResult]:
+    """Generate all targets, in parallel when there is more than one."""
+    if jobs <= 1 or len(targets) <= 1:
+        return [generate_target(target, palettes[target.palette_path]) for target in targets]
+
+    # Only parallel runs need a pool (importing it costs a cached run ~10ms)
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(targets))) as pool:
+        futures = [
+            pool.submit(generate_target, target, palettes[target.palette_path], PROFILER.enabled)
+            for target in targets
+        ]
+        results = [future.result() for future in futures]
+
+    for result in results:
+        if result.trace is not None:
+            PROFILER.merge(*result.trace)
+    return results
+
+
+def cache_id(target: ThemeTarget, project_root: Path) -> str:
+    """Identify a target in the cache manifest by its output path."""
+    if target.output_path.is_relative_to(project_root):
+        return target.output_path.relative_to(project_root).as_posix()
+    return target.output_path.as_posix()
+
+
+@dataclass
+class ThemeWatcher:
+    """Regenerate and re-validate themes whenever a palette or generator source changes.
+
+    The generator stays loaded between changes, so an edit only costs regenerating the
+    palette that changed. Generated themes are kept in memory to diff against.
+    """
+
+    project_root: Path
+    resources_dir: Path
+    palette_paths: list[Path] | None  # None watches every palette in palettes/
+    variants: list[str] | None
+    exports: list[str] | None
+    export_dir: Path
+    manifest_path: Path
+    entries: dict[str, dict]
+
+    def __post_init__(self) -> None:
+        from . import validate  # noqa: PLC0415
+
+        self.validator = validate
+        self.themes: dict[Path, dict] = {}
+        self.graphs: dict[Path, ColorGraph] = {}
+        self.mtimes = self.snapshot()
+
+    def watched_palettes(self) -> list[Path]:
+        """Get the palettes to watch (new files in palettes/ are picked up)."""
+        if self.palette_paths is not None:
+            return self.palette_paths
+        return discover_palettes(self.project_root / "palettes")
+
+    def snapshot(self) -> dict[Path, int | None]:
+        """Get modification times of every watched file (None when missing)."""
+        paths = [*self.watched_palettes(), *GENERATOR_SOURCES]
+        mtimes: dict[Path, int | None] = {}
+        for path in paths:
+            try:
+                mtimes[path] = path.stat().st_mtime_ns
+            except OSError:
+                mtimes[path] = None
+        return mtimes
+
+    def run(self) -> None:
+        """Poll for changes until interrupted."""
+        print("\n👀 Watching palettes and generator sources (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(WATCH_INTERVAL)
+                self.poll()
+        except KeyboardInterrupt:
+            print("\n✓ Stopped watching")
+
+    def poll(self) -> None:
+        """Regenerate whatever changed since the last poll."""
+        mtimes = self.snapshot()
+        changed = [path for path, mtime in mtimes.items() if self.mtimes.get(path) != mtime]
+        self.mtimes = mtimes
+        if not changed:
+            return
+
+        if any(path.suffix == ".py" for path in changed):
+            # Code changes need a fresh interpreter; the cache regenerates what they affect
+            print(f"\n↻ Generator source changed ({changed[0].name}), restarting")
+            os.execv(sys.executable, sys.orig_argv)
+
+        palettes = self.watched_palettes()
+        if any(path.parent.name == "templates" for path in changed):
+            load_scheme_template.cache_clear()
+            load_css_template.cache_clear()
+            load_vscode_template.cache_clear()
+            changed = palettes
+        elif BASE_PALETTE_PATH in changed:
+            # Palettes without their own derived colors inherit the base palette's ones
+            base_derived_colors.cache_clear()
+            changed = palettes
+
+        for palette_path in changed:
+            if palette_path in palettes and mtimes.get(palette_path) is not None:
+                self.regenerate(palette_path)
+
+    def remember(self, target: ThemeTarget) -> None:
+        """Load the theme on disk as the diff baseline the first time a target changes."""
+        if target.output_path in self.themes:
+            return
+        try:
+            with target.output_path.open() as f:
+                self.themes[target.output_path] = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def update_graph(self, palette_path: Path, palette: dict) -> tuple[ColorGraph, int]:
+        """Get the palette's derived color graph, invalidating only what the edit affects.
+
+        The graph is rebuilt when the derived colors themselves change; otherwise only
+        the colors depending on changed palette colors are evaluated again.
+
+        Returns:
+            The graph and its evaluation count before regenerating
+        """
+        derived = palette.get("_derived", base_derived_colors())
+        graph = self.graphs.get(palette_path)
+        if graph is None or graph.derived != derived:
+            graph = ColorGraph.from_palette(palette, base_derived_colors())
+            self.graphs[palette_path] = graph
+        else:
+            graph.update({key: value for key, value in palette.items() if not key.startswith("_")})
+        return graph, graph.evaluations
+
+    def regenerate(self, palette_path: Path) -> None:
+        """Regenerate, validate and diff every variant of one palette."""
+        start = time.perf_counter()
+        try:
+            targets, palettes = build_targets(
+                [palette_path], self.resources_dir, self.variants, self.exports, self.export_dir
+            )
+            palette = palettes[palette_path]
+            graph, recomputed = self.update_graph(palette_path, palette)
+            generator = generator_digest()
+            results = []
+            for target in targets:
+                self.remember(target)
+                theme = generate_theme_json(palette, target.variant, graph)
+                digests, _ = write_target(target, ColorModel(target.variant, theme))
+                self.entries[cache_id(target, self.project_root)] = {
+                    "key": target_cache_key(palette, target.variant, generator),
+                    "outputs": digests,
+                }
+                results.append((target, theme))
+        except (OSError, KeyError, ValueError) as e:
+            print(f"\n❌ {palette_path.name}: {type(e).__name__}: {e}")
+            return
+        save_manifest(self.manifest_path, self.entries)
+
+        issues = self.validator.validate_palette(palette)
+        for target, _ in results:
+            for _, section_issues in self.validator.validate_editor_scheme(target.scheme_path):
+                issues.extend(section_issues)
+            issues.extend(self.validator.validate_stylesheet(target.stylesheet_path))
+        elapsed = (time.perf_counter() - start) * 1000
+
+        print(
+            f"\n✓ {palette_path.name}: regenerated {len(results)} theme(s) in {elapsed:.0f}ms "
+            f"({graph.evaluations - recomputed} derived color(s) recomputed)"
+        )
+        from .theme_tree import HashedTree, diff_trees  # noqa: PLC0415
+
+        for target, theme in results:
+            previous = self.themes.get(target.output_path)
+            self.themes[target.output_path] = theme
+            if previous is None:
+                continue
+            changes = list(diff_trees(HashedTree.build(previous), HashedTree.build(theme)))
+            print(f"  {target.variant}: {len(changes)} key(s) changed")
+            for change in changes[:WATCH_DIFF_LIMIT]:
+                print(f"  {change.describe()}")
+            if len(changes) > WATCH_DIFF_LIMIT:
+                print(f"    … and {len(changes) - WATCH_DIFF_LIMIT} more")
+        for issue in issues:
+            print(issue)
+        if not issues:
+            print("  ✅ Contrast validations pass")
+
+
+def print_results(
+    reused: list[ThemeTarget],
+    generated: list[TargetResult],
+    palette_count: int,
+    elapsed: float,
+) -> None:
+    """Print reused and generated outputs with a summary line."""
+    for target in reused:
+        print(f"↺ Reused {target.variant} theme (up to date): {target.output_path}")
+    for target, _, written, _ in generated:
+        for name, path in target.emitted:
+            label = EMITTERS[name].label
+            if path in written:
+                print(f"✓ Generated {target.variant} {label}: {path}")
+            else:
+                print(f"= Unchanged {target.variant} {label}: {path}")
+
+    written_count = sum(len(result.written) for result in generated)
+    print(
+        f"\n✓ Generated {len(generated)} and reused {len(reused)} theme(s) "
+        f"from {palette_count} palette(s) in {elapsed:.2f}s ({written_count} file(s) written)"
+    )
+
+
+def check_previews(targets: list[ThemeTarget], tolerance: int, update: bool) -> bool:
+    """Render a mock preview of every target and compare it against its baseline.
+
+    Previews are rendered from the theme and editor scheme files on disk, so reused
+    targets are checked too. With update, the rendered previews become the baselines.
+
+    Returns:
+        Whether every preview matches its baseline (always True with update)
+    """
+    # NumPy is only needed here, so import lazily to keep plain generation fast
+    try:
+        from . import theme_preview  # noqa: PLC0415
+    except ImportError:
+        print("❌ --preview requires NumPy (pip install numpy)")
+        sys.exit(1)
+    from .theme_tree import parse_scheme  # noqa: PLC0415
+
+    PREVIEW_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    PREVIEW_BASELINE_DIR.mkdir(parents=True, exist_ok=True)
+    passed = True
+    print()
+    for target in targets:
+        start = time.perf_counter()
+        with PROFILER.stage("render preview", variant=target.variant):
+            with target.output_path.open() as f:
+                theme = json.load(f)
+            scheme = parse_scheme(target.scheme_path.read_bytes())
+            image = theme_preview.render_preview(theme_preview.preview_colors(theme, scheme))
+            png = theme_preview.encode_png(image)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        name = target.output_path.name.removesuffix(".theme.json") + ".png"
+        baseline_path = PREVIEW_BASELINE_DIR / name
+        write_if_changed(PREVIEW_OUTPUT_DIR / name, png)
+        if update:
+            write_if_changed(baseline_path, png)
+            print(f"✓ Updated {target.variant} preview baseline ({elapsed:.0f}ms): {name}")
+            continue
+        if not baseline_path.exists():
+            print(f"❌ No {target.variant} preview baseline (run with --update-previews)")
+            passed = False
+            continue
+
+        baseline = theme_preview.decode_png(baseline_path.read_bytes())
+        diff = theme_preview.compare_images(image, baseline, tolerance)
+        if diff.mismatched:
+            diff_path = PREVIEW_OUTPUT_DIR / name.replace(".png", ".diff.png")
+            write_if_changed(diff_path, theme_preview.encode_png(diff.image))
+            print(
+                f"❌ {target.variant} preview: {diff.mismatched} pixel(s) differ by up to "
+                f"{diff.max_delta} (tolerance {tolerance}): {diff_path}"
+            )
+            passed = False
+        else:
+            print(f"✓ {target.variant} preview matches its baseline ({elapsed:.0f}ms)")
+    return passed
+
+
+def parse_formats(value: str) -> list[str]:
+    """Parse comma-separated export formats ("all" selects every one)."""
+    formats = [f.strip() for f in value.split(",") if f.strip()]
+    if formats == ["all"]:
+        return list(EXPORT_FORMATS)
+    unknown = [f for f in formats if f not in EXPORT_FORMATS]
+    if unknown:
+        msg = f"unknown format(s) {', '.join(unknown)} (choose from {', '.join(EXPORT_FORMATS)})"
+        raise argparse.ArgumentTypeError(msg)
+    return formats
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="monokai-islands generate", description=__doc__)
+    add_palette_arguments(parser, "generate")
+    parser.add_argument(
+        "--variants",
+        type=lambda value: [v.strip() for v in value.split(",") if v.strip()],
+        help='Comma-separated variants for every palette (e.g., "dark,dark-darker")',
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every theme, ignoring the build cache",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Resources directory to write themes, schemes and stylesheets to "
+        "(default: src/main/resources)",
+    )
+    parser.add_argument(
+        "--export",
+        type=parse_formats,
+        metavar="FORMATS",
+        help=f"Also write other editors' formats: comma-separated {', '.join(EXPORT_FORMATS)} "
+        'or "all"',
+    )
+    parser.add_argument(
+        "--export-dir",
+        type=Path,
+        default=EXPORT_DIR,
+        help="Directory to write --export formats to (default: build/exports)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=BUILD_DIR / "profile" / "generate-themes.trace.json",
+        metavar="TRACE",
+        help="Time each stage and write a Chrome trace "
+        "(default: build/profile/generate-themes.trace.json)",
+    )
+    parser.add_argument(
+        "--preview",
+        action="store_true",
+        help="Render a mock preview PNG of every theme to build/previews/ and compare it "
+        "against the baseline in previews/ (requires NumPy)",
+    )
+    parser.add_argument(
+        "--update-previews",
+        action="store_true",
+        help="Render previews and store them as the new baselines in previews/",
+    )
+    parser.add_argument(
+        "--preview-tolerance",
+        type=int,
+        default=2,
+        metavar="DELTA",
+        help="Largest per-channel difference ignored by --preview (default: 2)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and regenerate palettes when they or the generator change",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Generate theme JSON files from palettes."""
+    args = parse_args(argv)
+    resources_dir = args.output_dir or RESOURCES_DIR
+
+    # Ensure output directories exist
+    (resources_dir / "themes").mkdir(parents=True, exist_ok=True)
+    (resources_dir / "editor-schemes").mkdir(parents=True, exist_ok=True)
+    (resources_dir / "styles").mkdir(parents=True, exist_ok=True)
+    for name in args.export or ():
+        (args.export_dir / EMITTERS[name].directory).mkdir(parents=True, exist_ok=True)
+
+    palette_paths = resolve_palettes(args.palettes, args.all)
+
+    PROFILER.enabled = args.profile is not None
+    start = time.perf_counter()
+    try:
+        with PROFILER.stage("load palettes"):
+            targets, palettes = build_targets(
+                palette_paths, resources_dir, args.variants, args.export, args.export_dir
+            )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # Skip targets whose palette, variant and generator source are unchanged
+    manifest_path = BUILD_DIR / "generate-themes" / "manifest.json"
+    with PROFILER.stage("check cache"):
+        # --force regenerates the selected targets but keeps every other entry
+        entries = load_manifest(manifest_path)
+        generator = generator_digest()
+        keys = {
+            target: target_cache_key(palettes[target.palette_path], target.variant, generator)
+            for target in targets
+        }
+        cache_ids = {target: cache_id(target, PROJECT_ROOT) for target in targets}
+
+        reused = [
+            t
+            for t in targets
+            if not args.force and is_up_to_date(t, keys[t], entries.get(cache_ids[t]))
+        ]
+        stale = [t for t in targets if t not in reused]
+
+    try:
+        with PROFILER.stage("generate all", targets=len(stale), jobs=args.jobs):
+            generated = generate_all(stale, palettes, args.jobs)
+    except ValueError as e:
+        # Templates naming unknown colors (editor scheme, Markdown stylesheet)
+        print(f"❌ {e}")
+        sys.exit(1)
+    for target, output_digests, _, _ in generated:
+        entries[cache_ids[target]] = {"key": keys[target], "outputs": output_digests}
+    if generated:
+        with PROFILER.stage("save manifest"):
+            save_manifest(manifest_path, entries)
+    elapsed = time.perf_counter() - start
+
+    print_results(reused, generated, len(palettes), elapsed)
+    previews_pass = True
+    if args.preview or args.update_previews:
+        previews_pass = check_previews(targets, args.preview_tolerance, args.update_previews)
+    if args.profile is not None:
+        PROFILER.report(args.profile)
+    if not previews_pass:
+        sys.exit(1)
+
+    if args.watch:
+        watcher = ThemeWatcher(
+            PROJECT_ROOT,
+            resources_dir,
+            None if args.all else palette_paths,
+            args.variants,
+            args.export,
+            args.export_dir,
+            manifest_path,
+            entries,
+        )
+        watcher.run()
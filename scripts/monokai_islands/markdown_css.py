@@ -0,0 +1,29 @@
+"""Generate the Markdown preview stylesheet from a palette.
+
+The stylesheet lives in templates/markdown-preview.css with "${name}" placeholders that
+resolve against the theme colors of each variant (e.g., "${accent1}" for h1).
+"""
+
+from collections.abc import Mapping
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+from .paths import TEMPLATES_DIR
+
+TEMPLATE_PATH = TEMPLATES_DIR / "markdown-preview.css"
+
+
+@lru_cache(maxsize=4)
+def load_css_template(template_path: Path = TEMPLATE_PATH) -> Template:
+    """Load (once per process) the Markdown preview stylesheet template."""
+    return Template(template_path.read_text())
+
+
+def render_markdown_css(template: Template, colors: Mapping[str, str]) -> str:
+    """Render the stylesheet, failing on placeholders that name unknown colors."""
+    try:
+        return template.substitute(colors)
+    except KeyError as e:
+        msg = f"Unknown color in Markdown preview template: {e.args[0]}"
+        raise ValueError(msg) from None
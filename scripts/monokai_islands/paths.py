@@ -0,0 +1,46 @@
+"""Project locations shared by the commands, and palette discovery."""
+
+from collections.abc import Sequence
+from functools import lru_cache
+import json
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent
+PROJECT_ROOT = PACKAGE_DIR.parent.parent
+
+PALETTES_DIR = PROJECT_ROOT / "palettes"
+
+# Palette generated and validated when none is given (its "_derived" block is the base)
+DEFAULT_PALETTE_PATH = PALETTES_DIR / "monokai-dark.json"
+
+TEMPLATES_DIR = PROJECT_ROOT / "templates"
+
+# Plugin resources the generated themes, editor schemes and stylesheets go to
+RESOURCES_DIR = PROJECT_ROOT / "src" / "main" / "resources"
+
+BUILD_DIR = PROJECT_ROOT / "build"
+
+
+def discover_palettes(palettes_dir: Path = PALETTES_DIR) -> list[Path]:
+    """Find every palette definition in the palettes directory."""
+    return sorted(palettes_dir.glob("*.json"))
+
+
+def resolve_palettes(palette_paths: Sequence[Path] = (), all_palettes: bool = False) -> list[Path]:
+    """Select the palettes a command works on (see cli.add_palette_arguments).
+
+    Every palette in palettes/ with all_palettes, else the given ones, else the default.
+    """
+    if all_palettes:
+        return discover_palettes()
+    return list(palette_paths) or [DEFAULT_PALETTE_PATH]
+
+
+@lru_cache(maxsize=1)
+def base_derived_colors() -> dict:
+    """Load (once per process) the derived colors of the base palette.
+
+    Palettes without their own "_derived" block use these.
+    """
+    with DEFAULT_PALETTE_PATH.open() as f:
+        return json.load(f)["_derived"]
@@ -0,0 +1,129 @@
+"""Per-stage timing, counters and Chrome trace export for the build scripts.
+
+Stages are recorded as trace-event "complete" events and counters as "C" events, so a
+--profile run opens directly in chrome://tracing or https://ui.perfetto.dev. Timestamps
+come from the monotonic clock, which is shared by worker processes, so events recorded
+in parallel workers line up on the same timeline.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+
+class Profiler:
+    """Collects stage timings and counters; does nothing until enabled."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events: list[dict] = []
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str, **args: object) -> Iterator[None]:
+        """Time a block as a named stage (args show up in the trace viewer)."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            self.events.append(
+                {
+                    "name": name,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": start / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "args": args,
+                }
+            )
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter (e.g., colors processed or contrast pairs evaluated)."""
+        if not self.enabled:
+            return
+
+        self.counters[name] = self.counters.get(name, 0) + value
+        self.events.append(
+            {
+                "name": name,
+                "cat": "counter",
+                "ph": "C",
+                "ts": time.perf_counter_ns() / 1000,
+                "pid": os.getpid(),
+                "args": {name: self.counters[name]},
+            }
+        )
+
+    def drain(self) -> tuple[list[dict], dict[str, int]]:
+        """Remove and return recorded events and counters (to ship them from workers)."""
+        drained = self.events, self.counters
+        self.events, self.counters = [], {}
+        return drained
+
+    def merge(self, events: list[dict], counters: dict[str, int]) -> None:
+        """Add events and counters recorded by a worker process."""
+        self.events.extend(events)
+        for name, value in counters.items():
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def summary(self) -> list[str]:
+        """Describe total time and calls per stage, slowest first, then the counters."""
+        totals: dict[str, tuple[float, int]] = {}
+        for event in self.events:
+            if event["ph"] == "X":
+                total, calls = totals.get(event["name"], (0.0, 0))
+                totals[event["name"]] = (total + event["dur"] / 1000, calls + 1)
+
+        lines = [
+            f"  {name:<28} {total:>9.2f}ms {calls:>6} call(s)"
+            for name, (total, calls) in sorted(totals.items(), key=lambda item: -item[1][0])
+        ]
+        lines += [f"  {name:<28} {value:>9}" for name, value in sorted(self.counters.items())]
+        return lines
+
+    def write_trace(self, path: Path) -> None:
+        """Write recorded events as a Chrome trace-event JSON file."""
+        script = Path(sys.argv[0]).name
+        pids = sorted({event["pid"] for event in self.events})
+        metadata = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": script if pid == os.getpid() else f"{script} worker {pid}"},
+            }
+            for pid in pids
+        ]
+        trace = {
+            "traceEvents": metadata + self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": self.counters},
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w") as f:
+            json.dump(trace, f)
+            f.write("\n")
+
+    def report(self, trace_path: Path) -> None:
+        """Print the stage summary and write the trace file."""
+        print("\nProfile:")
+        for line in self.summary():
+            print(line)
+        self.write_trace(trace_path)
+        print(f"\n✓ Wrote trace to {trace_path}")
+
+
+# Process-wide profiler, enabled by --profile (like a logger, modules share one instance)
+PROFILER = Profiler()
@@ -0,0 +1,313 @@
+"""Headless mock previews of a theme's main surfaces (requires NumPy).
+
+A fixed synthetic layout (title bar, tool window stripe, project tree, editor tabs, editor
+with gutter, diff lines and syntax tokens, completion popup, notifications and status
+bar) is rasterized from the resolved colors of a generated theme and its editor scheme.
+Shapes are alpha-composited in sRGB space onto NumPy arrays and rounded to 8 bits after
+every layer, the same way as color_table.composite. Previews are written as PNG with a
+stdlib (zlib) encoder and compared pixel by pixel against stored baselines.
+"""
+
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+import struct
+from typing import NamedTuple
+import zlib
+
+import numpy as np
+
+from .color_refs import ColorIndex
+from .color_table import parse_hex
+from .theme_tree import iter_leaves
+
+# Preview size in pixels (width, height)
+PREVIEW_SIZE = (640, 400)
+
+# Largest per-channel difference that still counts as the same pixel
+DEFAULT_TOLERANCE = 2
+
+# Mismatching pixels are drawn in this color over the dimmed baseline
+DIFF_HIGHLIGHT = np.array([255, 0, 255], dtype=np.uint8)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+class Shape(NamedTuple):
+    """Rectangle filled with a color key (see preview_colors)."""
+
+    x: int
+    y: int
+    width: int
+    height: int
+    color: str
+
+
+def frame(x: int, y: int, width: int, height: int, color: str) -> Iterator[Shape]:
+    """Yield the four 1px edges of a rectangle."""
+    yield Shape(x, y, width, 1, color)
+    yield Shape(x, y + height - 1, width, 1, color)
+    yield Shape(x, y + 1, 1, height - 2, color)
+    yield Shape(x + width - 1, y + 1, 1, height - 2, color)
+
+
+def text(x: int, y: int, widths: tuple[int, ...], color: str, gap: int = 6) -> Iterator[Shape]:
+    """Yield a line of "words" as bars (y is the top of an 18px text line)."""
+    for width in widths:
+        yield Shape(x, y + 6, width, 6, color)
+        x += width + gap
+
+
+# Editor lines: scheme attributes of the tokens and their widths (one line per tuple)
+EDITOR_LINES: tuple[tuple[tuple[str, int], ...], ...] = (
+    (("DEFAULT_LINE_COMMENT", 150),),
+    (("DEFAULT_KEYWORD", 24), ("DEFAULT_FUNCTION_DECLARATION", 60), ("TEXT", 40)),
+    (("DEFAULT_IDENTIFIER", 40), ("TEXT", 8), ("DEFAULT_STRING", 96)),
+    (("DEFAULT_IDENTIFIER", 52), ("TEXT", 8), ("DEFAULT_NUMBER", 24)),
+    (("DEFAULT_KEYWORD", 18), ("DEFAULT_IDENTIFIER", 32), ("DEFAULT_KEYWORD", 16)),
+    (("DEFAULT_FUNCTION_CALL", 48), ("TEXT", 20), ("DEFAULT_STRING", 64)),
+    (("DEFAULT_KEYWORD", 40), ("DEFAULT_IDENTIFIER", 60)),
+    (("DEFAULT_LINE_COMMENT", 120),),
+    (("DEFAULT_CONSTANT", 44), ("TEXT", 8), ("DEFAULT_NUMBER", 16)),
+    (("DEFAULT_KEYWORD", 24), ("DEFAULT_FUNCTION_DECLARATION", 72), ("TEXT", 56)),
+    (("DEFAULT_STRING", 140),),
+    (("DEFAULT_KEYWORD", 40), ("DEFAULT_IDENTIFIER", 36)),
+    (("DEFAULT_IDENTIFIER", 64), ("TEXT", 8), ("DEFAULT_FUNCTION_CALL", 52)),
+    (("DEFAULT_LINE_COMMENT", 96),),
+    (("DEFAULT_KEYWORD", 24), ("DEFAULT_IDENTIFIER", 80)),
+    (("DEFAULT_STRING", 110), ("TEXT", 8)),
+)
+
+# Editor line index -> diff attribute and gutter marker drawn on it
+DIFF_LINES = {
+    3: ("DIFF_INSERTED", "ADDED_LINES_COLOR"),
+    4: ("DIFF_INSERTED", "ADDED_LINES_COLOR"),
+    7: ("DIFF_MODIFIED", "MODIFIED_LINES_COLOR"),
+    11: ("DIFF_DELETED", "DELETED_LINES_COLOR"),
+}
+CARET_LINE = 9
+SELECTED_LINE = 5
+
+
+def window_shapes() -> Iterator[Shape]:
+    """Window chrome: title bar with project tab, tool window stripe and status bar."""
+    yield Shape(0, 0, 640, 400, "MainWindow.background")
+    yield Shape(8, 4, 110, 20, "MainWindow.Tab.selectedBackground")
+    yield from text(16, 5, (40, 36), "MainWindow.Tab.selectedForeground")
+    yield from text(130, 5, (48,), "MainWindow.Tab.foreground")
+    yield Shape(4, 36, 20, 20, "ToolWindow.Button.selectedBackground")
+    yield Shape(9, 41, 10, 10, "ToolWindow.Button.selectedForeground")
+    yield Shape(9, 69, 10, 10, "dimmed2")
+    yield Shape(9, 97, 10, 10, "dimmed2")
+    yield from text(8, 379, (60, 40), "dimmed2")
+
+
+def project_tree_shapes() -> Iterator[Shape]:
+    """Project tool window with a tree and a selected row."""
+    yield Shape(32, 32, 156, 340, "ToolWindow.background")
+    yield Shape(32, 32, 156, 24, "ToolWindow.Header.background")
+    yield from text(40, 35, (48,), "text")
+    for row in range(14):
+        y = 60 + row * 18
+        if row == 2:
+            yield Shape(32, y, 156, 18, "Tree.selectionBackground")
+            yield from text(48 + 12, y, (64,), "Tree.selectionForeground")
+        else:
+            yield from text(48 + (row % 3) * 12, y, (40 + (row * 13) % 50,), "Tree.foreground")
+
+
+def editor_shapes() -> Iterator[Shape]:
+    """Editor tabs and editor: gutter, caret row, selection, diff lines and tokens."""
+    yield Shape(192, 32, 444, 28, "EditorTabs.background")
+    yield Shape(192, 32, 120, 28, "EditorTabs.underlinedTabBackground")
+    yield Shape(192, 58, 120, 2, "EditorTabs.underlineColor")
+    yield from text(204, 37, (72,), "EditorTabs.selectedForeground")
+    yield from text(324, 37, (64,), "EditorTabs.inactiveForeground")
+
+    yield Shape(192, 60, 444, 312, "scheme.attributes.TEXT.BACKGROUND")
+    for line, tokens in enumerate(EDITOR_LINES):
+        y = 66 + line * 18
+        if line in DIFF_LINES:
+            attribute, marker = DIFF_LINES[line]
+            yield Shape(232, y, 404, 18, f"scheme.attributes.{attribute}.BACKGROUND")
+            yield Shape(226, y, 3, 18, f"scheme.colors.{marker}")
+        if line == CARET_LINE:
+            yield Shape(232, y, 404, 18, "scheme.colors.CARET_ROW_COLOR")
+            yield Shape(340, y + 2, 2, 14, "scheme.colors.CARET_COLOR")
+        number = "LINE_NUMBER_ON_CARET_ROW_COLOR" if line == CARET_LINE else "LINE_NUMBERS_COLOR"
+        yield from text(200, y, (14,), f"scheme.colors.{number}")
+        if line == SELECTED_LINE:
+            yield Shape(240, y, 160, 18, "scheme.colors.SELECTION_BACKGROUND")
+
+        x = 244
+        for attribute, width in tokens:
+            yield Shape(x, y + 6, width, 6, f"scheme.attributes.{attribute}.FOREGROUND")
+            x += width + 6
+
+
+def overlay_shapes() -> Iterator[Shape]:
+    """Completion popup and (translucent) notifications over the editor."""
+    yield Shape(300, 150, 170, 96, "Popup.background")
+    yield from frame(300, 150, 170, 96, "Popup.borderColor")
+    for row in range(5):
+        y = 154 + row * 18
+        if row == 1:
+            yield Shape(301, y, 168, 18, "CompletionPopup.selectionBackground")
+        yield from text(312, y, (56 + row * 7, 28), "text")
+
+    yield Shape(420, 252, 208, 44, "Notification.errorBackground")
+    yield from frame(420, 252, 208, 44, "Notification.errorBorderColor")
+    yield from text(432, 256, (90, 40), "text")
+    yield from text(432, 274, (48,), "Notification.linkForeground")
+    yield Shape(420, 304, 208, 60, "Notification.background")
+    yield from frame(420, 304, 208, 60, "Notification.borderColor")
+    yield from text(432, 310, (70, 50), "text")
+    yield from text(432, 328, (110,), "dimmed1")
+    yield from text(432, 346, (56,), "Notification.linkForeground")
+
+
+@lru_cache(maxsize=1)
+def preview_layout() -> tuple[Shape, ...]:
+    """Build (once per process) the mock layout, painted in order."""
+    return (*window_shapes(), *project_tree_shapes(), *editor_shapes(), *overlay_shapes())
+
+
+def preview_colors(theme: Mapping, scheme: Mapping) -> dict[str, int]:
+    """Resolve every color key a layout may use to packed 0xRRGGBBAA colors.
+
+    Keys are theme color names (e.g., "text"), UI keys (e.g., "Popup.background") and
+    editor scheme values prefixed with "scheme." (e.g., "scheme.colors.CARET_COLOR"),
+    with the scheme loaded by theme_tree.parse_scheme.
+    """
+    index = ColorIndex.from_theme(theme)
+    colors = {name: index.table.packed(name) for name in index.table}
+    colors.update(index.flat())
+    colors.update(
+        (key, parse_hex(value))
+        for key, value in iter_leaves(scheme, "scheme")
+        if isinstance(value, str) and value.startswith("#")
+    )
+    return colors
+
+
+def render_preview(
+    colors: Mapping[str, int],
+    layout: tuple[Shape, ...] | None = None,
+) -> np.ndarray:
+    """Rasterize a layout into an (height, width, 3) uint8 RGB image.
+
+    Raises:
+        ValueError: When the layout uses colors the theme or scheme do not define
+    """
+    layout = preview_layout() if layout is None else layout
+    missing = sorted({shape.color for shape in layout} - colors.keys())
+    if missing:
+        msg = f"preview colors not defined by the theme: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    width, height = PREVIEW_SIZE
+    canvas = np.zeros((height, width, 3), dtype=np.uint8)
+    for x, y, w, h, key in layout:
+        packed = colors[key]
+        alpha = (packed & 0xFF) / 255
+        if alpha == 0.0:
+            continue
+        rgb = np.array([packed >> 24, (packed >> 16) & 0xFF, (packed >> 8) & 0xFF])
+        region = canvas[y : y + h, x : x + w]
+        if alpha == 1.0:
+            region[...] = rgb
+        else:
+            # "Source over" onto the opaque canvas, rounded to 8 bits per layer
+            region[...] = np.rint(rgb * alpha + region * (1 - alpha))
+    return canvas
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    """Frame a PNG chunk with its length and CRC."""
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(image: np.ndarray) -> bytes:
+    """Encode an (height, width, 3) uint8 RGB image as PNG (no filtering)."""
+    height, width, _ = image.shape
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)  # filter type 0 per row
+    rows[:, 1:] = image.reshape(height, width * 3)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8-bit RGB
+    return b"".join(
+        (
+            PNG_SIGNATURE,
+            png_chunk(b"IHDR", header),
+            png_chunk(b"IDAT", zlib.compress(rows.tobytes(), 9)),
+            png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Decode an 8-bit RGB PNG (as written by encode_png) into an (h, w, 3) array.
+
+    Rows may use the None, Sub and Up filters; other filters and formats are rejected.
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        msg = "not a PNG file"
+        raise ValueError(msg)
+
+    offset = len(PNG_SIGNATURE)
+    header = b""
+    compressed = []
+    while offset < len(data):
+        (length,) = struct.unpack_from(">I", data, offset)
+        kind = data[offset + 4 : offset + 8]
+        chunk = data[offset + 8 : offset + 8 + length]
+        offset += length + 12
+        if kind == b"IHDR":
+            header = chunk
+        elif kind == b"IDAT":
+            compressed.append(chunk)
+
+    width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", header)
+    if (depth, color_type, interlace) != (8, 2, 0):
+        msg = "only 8-bit RGB non-interlaced PNG files are supported"
+        raise ValueError(msg)
+
+    raw = np.frombuffer(zlib.decompress(b"".join(compressed)), dtype=np.uint8)
+    rows = raw.reshape(height, width * 3 + 1)
+    image = rows[:, 1:].reshape(height, width, 3).copy()
+    previous = np.zeros((width, 3), dtype=np.uint8)
+    for y, kind in enumerate(rows[:, 0]):
+        if kind == 1:  # Sub: add the pixel to the left
+            image[y] = np.cumsum(image[y], axis=0, dtype=np.uint8)
+        elif kind == 2:  # Up: add the pixel above
+            image[y] += previous
+        elif kind != 0:
+            msg = f"unsupported PNG filter type {kind}"
+            raise ValueError(msg)
+        previous = image[y]
+    return image
+
+
+class PixelDiff(NamedTuple):
+    """Pixels exceeding the tolerance and an image highlighting them."""
+
+    mismatched: int
+    max_delta: int
+    image: np.ndarray
+
+
+def compare_images(
+    rendered: np.ndarray,
+    baseline: np.ndarray,
+    tolerance: int = DEFAULT_TOLERANCE,
+) -> PixelDiff:
+    """Compare two images pixel by pixel, allowing a per-channel tolerance.
+
+    The diff image is the baseline dimmed to a quarter, with mismatching pixels drawn in
+    DIFF_HIGHLIGHT. Images of different sizes mismatch entirely.
+    """
+    if rendered.shape != baseline.shape:
+        return PixelDiff(rendered.shape[0] * rendered.shape[1], 255, rendered)
+
+    delta = np.abs(rendered.astype(np.int16) - baseline.astype(np.int16)).max(axis=-1)
+    mismatch = delta > tolerance
+    image = baseline // 4
+    image[mismatch] = DIFF_HIGHLIGHT
+    return PixelDiff(int(mismatch.sum()), int(delta.max()), image)
@@ -0,0 +1,167 @@
+"""Structural diff of generated themes and editor schemes using subtree hashes.
+
+Both formats are loaded as nested dicts: theme JSON as is, scheme XML as its sections
+(metaInfo, colors, attributes) keyed by option name. Every subtree gets a Merkle hash
+(key order does not matter), so comparing two trees skips identical subtrees after one
+digest comparison and only walks into the ones that changed.
+
+Changes are reported by dotted key path, where "" keys belong to their parent (see
+flatten_to_nested in generate.py). A key moving between a leaf and a "" entry
+therefore keeps its path, and is only reported when its value changes.
+"""
+
+from collections.abc import Iterator, Mapping
+import hashlib
+import json
+from typing import NamedTuple, Self
+import xml.etree.ElementTree as ET
+
+from .editor_scheme import COLOR_OPTIONS
+
+# Subtree digest size in bytes (collisions only need to be unlikely, not adversarial)
+DIGEST_SIZE = 16
+
+
+class Change(NamedTuple):
+    """Value of a dotted key path before and after (None when absent)."""
+
+    path: str
+    before: object
+    after: object
+
+    def describe(self) -> str:
+        """Describe the change on one line (e.g., "  ~ colors.text: #fcfcfa → #ffffff")."""
+        if self.before is None:
+            return f"  + {self.path}: {self.after}"
+        if self.after is None:
+            return f"  - {self.path}: {self.before}"
+        return f"  ~ {self.path}: {self.before} → {self.after}"
+
+
+class HashedTree(NamedTuple):
+    """Subtree with its digest; children is None for leaves."""
+
+    digest: bytes
+    value: object
+    children: dict[str, Self] | None
+
+    @classmethod
+    def build(cls, node: object) -> Self:
+        """Hash a nested structure bottom-up (dict children are hashed in key order)."""
+        if not isinstance(node, Mapping):
+            data = json.dumps(node).encode()
+            return cls(hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest(), node, None)
+
+        children = {key: cls.build(value) for key, value in node.items()}
+        h = hashlib.blake2b(b"{", digest_size=DIGEST_SIZE)
+        for key in sorted(children):
+            h.update(key.encode())
+            h.update(b"\0")
+            h.update(children[key].digest)
+        return cls(h.digest(), node, children)
+
+
+def join_path(prefix: str, key: str) -> str:
+    """Append a key to a dotted path ("" keys stand for their parent)."""
+    return f"{prefix}.{key}" if prefix and key else prefix or key
+
+
+def iter_leaves(node: object, prefix: str = "") -> Iterator[tuple[str, object]]:
+    """Yield (dotted key path, value) for every leaf of a nested structure."""
+    if isinstance(node, Mapping):
+        for key, value in node.items():
+            yield from iter_leaves(value, join_path(prefix, key))
+    else:
+        yield prefix, node
+
+
+def diff_leaves(old: object, new: object, prefix: str) -> Iterator[Change]:
+    """Compare two subtrees leaf by leaf (used where their shapes differ)."""
+    before = dict(iter_leaves(old, prefix))
+    after = dict(iter_leaves(new, prefix))
+    for path, value in after.items():
+        if path not in before:
+            yield Change(path, None, value)
+        elif before[path] != value:
+            yield Change(path, before[path], value)
+    yield from (Change(path, value, None) for path, value in before.items() if path not in after)
+
+
+def diff_trees(old: HashedTree, new: HashedTree, prefix: str = "") -> Iterator[Change]:
+    """Yield changed dotted key paths between two hashed trees.
+
+    Subtrees with equal digests are skipped without being visited. Subtrees present on
+    both sides recurse; changed leaves, added, removed and reshaped keys are compared
+    leaf by leaf.
+    """
+    if old.digest == new.digest:
+        return
+    if old.children is None or new.children is None:
+        yield from diff_leaves(old.value, new.value, prefix)
+        return
+
+    # Leaves and keys on one side only are compared together by path, since a key may
+    # only have been reshaped (e.g., "Button.x" moved under a "" conflict key)
+    before, after = {}, {}
+    for key, child in new.children.items():
+        previous = old.children.get(key)
+        if previous is not None and previous.children is not None and child.children is not None:
+            yield from diff_trees(previous, child, join_path(prefix, key))
+        elif previous is None or previous.digest != child.digest:
+            after[key] = child.value
+            if previous is not None:
+                before[key] = previous.value
+    before.update((key, old.value[key]) for key in old.children if key not in new.children)
+    if before or after:
+        yield from diff_leaves(before, after, prefix)
+
+
+def scheme_value(name: str, value: str, colors: bool) -> str:
+    """Normalize color values of a scheme option to "#rrggbb" (others are kept)."""
+    if value and (colors or name in COLOR_OPTIONS):
+        return "#" + value.zfill(6).lower()
+    return value
+
+
+def parse_scheme(data: bytes) -> dict:
+    """Load editor scheme XML as nested sections keyed by option name."""
+    root = ET.fromstring(data)
+    tree: dict[str, dict] = {"scheme": dict(root.attrib)}
+    for section in root:
+        if section.tag == "metaInfo":
+            tree["metaInfo"] = {prop.get("name"): prop.text or "" for prop in section}
+        elif section.tag == "colors":
+            tree["colors"] = {
+                option.get("name"): scheme_value(option.get("name"), option.get("value", ""), True)
+                for option in section.iter("option")
+            }
+        elif section.tag == "attributes":
+            tree["attributes"] = {
+                option.get("name"): {
+                    **{key: value for key, value in option.attrib.items() if key != "name"},
+                    **{
+                        child.get("name"): scheme_value(
+                            child.get("name"), child.get("value", ""), False
+                        )
+                        for child in option.iterfind("value/option")
+                    },
+                }
+                for option in section.findall("option")
+            }
+    return tree
+
+
+def load_tree(name: str, data: bytes) -> dict:
+    """Load a generated file as a nested structure (by extension: .json or .xml)."""
+    if name.endswith(".xml"):
+        return parse_scheme(data)
+    return json.loads(data)
+
+
+def diff_documents(name: str, old: bytes, new: bytes) -> list[Change]:
+    """Diff two versions of a generated file (identical bytes are not parsed)."""
+    if old == new:
+        return []
+    old_tree = HashedTree.build(load_tree(name, old))
+    new_tree = HashedTree.build(load_tree(name, new))
+    return list(diff_trees(old_tree, new_tree))
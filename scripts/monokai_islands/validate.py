@@ -0,0 +1,1017 @@
+"""Validate WCAG contrast ratios for theme colors."""
+
+import argparse
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
+import json
+from pathlib import Path
+import re
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+from .cli import add_palette_arguments
+from .color_graph import ColorGraph
+from .color_refs import ColorIndex
+from .color_table import (
+    SRGB_TO_LINEAR,
+    ColorTable,
+    composite,
+    contrast_ratio,
+    parse_hex,
+    relative_luminance,
+    unpack,
+)
+from .editor_scheme import COLOR_OPTIONS, load_scheme_template
+from .markdown_css import load_css_template
+from .paths import (
+    BUILD_DIR,
+    PROJECT_ROOT,
+    RESOURCES_DIR,
+    base_derived_colors,
+    discover_palettes,
+    resolve_palettes,
+)
+from .profiling import PROFILER
+
+# Scheme attributes that are not text (gutter markers) or meant to blend in (ANSI black)
+EXEMPT_ATTRIBUTES = ("LINE_*_COVERAGE", "*_BLACK", "*_BLACK_OUTPUT")
+
+# UI surface pairs known to be below 4.5:1, reported as warnings until the design changes
+KNOWN_SURFACE_ISSUES = frozenset({("Counter.foreground", "Counter.background")})
+
+# Intentionally de-emphasized text (comments, unused code, separators)
+FADED_ATTRIBUTES = (
+    "*COMMENT*",
+    "*DARKGRAY*",
+    "*BLACK_BRIGHT",
+    "*INACTIVE*",
+    "*HRULE*",
+    "*SEPARATOR*",
+    "*SHEBANG*",
+    "*BLOCK_QUOTE*",
+    "*CODE_FENCE*",
+    "*REDUNDANT_ESCAPE*",
+    "INLAY_*",
+    "NOT_USED_*",
+)
+
+# Palette text contrast requirements (WCAG AA: 4.5:1, accents as large/bold text: 3:1)
+PALETTE_PAIRS = [
+    ("text", "background", 4.5),
+    ("text", "dark1", 4.5),
+    ("accent1", "background", 3.0),
+    ("accent2", "background", 3.0),
+    ("accent3", "background", 3.0),
+    ("accent4", "background", 3.0),
+    ("accent5", "background", 3.0),
+    ("accent6", "background", 3.0),
+    ("dimmed3", "background", 4.5),  # Comments
+]
+
+# Stylesheet selectors rendered as large text (WCAG AA large-text threshold)
+LARGE_TEXT_SELECTORS = ("h[1-6]", "h[1-6]:*")
+
+CSS_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+SCHEME_HEX = re.compile(r"[0-9a-fA-F]{3,8}")
+CSS_HEX_COLOR = re.compile(r"#(?:[0-9a-fA-F]{8}|[0-9a-fA-F]{6}|[0-9a-fA-F]{3,4})\b")
+
+
+def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Convert hex color to RGB values (0-255 range)."""
+    return unpack(parse_hex(hex_color))[:3]
+
+
+def calculate_relative_luminance(rgb: tuple[int, int, int]) -> float:
+    """Calculate relative luminance for WCAG contrast ratio.
+
+    Formula from WCAG 2.1, using the precomputed sRGB linearization table:
+    https://www.w3.org/WAI/WCAG21/Understanding/contrast-minimum.html
+    """
+    r, g, b = rgb
+    return 0.2126 * SRGB_TO_LINEAR[r] + 0.7152 * SRGB_TO_LINEAR[g] + 0.0722 * SRGB_TO_LINEAR[b]
+
+
+def calculate_contrast_ratio(color1: str, color2: str, underlay: str | None = None) -> float:
+    """Calculate WCAG contrast ratio between two colors.
+
+    A translucent background (color2) is composited over the underlay when given, and a
+    translucent foreground (color1) over the resulting background, so the ratio matches
+    what is actually displayed.
+    """
+    bg = parse_hex(color2)
+    if underlay is not None:
+        bg = composite(bg, parse_hex(underlay))
+    fg = composite(parse_hex(color1), bg)
+    return contrast_ratio(relative_luminance(fg), relative_luminance(bg))
+
+
+def validate_palette(palette: dict) -> list[str]:
+    """Validate WCAG contrast requirements for a palette."""
+    issues = []
+    colors = ColorTable.from_palette(palette)
+
+    PROFILER.count("colors", len(colors))
+    for fg_key, bg_key, min_ratio in PALETTE_PAIRS:
+        if fg_key not in colors or bg_key not in colors:
+            continue
+
+        PROFILER.count("contrast pairs")
+        ratio = colors.contrast_ratio(fg_key, bg_key)
+        if ratio < min_ratio:
+            issues.append(
+                f"  ❌ {fg_key} on {bg_key}: {ratio:.2f}:1 "
+                f"(required: {min_ratio}:1)"
+            )
+
+    return issues
+
+
+def validate_diff_colors(diff_colors: dict, line_numbers: str, text: str) -> list[str]:
+    """Validate contrast for diff backgrounds.
+
+    Args:
+        diff_colors: Dict of diff color names to hex values
+        line_numbers: Hex color for line numbers
+        text: Hex color for main text
+    """
+    issues = []
+    PROFILER.count("contrast pairs", 2 * len(diff_colors))
+
+    # Diff backgrounds should have good text contrast (8:1+ recommended, 4.5:1 minimum)
+    for name, bg_color in diff_colors.items():
+        text_ratio = calculate_contrast_ratio(text, bg_color)
+        if text_ratio < 4.5:
+            issues.append(
+                f"  ❌ text on {name}: {text_ratio:.2f}:1 "
+                f"(required: 4.5:1)"
+            )
+        elif text_ratio < 7.0:
+            issues.append(
+                f"  ⚠️  text on {name}: {text_ratio:.2f}:1 "
+                f"(recommended: 7.0:1)"
+            )
+
+        # Line numbers need 2.0:1 minimum on diff backgrounds
+        line_ratio = calculate_contrast_ratio(line_numbers, bg_color)
+        if line_ratio < 2.0:
+            issues.append(
+                f"  ❌ line_numbers on {name}: {line_ratio:.2f}:1 "
+                f"(required: 2.0:1)"
+            )
+
+    return issues
+
+
+def attribute_min_ratio(name: str) -> float | None:
+    """Get the minimum contrast ratio for a syntax color, or None when it is not text."""
+    key = name.upper()
+    if any(fnmatchcase(key, pattern) for pattern in EXEMPT_ATTRIBUTES):
+        return None
+    # Comments and other de-emphasized text are intentionally faded, so lower threshold
+    if any(fnmatchcase(key, pattern) for pattern in FADED_ATTRIBUTES):
+        return 2.0
+    return 3.0
+
+
+def validate_selection_colors(
+    selection_bg: str,
+    syntax_colors: dict,
+    surface: str = "selection",
+) -> list[str]:
+    """Validate contrast for selection background against syntax colors.
+
+    Args:
+        selection_bg: Hex color for selection background
+        syntax_colors: Dict of syntax color names to hex values
+        surface: Name of the background used in issue messages
+    """
+    issues = []
+
+    for name, color in syntax_colors.items():
+        min_ratio = attribute_min_ratio(name)
+        if min_ratio is None:
+            continue
+
+        PROFILER.count("contrast pairs")
+        ratio = calculate_contrast_ratio(color, selection_bg)
+        if ratio < min_ratio:
+            issues.append(
+                f"  ❌ {name} on {surface}: {ratio:.2f}:1 "
+                f"(required: {min_ratio}:1)"
+            )
+
+    return issues
+
+
+def scheme_color(value: str | None) -> str | None:
+    """Convert an editor scheme color value to a hex color.
+
+    Scheme values omit the leading "#" and leading zeros (e.g., "da19e" is "#0da19e").
+    """
+    if not value:
+        return None
+    return "#" + value.zfill(6)
+
+
+def iter_scheme_options(
+    scheme_path: Path,
+) -> Iterator[tuple[str, str, str | None, str | None]]:
+    """Stream options of an editor color scheme without building a full DOM.
+
+    Each top-level option is released as soon as it is parsed, so memory stays bounded
+    regardless of the scheme size.
+
+    Yields:
+        (section, name, foreground, background) tuples. Options of the <colors> section
+        carry their value as the foreground.
+    """
+    section = None
+    container = None
+    depth = 0
+    name = foreground = background = None
+
+    for event, elem in ET.iterparse(scheme_path, events=("start", "end")):
+        if elem.tag in ("colors", "attributes"):
+            section, container = (elem.tag, elem) if event == "start" else (None, None)
+            continue
+        if section is None or elem.tag != "option":
+            continue
+
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                name = elem.get("name")
+                foreground = scheme_color(elem.get("value")) if section == "colors" else None
+                background = None
+            elif elem.get("name") == "FOREGROUND":
+                foreground = scheme_color(elem.get("value"))
+            elif elem.get("name") == "BACKGROUND":
+                background = scheme_color(elem.get("value"))
+            continue
+
+        depth -= 1
+        if depth == 0:
+            yield section, name, foreground, background
+            container.clear()
+
+
+def css_color(value: str) -> str | None:
+    """Extract the first hex color of a CSS value, expanding short "#rgb"/"#rgba" forms."""
+    match = CSS_HEX_COLOR.search(value)
+    if match is None:
+        return None
+    digits = match.group()[1:]
+    if len(digits) <= 4:
+        digits = "".join(c * 2 for c in digits)
+    return "#" + digits.lower()
+
+
+def iter_css_rules(stylesheet_path: Path) -> Iterator[tuple[str, str | None, str | None]]:
+    """Parse color declarations of a flat stylesheet (no nested at-rules).
+
+    Yields:
+        (selector, color, background) tuples, one per selector of every rule
+    """
+    text = CSS_COMMENT.sub("", stylesheet_path.read_text())
+    for selectors, body in CSS_RULE.findall(text):
+        color = background = None
+        for declaration in body.split(";"):
+            prop, _, value = declaration.partition(":")
+            prop = prop.strip().lower()
+            if prop == "color":
+                color = css_color(value)
+            elif prop in ("background", "background-color"):
+                background = css_color(value)
+        for selector in selectors.split(","):
+            yield selector.strip(), color, background
+
+
+def validate_stylesheet(stylesheet_path: Path) -> list[str]:
+    """Validate each selector's text color against its background.
+
+    Selectors without their own color or background inherit the body ones. Headings
+    count as large text and need 3:1, everything else 4.5:1.
+    """
+    rules = [rule for rule in iter_css_rules(stylesheet_path) if rule[1] or rule[2]]
+    body_fg = next((fg for selector, fg, _ in rules if selector == "body" and fg), "#000000")
+    body_bg = next((bg for selector, _, bg in rules if selector == "body" and bg), "#ffffff")
+
+    issues = []
+    PROFILER.count("contrast pairs", len(rules))
+    for selector, fg, bg in rules:
+        large = any(fnmatchcase(selector, pattern) for pattern in LARGE_TEXT_SELECTORS)
+        min_ratio = 3.0 if large else 4.5
+        ratio = calculate_contrast_ratio(fg or body_fg, bg or body_bg)
+        if ratio < min_ratio:
+            issues.append(
+                f"  ❌ {selector} ({fg or body_fg} on {bg or body_bg}): {ratio:.2f}:1 "
+                f"(required: {min_ratio}:1)"
+            )
+    return issues
+
+
+def validate_editor_scheme(scheme_path: Path) -> list[tuple[str, list[str]]]:
+    """Validate syntax colors of an editor scheme against the backgrounds they appear on.
+
+    Every attribute foreground is checked against its own background (or the scheme
+    default from TEXT), the selection background and the caret row background.
+
+    Returns:
+        List of (section, issues) tuples
+    """
+    scheme_colors: dict[str, str | None] = {}
+    # Attributes without their own background wait for the TEXT default
+    pending: dict[str, str] = {}
+    background_issues: list[str] = []
+    selection_issues: list[str] = []
+    caret_row_issues: list[str] = []
+    default_bg = None
+
+    for section, name, fg, bg in iter_scheme_options(scheme_path):
+        if section == "colors":
+            scheme_colors[name] = fg
+            continue
+
+        if name == "TEXT":
+            default_bg = bg
+        if fg is None:
+            continue
+
+        if bg is None:
+            pending[name] = fg
+        else:
+            background_issues.extend(validate_selection_colors(bg, {name: fg}, "background"))
+
+        if selection_bg := scheme_colors.get("SELECTION_BACKGROUND"):
+            selection_issues.extend(validate_selection_colors(selection_bg, {name: fg}))
+        if caret_row_bg := scheme_colors.get("CARET_ROW_COLOR"):
+            caret_row_issues.extend(
+                validate_selection_colors(caret_row_bg, {name: fg}, "caret row")
+            )
+
+    default_bg = default_bg or scheme_colors.get("CONSOLE_BACKGROUND_KEY")
+    if default_bg:
+        background_issues.extend(validate_selection_colors(default_bg, pending, "background"))
+
+    return [
+        ("Editor scheme backgrounds", background_issues),
+        ("Selection background", selection_issues),
+        ("Caret row background", caret_row_issues),
+    ]
+
+
+def template_color_names() -> set[str]:
+    """Collect names the editor scheme and stylesheet templates reference (besides the UI)."""
+    names: set[str] = set()
+    template = load_scheme_template()
+    names.update(v for v in template["colors"].values() if isinstance(v, str))
+    for values in template["attributes"].values():
+        names.update(v for v in (values or {}).values() if isinstance(v, str))
+
+    css = load_css_template()
+    for match in css.pattern.finditer(css.template):
+        names.add(match.group("named") or match.group("braced"))
+    return names
+
+
+def validate_ui_references(
+    theme_path: Path,
+) -> tuple[list[tuple[str, list[str]]], list[str], list[str]]:
+    """Validate the UI color references of a generated theme file (see validate_ui_theme)."""
+    with theme_path.open() as f:
+        return validate_ui_theme(json.load(f))
+
+
+def validate_ui_theme(theme: dict) -> tuple[list[tuple[str, list[str]]], list[str], list[str]]:
+    """Validate the UI color references of a theme.
+
+    Every UI key must name a color of the theme's "colors" block, and foreground keys must
+    contrast with the background key of the same component (composited over "background").
+    Pairs in KNOWN_SURFACE_ISSUES are reported as warnings instead.
+
+    Returns:
+        List of (section, issues) tuples, warnings and the color names nothing references
+    """
+    index = ColorIndex.from_theme(theme)
+
+    reference_issues = [
+        f"  ❌ {key}: unknown color {name}" for key, name in index.dangling.items()
+    ]
+
+    surface_issues = []
+    warnings = []
+    underlay = index.table.packed("background") if "background" in index.table else 0xFF
+    pairs = index.surface_pairs()
+    PROFILER.count("contrast pairs", len(pairs))
+    for fg_key, bg_key in pairs:
+        bg = index.displayed(bg_key, underlay)
+        fg = index.displayed(fg_key, bg)
+        ratio = contrast_ratio(relative_luminance(fg), relative_luminance(bg))
+        if ratio >= 4.5:
+            continue
+        if (fg_key, bg_key) in KNOWN_SURFACE_ISSUES:
+            warnings.append(f"  ⚠️  {fg_key} on {bg_key}: {ratio:.2f}:1 (known, not an error)")
+        else:
+            surface_issues.append(
+                f"  ❌ {fg_key} on {bg_key}: {ratio:.2f}:1 (required: 4.5:1)"
+            )
+
+    sections = [
+        ("UI color references", reference_issues),
+        ("UI surfaces", surface_issues),
+    ]
+    return sections, warnings, index.unused(template_color_names())
+
+
+def print_validation_result(section: str, issues: list[str]) -> None:
+    """Print validation results for a section."""
+    print(f"\n{section}:")
+    if issues:
+        for issue in issues:
+            print(issue)
+    else:
+        print(f"  ✅ {section} meet contrast requirements")
+
+
+def get_schemes_to_check(scheme_paths: list[Path]) -> list[Path]:
+    """Get list of editor color schemes to validate."""
+    if scheme_paths:
+        return scheme_paths
+
+    return sorted((RESOURCES_DIR / "editor-schemes").glob("*.xml"))
+
+
+def get_stylesheets_to_check(stylesheet_paths: list[Path]) -> list[Path]:
+    """Get list of generated Markdown preview stylesheets to validate."""
+    if stylesheet_paths:
+        return stylesheet_paths
+
+    return sorted((RESOURCES_DIR / "styles").glob("*.css"))
+
+
+def get_themes_to_check(theme_paths: list[Path]) -> list[Path]:
+    """Get list of generated theme files to audit with the contrast matrix."""
+    if theme_paths:
+        return theme_paths
+
+    return sorted((RESOURCES_DIR / "themes").glob("*.theme.json"))
+
+
+def validate_theme_matrices(
+    theme_paths: list[Path],
+    pairs_path: Path | None,
+    underlays: list[str] | None,
+) -> list[str]:
+    """Audit generated themes with the vectorized contrast matrix (requires NumPy)."""
+    try:
+        from . import contrast_matrix  # noqa: PLC0415
+    except ImportError:
+        print("❌ --matrix requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    role_pairs = (
+        contrast_matrix.load_role_pairs(pairs_path)
+        if pairs_path
+        else contrast_matrix.DEFAULT_ROLE_PAIRS
+    )
+
+    all_issues: list[str] = []
+    for theme_path in get_themes_to_check(theme_paths):
+        start = time.perf_counter()
+        with PROFILER.stage("contrast matrix", theme=theme_path.name):
+            issues, pair_count = contrast_matrix.validate_theme_matrix(
+                theme_path, role_pairs, underlays
+            )
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        PROFILER.count("contrast pairs", pair_count)
+        print_validation_result(f"{theme_path.name} contrast matrix", issues)
+        print(f"  ({pair_count} pairs evaluated in {elapsed_ms:.1f}ms)")
+        all_issues.extend(issues)
+    return all_issues
+
+
+def collect_scheme_pairs(scheme_path: Path) -> tuple[dict[str, str], list[tuple[str, str, float]]]:
+    """Collect syntax colors of an editor scheme with the background they are drawn on.
+
+    Returns:
+        Colors by label and (foreground, background, minimum ratio) label pairs
+    """
+    colors: dict[str, str] = {}
+    pairs: list[tuple[str, str, float]] = []
+    pending: list[str] = []
+
+    for section, name, fg, bg in iter_scheme_options(scheme_path):
+        if section == "attributes" and name == "TEXT" and bg:
+            colors["TEXT background"] = bg
+        min_ratio = attribute_min_ratio(name)
+        if section == "colors" or fg is None or min_ratio is None:
+            continue
+
+        colors[name] = fg
+        if bg is None:
+            pending.append(name)
+        else:
+            colors[f"{name} background"] = bg
+            pairs.append((name, f"{name} background", min_ratio))
+
+    if "TEXT background" in colors:
+        pairs += [(name, "TEXT background", attribute_min_ratio(name)) for name in pending]
+    return colors, pairs
+
+
+def validate_contrast_metrics(palette_paths: list[Path], scheme_paths: list[Path]) -> list[str]:
+    """Report palette and syntax pairs with every contrast metric (requires NumPy).
+
+    All metrics share one batched luminance pass per section; a pair fails when any
+    metric is below its threshold for the pair's WCAG requirement.
+    """
+    try:
+        from . import contrast_metrics  # noqa: PLC0415
+    except ImportError:
+        print("❌ --apca requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    metrics = list(contrast_metrics.METRICS.values())
+    names = ", ".join(metric.name for metric in metrics)
+    sections = []
+    for path in palette_paths:
+        if path.exists():
+            with path.open() as f:
+                palette = json.load(f)
+            colors = {key: value for key, value in palette.items() if not key.startswith("_")}
+            pairs = [pair for pair in PALETTE_PAIRS if pair[0] in colors and pair[1] in colors]
+            sections.append((path.stem, colors, pairs))
+    for scheme_path in get_schemes_to_check(scheme_paths):
+        sections.append((scheme_path.stem, *collect_scheme_pairs(scheme_path)))
+
+    all_issues: list[str] = []
+    for section, colors, pairs in sections:
+        with PROFILER.stage("contrast metrics", section=section):
+            results = contrast_metrics.evaluate(pairs, colors, metrics)
+        PROFILER.count("contrast pairs", len(pairs) * len(metrics))
+        issues = [
+            f"  ❌ {result.fg} on {result.bg.replace(result.fg, 'its')}: "
+            f"{contrast_metrics.describe(result, metrics)}"
+            for result in results
+            if any(result.failing)
+        ]
+        print_validation_result(f"{section} contrast metrics ({names})", issues)
+        all_issues.extend(issues)
+    return all_issues
+
+
+def validate_palettes_vision(palette_paths: list[Path]) -> list[str]:
+    """Check palette pairs under simulated color vision deficiencies (requires NumPy)."""
+    try:
+        from . import color_vision  # noqa: PLC0415
+    except ImportError:
+        print("❌ --cvd requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    all_issues: list[str] = []
+    for path in palette_paths:
+        if not path.exists():
+            continue
+
+        palette_name = path.stem
+        with PROFILER.stage("color vision", palette=palette_name):
+            with path.open() as f:
+                palette = json.load(f)
+            colors = {key: value for key, value in palette.items() if not key.startswith("_")}
+            issues, pair_count = color_vision.validate_color_vision(colors, PALETTE_PAIRS)
+        PROFILER.count("contrast pairs", pair_count)
+        visions = ", ".join(color_vision.SIMULATIONS)
+        print_validation_result(f"{palette_name} color vision ({visions})", issues)
+        all_issues.extend(issues)
+    return all_issues
+
+
+def report_near_duplicates(theme_paths: list[Path], threshold: float) -> None:
+    """Report near-duplicate theme and editor scheme colors (requires NumPy).
+
+    Merge suggestions are informational and never fail validation.
+    """
+    try:
+        from . import color_clusters  # noqa: PLC0415
+    except ImportError:
+        print("❌ --duplicates requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    for theme_path in get_themes_to_check(theme_paths):
+        start = time.perf_counter()
+        with PROFILER.stage("near-duplicate colors", theme=theme_path.name):
+            with theme_path.open() as f:
+                theme = json.load(f)
+            scheme_path = theme_path.parent.parent / theme.get("editorScheme", "").lstrip("/")
+            literals = []
+            if scheme_path.is_file():
+                for _, name, fg, bg in iter_scheme_options(scheme_path):
+                    literals += [(name, color) for color in (fg, bg) if color]
+
+            uses = color_clusters.collect_uses(theme["colors"], literals)
+            clusters, distance_count = color_clusters.find_duplicates(uses, threshold)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        PROFILER.count("color distances", distance_count)
+
+        theme_name = theme_path.name.removesuffix(".theme.json")
+        print(f"\n{theme_name}: Near-duplicate colors (OKLab distance < {threshold:g})")
+        if not clusters:
+            print("  ✅ No near-duplicates")
+        for keep, color, merges in clusters:
+            print(f"  ⚠️  Merge into {keep} ({color}):")
+            for source, merge_color, distance in merges:
+                print(f"      {source} {merge_color} (distance {distance:.3f})")
+        print(
+            f"  ({len(uses)} colors, {distance_count} distances evaluated in {elapsed_ms:.1f}ms)"
+        )
+
+
+def collect_color_literals(palette: dict, theme_colors: set[str]) -> dict[int, list[str]]:
+    """Collect hex literals of a palette's derived colors and the templates, with sources.
+
+    Args:
+        palette: Palette whose "_derived" literals are collected
+        theme_colors: Color names, which scheme template values may use instead of hex
+
+    Returns:
+        Packed colors -> where they appear (e.g., "tab_active_bg", "scheme TEXT.BACKGROUND")
+    """
+    literals: dict[int, list[str]] = {}
+    for name, expression in palette.get("_derived", {}).items():
+        if isinstance(expression, str) and expression.startswith("#"):
+            literals.setdefault(parse_hex(expression), []).append(name)
+
+    template = load_scheme_template()
+    options = [(f"scheme {option}", value) for option, value in template["colors"].items()]
+    for attribute, values in template["attributes"].items():
+        options += [
+            (f"scheme {attribute}.{key}", value)
+            for key, value in (values or {}).items()
+            if key in COLOR_OPTIONS
+        ]
+    for source, value in options:
+        if isinstance(value, str) and value not in theme_colors and SCHEME_HEX.fullmatch(value):
+            literals.setdefault(parse_hex(value), []).append(source)
+
+    for match in CSS_HEX_COLOR.finditer(load_css_template().template):
+        literals.setdefault(parse_hex(css_color(match.group())), []).append("stylesheet")
+
+    # Fully transparent literals have no color to snap
+    return {packed: sources for packed, sources in literals.items() if packed & 0xFF}
+
+
+def snap_palette_literals(palette: dict) -> tuple[list, int]:
+    """Snap every off-palette literal of a palette to its nearest candidate (requires NumPy).
+
+    A derived literal is never snapped to a derived color that reads it, so applying a
+    suggestion cannot create a circular reference.
+
+    Returns:
+        Snaps (one per literal, nearest first) and the number of candidates searched
+    """
+    from . import color_snap  # noqa: PLC0415
+
+    graph = ColorGraph.from_palette(palette, base_derived_colors())
+    # Literal derived colors are what gets snapped, so they are no candidates
+    derived = {
+        name: packed
+        for name, packed in graph.to_dict().items()
+        if not str(graph.derived[name]).startswith("#")
+    }
+    literals = collect_color_literals(palette, set(graph.base) | set(derived))
+    dependencies = {name: graph.dependencies(name) for name in derived}
+    index = color_snap.CandidateIndex(graph.base, derived, dependencies)
+    return sorted(index.snap(literals), key=lambda snap: snap.distance), len(index)
+
+
+def report_palette_snaps(palette_paths: list[Path], max_distance: float) -> None:
+    """Snap off-palette literals to their nearest palette-derived colors (requires NumPy).
+
+    Replacement suggestions are informational and never fail validation.
+    """
+    try:
+        from . import color_snap  # noqa: PLC0415
+    except ImportError:
+        print("❌ --snap requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    for path in palette_paths:
+        if not path.exists():
+            continue
+
+        palette_name = path.stem
+        start = time.perf_counter()
+        with PROFILER.stage("snap literals", palette=palette_name):
+            with path.open() as f:
+                palette = json.load(f)
+            snaps, candidate_count = snap_palette_literals(palette)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        PROFILER.count("color distances", len(snaps) * candidate_count)
+
+        print(f"\n{palette_name}: Off-palette literals (OKLab distance < {max_distance:g})")
+        close = [snap for snap in snaps if snap.distance < max_distance]
+        for literal, sources, candidate, color, distance in close:
+            expression = json.dumps(candidate.expression(parse_hex(literal) & 0xFF))
+            print(f"  ≈ {literal} ({color_snap.describe_sources(sources)})")
+            print(f"      {candidate.describe()} {color} (distance {distance:.3f}): {expression}")
+        if not close:
+            print("  ✅ No literal is close to a palette-derived color")
+        print(
+            f"  ({len(snaps)} literals, {len(snaps) - len(close)} farther; "
+            f"{candidate_count} candidates searched in {elapsed_ms:.1f}ms)"
+        )
+
+
+def find_theme_palette(colors: dict[str, str], palette_paths: list[Path]) -> Path | None:
+    """Find the palette file a theme was generated from (all its colors match the theme)."""
+    for palette_path in palette_paths:
+        with palette_path.open() as f:
+            palette = json.load(f)
+        entries = {key: value for key, value in palette.items() if not key.startswith("_")}
+        if entries and all(colors.get(key, "").lower() == v.lower() for key, v in entries.items()):
+            return palette_path
+    return None
+
+
+def fix_theme_contrast(
+    theme_paths: list[Path],
+    pairs_path: Path | None,
+    underlays: list[str] | None,
+    output_path: Path,
+) -> list[str]:
+    """Suggest the nearest compliant colors for failing role pairs and write a patch.
+
+    Returns:
+        Issues for colors that could not be fixed or patched automatically
+    """
+    try:
+        from . import contrast_fix, contrast_matrix  # noqa: PLC0415
+    except ImportError:
+        print("❌ --fix requires NumPy (pip install numpy)")
+        sys.exit(1)
+
+    palette_paths = discover_palettes()
+    role_pairs = (
+        contrast_matrix.load_role_pairs(pairs_path)
+        if pairs_path
+        else contrast_matrix.DEFAULT_ROLE_PAIRS
+    )
+
+    # Collect every failure of every theme so they are solved in one batch
+    requests: list[contrast_fix.FixRequest] = []
+    for theme_path in get_themes_to_check(theme_paths):
+        colors = contrast_matrix.load_theme_colors(theme_path)
+        palette_path = find_theme_palette(colors, palette_paths)
+        palette = json.loads(palette_path.read_text()) if palette_path else {}
+        matrix = contrast_matrix.ContrastMatrix.from_colors(colors, underlays)
+        # Translucent colors are solved as displayed over every underlay, like the matrix
+        surfaces = tuple(colors[underlay] for underlay in matrix.underlays)
+
+        for violation in matrix.violations(role_pairs):
+            if violation.adjust == "fg":
+                name, other = violation.fg, colors[violation.bg]
+            else:
+                name, other = violation.bg, colors[violation.fg]
+            # Palette colors and literal derived colors are fixed in the palette file
+            defined = name in palette or name in palette.get("_derived", {})
+            source = palette_path if defined else None
+            requests.append(
+                contrast_fix.FixRequest(
+                    name,
+                    colors[name],
+                    other,
+                    violation.min_ratio,
+                    source,
+                    violation.adjust,
+                    surfaces,
+                )
+            )
+
+    PROFILER.count("fix requests", len(requests))
+    with PROFILER.stage("suggest fixes", requests=len(requests)):
+        fixes = contrast_fix.suggest_fixes(requests)
+    with PROFILER.stage("build patch"):
+        patch, unpatched = contrast_fix.build_patch(fixes, PROJECT_ROOT)
+
+    print("\nContrast fixes:")
+    issues = []
+    for fix in fixes:
+        if fix.new is None:
+            issues.append(f"  ❌ {fix.name}: no lightness of {fix.old} meets every pair")
+        elif fix in unpatched:
+            issues.append(f"  ⚠️  {fix.name}: derived color, adjust its source to {fix.new}")
+        else:
+            print(f"  🔧 {fix.name}: {fix.old} → {fix.new}")
+    for issue in issues:
+        print(issue)
+    if not fixes:
+        print("  ✅ No fixes needed")
+
+    if patch:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(patch)
+        print(f"\n✓ Wrote {len(fixes) - len(unpatched)} fix(es) to {output_path}")
+        print(f"  Apply with: git apply {output_path}")
+
+    return issues
+
+
+def audit_generated_themes(args: argparse.Namespace, palette_paths: list[Path]) -> list[str]:
+    """Run the optional NumPy audits (--apca, --cvd, --matrix, --duplicates, --snap, --fix)."""
+    issues: list[str] = []
+    if args.apca:
+        issues.extend(validate_contrast_metrics(palette_paths, args.schemes))
+
+    if args.cvd:
+        issues.extend(validate_palettes_vision(palette_paths))
+
+    if args.matrix:
+        issues.extend(validate_theme_matrices(args.themes, args.pairs, args.underlays))
+
+    if args.duplicates is not None:
+        report_near_duplicates(args.themes, args.duplicates)
+
+    if args.snap is not None:
+        report_palette_snaps(palette_paths, args.snap)
+
+    if args.fix:
+        issues.extend(
+            fix_theme_contrast(args.themes, args.pairs, args.underlays, args.fix_output)
+        )
+    return issues
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(prog="monokai-islands validate", description=__doc__)
+    add_palette_arguments(parser, "validate")
+    parser.add_argument(
+        "--scheme",
+        dest="schemes",
+        action="append",
+        type=Path,
+        default=[],
+        help="Editor color scheme XML to validate (default: all bundled schemes)",
+    )
+    parser.add_argument(
+        "--stylesheet",
+        dest="stylesheets",
+        action="append",
+        type=Path,
+        default=[],
+        help="Markdown preview stylesheet to validate (default: all generated stylesheets)",
+    )
+    parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Also audit the full contrast matrix of generated themes (requires NumPy)",
+    )
+    parser.add_argument(
+        "--apca",
+        action="store_true",
+        help="Also report palette and syntax pairs with APCA Lc next to WCAG 2.1, with "
+        "per-metric thresholds (requires NumPy)",
+    )
+    parser.add_argument(
+        "--cvd",
+        action="store_true",
+        help="Also check palette contrast and accent distinguishability under simulated "
+        "protanopia, deuteranopia and tritanopia (requires NumPy)",
+    )
+    parser.add_argument(
+        "--duplicates",
+        nargs="?",
+        type=float,
+        const=0.02,
+        metavar="THRESHOLD",
+        help="Also report near-duplicate theme and scheme colors closer than this OKLab "
+        "distance, with merge suggestions (default: 0.02, requires NumPy)",
+    )
+    parser.add_argument(
+        "--snap",
+        nargs="?",
+        type=float,
+        const=0.02,
+        metavar="MAX_DISTANCE",
+        help="Also report derived, scheme and stylesheet hex literals within this OKLab "
+        "distance of a palette-derived color, with a replacement expression "
+        "(default: 0.02, requires NumPy)",
+    )
+    parser.add_argument(
+        "--theme",
+        dest="themes",
+        action="append",
+        type=Path,
+        default=[],
+        help="Generated theme JSON to audit with --matrix or --duplicates "
+        "(default: all generated themes)",
+    )
+    parser.add_argument(
+        "--underlay",
+        dest="underlays",
+        action="append",
+        help="Theme color translucent colors are composited over "
+        "(default: background, dark1, popup_bg)",
+    )
+    parser.add_argument(
+        "--fix",
+        action="store_true",
+        help="Suggest the nearest compliant colors for failing --matrix pairs (requires NumPy)",
+    )
+    parser.add_argument(
+        "--fix-output",
+        type=Path,
+        default=BUILD_DIR / "contrast-fixes.patch",
+        help="Where --fix writes its patch (default: build/contrast-fixes.patch)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=BUILD_DIR / "profile" / "validate-contrast.trace.json",
+        metavar="TRACE",
+        help="Time each stage and write a Chrome trace "
+        "(default: build/profile/validate-contrast.trace.json)",
+    )
+    parser.add_argument(
+        "--pairs",
+        type=Path,
+        help='JSON list of {"fg": glob, "bg": glob, "min": ratio} role pairs for --matrix',
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Validate contrast ratios for all palettes."""
+    args = parse_args(argv)
+    PROFILER.enabled = args.profile is not None
+    all_issues: list[str] = []
+
+    # Validate palettes
+    palette_paths = resolve_palettes(args.palettes, args.all)
+    for palette_path in palette_paths:
+        palette_name = palette_path.stem
+        if not palette_path.exists():
+            print(f"⚠️  Skipping {palette_name}: file not found")
+            continue
+
+        with PROFILER.stage("validate palette", palette=palette_name):
+            with palette_path.open() as f:
+                palette = json.load(f)
+            issues = validate_palette(palette)
+        print_validation_result(palette_name, issues)
+        all_issues.extend(issues)
+
+    # Validate diff colors
+    diff_colors = {
+        "diff_inserted": "#2d5038",
+        "diff_deleted": "#582838",
+        "diff_modified": "#2d4858",
+        "diff_conflict": "#583825",
+    }
+    with PROFILER.stage("validate diff colors"):
+        diff_issues = validate_diff_colors(diff_colors, "#7B8590", "#fcfcfa")
+    print_validation_result("Diff backgrounds", diff_issues)
+    all_issues.extend(diff_issues)
+
+    # Validate syntax colors from the editor schemes
+    for scheme_path in get_schemes_to_check(args.schemes):
+        with PROFILER.stage("validate editor scheme", scheme=scheme_path.name):
+            sections = validate_editor_scheme(scheme_path)
+        for section, issues in sections:
+            print_validation_result(f"{scheme_path.stem}: {section}", issues)
+            all_issues.extend(issues)
+
+    # Validate UI color references and foreground/background surfaces of generated themes
+    for theme_path in get_themes_to_check(args.themes):
+        with PROFILER.stage("validate UI references", theme=theme_path.name):
+            sections, warnings, unused = validate_ui_references(theme_path)
+        for section, issues in sections:
+            theme_name = theme_path.name.removesuffix(".theme.json")
+            print_validation_result(f"{theme_name}: {section}", issues)
+            all_issues.extend(issues)
+        for warning in warnings:
+            print(warning)
+        if unused:
+            print(f"  ⚠️  Unused colors (not an error): {', '.join(unused)}")
+
+    # Validate Markdown preview stylesheets
+    for stylesheet_path in get_stylesheets_to_check(args.stylesheets):
+        with PROFILER.stage("validate stylesheet", stylesheet=stylesheet_path.name):
+            issues = validate_stylesheet(stylesheet_path)
+        print_validation_result(f"{stylesheet_path.stem}: Stylesheet colors", issues)
+        all_issues.extend(issues)
+
+    all_issues.extend(audit_generated_themes(args, palette_paths))
+
+    if args.profile is not None:
+        PROFILER.report(args.profile)
+
+    # Exit with error if any issues found
+    if all_issues:
+        print(f"\n❌ Found {len(all_issues)} contrast issues")
+        sys.exit(1)
+
+    print("\n✅ All validations pass")
@@ -0,0 +1,238 @@
+"""Synthesize palette variants from a base palette (requires NumPy).
+
+Every variant is a perceptual transform of the base palette in OKLCH: an optional light
+counterpart (neutral lightness mirrored), a lightness shift of the surfaces and a
+contrast boost that moves foregrounds (accents, text, comments) along lightness until they
+meet their ratio against the variant's background. All variants are transformed, boosted
+and screened on their palette pairs together as array operations; the theme generated from
+each variant is then screened with the UI surface and contrast matrix checks of validate.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .color_space import (
+    contrast_ratio,
+    hex_to_rgba_array,
+    luminance,
+    oklab_to_oklch,
+    oklab_to_srgb,
+    oklch_to_oklab,
+    rgb_array_to_hex,
+    srgb_to_linear,
+    srgb_to_oklab,
+)
+from .contrast_fix import search_lightness
+from .contrast_matrix import DEFAULT_ROLE_PAIRS, validate_colors
+from .generate import generate_theme_json
+from .paths import base_derived_colors
+from .validate import PALETTE_PAIRS, validate_ui_theme
+
+# Editor and chrome backgrounds, shifted by the surface lightness shift
+SURFACE_KEYS = ("background", "dark1", "dark2", "dimmed5")
+
+# Grays whose lightness is mirrored for the light counterpart
+NEUTRAL_KEYS = (*SURFACE_KEYS, "text", "dimmed1", "dimmed2", "dimmed3", "dimmed4")
+
+ACCENT_KEYS = tuple(f"accent{i}" for i in range(1, 7))
+
+# Non-accent foregrounds boosted to a fixed ratio against the background
+FOREGROUND_FLOORS = {"text": 4.5, "dimmed3": 4.5}
+
+# Derived literals named like this are foregrounds (e.g., "project_tab_inactive_text"):
+# mirrored but not shifted with the surfaces, and boosted like "text"
+DERIVED_FOREGROUND_SUFFIX = "_text"
+
+
+class VariantSpec(NamedTuple):
+    """Transform producing one variant from the base palette."""
+
+    light: bool
+    surface_shift: float
+    accent_ratio: float
+
+    @property
+    def name(self) -> str:
+        """Variant name (e.g., "dark-s-0.02-a4.5")."""
+        mode = "light" if self.light else "dark"
+        return f"{mode}-s{self.surface_shift:+.2f}-a{self.accent_ratio:g}"
+
+    @property
+    def label(self) -> str:
+        """Readable variant name (e.g., "Dark (surfaces -0.02, accents 4.5:1)")."""
+        mode = "Light" if self.light else "Dark"
+        return f"{mode} (surfaces {self.surface_shift:+.2f}, accents {self.accent_ratio:g}:1)"
+
+
+class SynthesizedVariant(NamedTuple):
+    """Synthesized palette and "_derived" block with the screening checks they fail."""
+
+    spec: VariantSpec
+    palette: dict[str, str]
+    derived: dict[str, object]
+    issues: list[str]
+
+    @property
+    def passed(self) -> bool:
+        """Whether the palette and its generated theme pass every screening check."""
+        return not self.issues
+
+
+def synthesize(base: dict, specs: list[VariantSpec]) -> list[SynthesizedVariant]:
+    """Synthesize and screen one palette per spec.
+
+    Literal colors of the derived block (tab, tooltip, input and hover surfaces) are
+    transformed with the surfaces: mirrored for the light counterpart and shifted (derived
+    foregrounds are boosted instead). The other derived colors follow from the
+    transformed palette.
+
+    Args:
+        base: Base palette ("_derived" is its derived block, or the base palette's;
+            other metadata keys starting with "_" are ignored)
+        specs: Variant transforms to apply
+    """
+    names = [key for key in base if not key.startswith("_")]
+    index = {name: i for i, name in enumerate(names)}
+    derived = base.get("_derived", base_derived_colors())
+    # Fully transparent literals have no color to transform
+    literals = [
+        name
+        for name, expression in derived.items()
+        if isinstance(expression, str)
+        and expression.startswith("#")
+        and hex_to_rgba_array([expression])[0, 3]
+    ]
+    rgba = hex_to_rgba_array([base[name] for name in names] + [derived[n] for n in literals])
+    lch = oklab_to_oklch(srgb_to_oklab(rgba[:, :3]))
+    extra = list(range(len(names), len(rgba)))
+
+    # Tile the base colors once per variant
+    lch = np.repeat(lch[None, :, :], len(specs), axis=0)
+    light = np.array([spec.light for spec in specs])
+    shift = np.array([spec.surface_shift for spec in specs])
+
+    # The palette's neutral range is the mirror axis for derived literals too
+    neutral = [index[name] for name in NEUTRAL_KEYS if name in index]
+    if neutral:
+        lightness = lch[:, neutral, 0]
+        axis = lightness.min(axis=1, keepdims=True) + lightness.max(axis=1, keepdims=True)
+        mirror = [*neutral, *extra]
+        lch[:, mirror, 0] = np.where(
+            light[:, None], np.clip(axis - lch[:, mirror, 0], 0.0, 1.0), lch[:, mirror, 0]
+        )
+
+    columns = index | dict(zip(literals, extra, strict=True))
+    foregrounds = {name: 4.5 for name in literals if name.endswith(DERIVED_FOREGROUND_SUFFIX)}
+    surfaces = [index[name] for name in SURFACE_KEYS if name in index]
+    surfaces += [columns[name] for name in literals if name not in foregrounds]
+    lch[:, surfaces, 0] = np.clip(lch[:, surfaces, 0] + shift[:, None], 0.0, 1.0)
+
+    rgb = oklab_to_srgb(oklch_to_oklab(lch))
+    if "background" in index:
+        rgb = boost_foregrounds(rgb, columns, specs, FOREGROUND_FLOORS | foregrounds)
+
+    hex_colors = [rgb_array_to_hex(colors) for colors in rgb]
+    issues = screen(rgb[:, : len(names)], index)
+
+    alphas = ["" if alpha == 0xFF else f"{alpha:02x}" for alpha in rgba[len(names) :, 3]]
+    variants = []
+    for spec, colors, palette_issues in zip(specs, hex_colors, issues, strict=True):
+        palette = dict(zip(names, colors[: len(names)], strict=True))
+        variant_derived = dict(derived)
+        for name, color, alpha in zip(literals, colors[len(names) :], alphas, strict=True):
+            variant_derived[name] = color + alpha
+        theme_issues = screen_theme(spec, palette, variant_derived)
+        variants.append(
+            SynthesizedVariant(spec, palette, variant_derived, palette_issues + theme_issues)
+        )
+    return variants
+
+
+def boost_foregrounds(
+    rgb: np.ndarray,
+    index: dict[str, int],
+    specs: list[VariantSpec],
+    floors: dict[str, float] = FOREGROUND_FLOORS,
+) -> np.ndarray:
+    """Move foregrounds along OKLCH lightness until they meet their background ratio.
+
+    Accents are boosted to each spec's accent ratio and the colors in floors to their
+    fixed ratio. Foregrounds of every variant are solved in one batched search; colors
+    that already pass stay (nearly) unchanged and colors with no feasible lightness are
+    kept as is.
+    """
+    targets = [(index[name], None) for name in ACCENT_KEYS if name in index]
+    targets += [(index[name], ratio) for name, ratio in floors.items() if name in index]
+    if not targets:
+        return rgb
+
+    background = rgb_array_to_hex(rgb[:, index["background"]])
+    colors, others, ratios, slots = [], [], [], []
+    for v, spec in enumerate(specs):
+        variant_colors = rgb_array_to_hex(rgb[v])
+        for i, ratio in targets:
+            colors.append(variant_colors[i])
+            others.append(background[v])
+            ratios.append(spec.accent_ratio if ratio is None else ratio)
+            slots.append((v, i))
+
+    fixed, feasible = search_lightness(colors, others, np.array(ratios))
+    boosted = rgb.copy()
+    for (v, i), color, ok in zip(slots, fixed, feasible, strict=True):
+        if ok:
+            boosted[v, i] = color
+    return boosted
+
+
+def screen(rgb: np.ndarray, index: dict[str, int]) -> list[list[str]]:
+    """Check the palette pairs of validate.py for every variant at once.
+
+    Returns:
+        Issues per variant, in the same format as validate.py
+    """
+    lum = luminance(srgb_to_linear(rgb))
+    pairs = [(fg, bg, ratio) for fg, bg, ratio in PALETTE_PAIRS if fg in index and bg in index]
+    if not pairs:
+        return [[] for _ in rgb]
+
+    fg = lum[:, [index[fg] for fg, _, _ in pairs]]
+    bg = lum[:, [index[bg] for _, bg, _ in pairs]]
+    ratios = contrast_ratio(fg, bg)
+
+    issues: list[list[str]] = []
+    for variant_ratios in ratios:
+        issues.append(
+            [
+                f"  ❌ {fg_key} on {bg_key}: {ratio:.2f}:1 (required: {min_ratio}:1)"
+                for (fg_key, bg_key, min_ratio), ratio in zip(pairs, variant_ratios, strict=True)
+                if ratio < min_ratio
+            ]
+        )
+    return issues
+
+
+def screen_theme(spec: VariantSpec, palette: dict[str, str], derived: dict) -> list[str]:
+    """Check the theme generated from a variant (UI surfaces and the contrast matrix).
+
+    Palette pairs only cover base colors; this also covers the derived colors (inputs,
+    popups, diff and file backgrounds) and the UI keys that use them.
+
+    Returns:
+        Issues of the generated theme, in the same format as validate.py
+    """
+    theme_palette = {
+        **palette,
+        "_dark": not spec.light,
+        "_names": {spec.name: spec.label},
+        "_derived": derived,
+    }
+    try:
+        theme = generate_theme_json(theme_palette, spec.name)
+    except ValueError as e:
+        return [f"  ❌ theme: {e}"]
+
+    sections, _, _ = validate_ui_theme(theme)
+    issues = [issue for _, section_issues in sections for issue in section_issues]
+    matrix_issues, _ = validate_colors(theme["colors"], DEFAULT_ROLE_PAIRS)
+    return issues + matrix_issues
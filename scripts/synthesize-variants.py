@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Synthesize palette variants from a base palette (requires NumPy).
+
+Builds every combination of mode (dark, light counterpart), surface lightness shift and
+accent contrast target, screens them (palette pairs in one batch, then each generated
+theme) and writes the passing ones as palette files that the "generate" command accepts
+directly.
+"""
+
+import argparse
+from itertools import product
+import json
+from pathlib import Path
+import sys
+import time
+
+from monokai_islands.paths import BUILD_DIR, DEFAULT_PALETTE_PATH
+
+
+def parse_floats(value: str) -> list[float]:
+    """Parse a comma-separated list of numbers."""
+    return [float(item) for item in value.split(",") if item.strip()]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "palette",
+        nargs="?",
+        type=Path,
+        default=DEFAULT_PALETTE_PATH,
+        help="Base palette (default: palettes/monokai-dark.json)",
+    )
+    parser.add_argument(
+        "--modes",
+        type=lambda value: [v.strip() for v in value.split(",") if v.strip()],
+        default=["dark", "light"],
+        help='Comma-separated modes: "dark" keeps the base, "light" mirrors it '
+        "(default: dark,light)",
+    )
+    parser.add_argument(
+        "--surface-shifts",
+        type=parse_floats,
+        default=[-0.04, -0.02, 0.0, 0.02, 0.04],
+        help="Comma-separated OKLCH lightness shifts for surfaces (default: -0.04,...,0.04)",
+    )
+    parser.add_argument(
+        "--accent-ratios",
+        type=parse_floats,
+        default=[3.0, 4.5],
+        help="Comma-separated contrast ratios accents are boosted to (default: 3,4.5)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=BUILD_DIR / "variants",
+        help="Where palette files are written (default: build/variants)",
+    )
+    parser.add_argument(
+        "--keep-failing",
+        action="store_true",
+        help="Also write variants that fail screening",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Synthesize, screen and write palette variants."""
+    args = parse_args()
+    unknown = sorted(set(args.modes) - {"dark", "light"})
+    if unknown:
+        print(f"❌ Unknown modes: {', '.join(unknown)}")
+        sys.exit(1)
+
+    # NumPy is only needed here, so import lazily to keep --help fast
+    from monokai_islands.variant_synth import VariantSpec, synthesize  # noqa: PLC0415
+
+    with args.palette.open() as f:
+        base = json.load(f)
+
+    specs = [
+        VariantSpec(mode == "light", shift, ratio)
+        for mode, shift, ratio in product(args.modes, args.surface_shifts, args.accent_ratios)
+    ]
+    start = time.perf_counter()
+    variants = synthesize(base, specs)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for variant in variants:
+        name = variant.spec.name
+        if not variant.passed:
+            print(f"❌ {name}: fails screening")
+            for issue in variant.issues:
+                print(issue)
+            if not args.keep_failing:
+                continue
+
+        palette = {
+            "_comment": f"Synthesized from {args.palette.name} ({name})",
+            "_variants": [name],
+            "_names": {name: variant.spec.label},
+            "_dark": not variant.spec.light,
+            **variant.palette,
+            "_derived": variant.derived,
+        }
+        output_path = args.output_dir / f"monokai-{name}.json"
+        with output_path.open("w") as f:
+            json.dump(palette, f, indent=2)
+            f.write("\n")
+        written += 1
+        if variant.passed:
+            print(f"✓ {name}: {output_path}")
+
+    passed = sum(variant.passed for variant in variants)
+    print(
+        f"\n✓ Synthesized {len(variants)} variant(s) in {elapsed:.0f}ms: {passed} passed "
+        f"screening, {written} written to {args.output_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
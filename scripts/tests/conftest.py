@@ -0,0 +1,20 @@
+"""Shared pytest setup: import the monokai_islands package from scripts/."""
+
+import importlib.util
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Tests of the NumPy-backed modules, skipped when NumPy is not installed
+NUMPY_TESTS = [
+    "test_color_clusters.py",
+    "test_color_snap.py",
+    "test_contrast_fix.py",
+    "test_contrast_metrics.py",
+    "test_theme_preview.py",
+    "test_variant_synth.py",
+]
+
+if importlib.util.find_spec("numpy") is None:
+    collect_ignore = NUMPY_TESTS
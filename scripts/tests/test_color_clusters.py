@@ -0,0 +1,46 @@
+"""Tests for near-duplicate color clustering."""
+
+import numpy as np
+
+from monokai_islands.color_clusters import distance_matrix, leader_clusters
+
+
+def line_distances(positions: list[float]) -> np.ndarray:
+    """Distances between points on a line."""
+    points = np.array(positions)
+    return np.abs(points[:, None] - points[None, :])
+
+
+def test_leader_takes_every_color_within_threshold() -> None:
+    """Colors closer than the threshold to a leader join its cluster."""
+    distances = line_distances([0.0, 0.01, 0.5, 0.505])
+
+    assert leader_clusters(distances, [0, 1, 2, 3], 0.02) == [[0, 1], [2, 3]]
+
+
+def test_clusters_do_not_chain() -> None:
+    """A color close to a member but not to the leader starts its own cluster."""
+    distances = line_distances([0.0, 0.015, 0.03])
+
+    assert leader_clusters(distances, [0, 1, 2], 0.02) == [[0, 1], [2]]
+
+
+def test_order_picks_the_leaders() -> None:
+    """Leaders are taken in priority order, so the order decides which colors merge."""
+    distances = line_distances([0.0, 0.015, 0.03])
+
+    assert leader_clusters(distances, [1, 0, 2], 0.02) == [[1, 0, 2]]
+
+
+def test_single_colors_are_their_own_cluster() -> None:
+    """Colors farther than the threshold from every other color stay alone."""
+    distances = line_distances([0.0, 0.5, 1.0])
+
+    assert leader_clusters(distances, [2, 0, 1], 0.02) == [[2], [0], [1]]
+
+
+def test_alpha_separates_otherwise_equal_colors() -> None:
+    """A translucent overlay is not a duplicate of the opaque color it is made from."""
+    distances = distance_matrix(["#ff0000", "#ff0001", "#ff000080"])
+
+    assert leader_clusters(distances, [0, 1, 2], 0.02) == [[0, 1], [2]]
@@ -0,0 +1,134 @@
+"""Tests for the derived color graph and its invalidation on palette changes."""
+
+import pytest
+
+from monokai_islands.color_graph import ColorGraph
+from monokai_islands.color_table import parse_hex
+
+BASE = {"background": "#202020", "accent": "#ff0000", "spare": "#00ff00"}
+
+DERIVED = {
+    "panel": {"lighten": ["background", 0.5]},
+    "badge": {"mix": ["panel", "accent", 0.5]},
+    "badge_alpha": {"alpha": ["badge", "80"]},
+    "focus": "accent",
+}
+
+
+def test_evaluates_derived_colors_in_declaration_order() -> None:
+    """Derived colors follow their expressions, nested through other derived colors."""
+    graph = ColorGraph(BASE, DERIVED)
+
+    assert list(graph.to_dict()) == list(DERIVED)
+    assert graph["panel"] == parse_hex("#8f8f8f")
+    assert graph["badge"] == parse_hex("#c74848")
+    assert graph["badge_alpha"] == parse_hex("#c7484880")
+    assert graph["focus"] == parse_hex("#ff0000")
+
+
+def test_reads_evaluate_lazily_once() -> None:
+    """Reading a color evaluates only it and its dependencies, and memoizes them."""
+    graph = ColorGraph(BASE, DERIVED)
+    assert graph.evaluations == 0
+
+    assert graph["badge_alpha"] == parse_hex("#c7484880")
+    assert graph.evaluations == 3  # badge_alpha, badge, panel; focus is never read
+
+    graph["badge"]
+    graph.to_dict()
+    assert graph.evaluations == 4
+
+
+def test_literals_and_nested_expressions() -> None:
+    """Expressions nest, and literals keep their alpha."""
+    derived = {
+        "overlay": "#00000080",
+        "hover": {"darken": [{"mix": ["background", "accent", 0.5]}, 0.5]},
+    }
+    graph = ColorGraph(BASE, derived)
+
+    assert graph["overlay"] == parse_hex("#00000080")
+    assert graph["hover"] == parse_hex("#480808")
+
+
+def test_dependencies_follow_derived_colors() -> None:
+    """A color's dependencies include every color it reads through other derived ones."""
+    graph = ColorGraph(BASE, DERIVED)
+
+    assert graph.dependencies("badge_alpha") == {"badge", "panel", "background", "accent"}
+    assert graph.dependencies("background") == set()
+
+
+@pytest.mark.parametrize(
+    ("derived", "message"),
+    [
+        ({"a": "b", "b": {"lighten": ["a", 0.1]}}, "circular color reference: a -> b -> a"),
+        ({"a": "missing"}, "reference unknown colors: missing"),
+        ({"background": "accent"}, "shadow palette colors: background"),
+        ({"a": {"lighten": ["accent", 1.5]}}, "a: lighten: expected a factor"),
+        ({"a": {"alpha": ["accent", "8"]}}, 'a: alpha: expected a hex byte like "80"'),
+        ({"a": {"mix": ["accent", 0.5]}}, "a: mix takes 3 arguments"),
+        ({"a": {"blend": ["accent", "spare"]}}, "a: invalid color expression"),
+    ],
+)
+def test_rejects_invalid_blocks(derived: dict, message: str) -> None:
+    """Cycles, unknown or shadowed colors and malformed expressions fail up front."""
+    with pytest.raises(ValueError, match=message):
+        ColorGraph(BASE, derived)
+
+
+def test_update_invalidates_only_dependents() -> None:
+    """Changing a palette color re-evaluates the derived colors depending on it."""
+    graph = ColorGraph(BASE, DERIVED)
+    graph.to_dict()
+    evaluations = graph.evaluations
+
+    invalidated = graph.update({**BASE, "accent": "#0000ff"})
+
+    assert invalidated == {"badge", "badge_alpha", "focus"}
+    assert graph["badge"] == parse_hex("#4848c7")
+    assert graph["focus"] == parse_hex("#0000ff")
+    graph.to_dict()
+    assert graph.evaluations == evaluations + len(invalidated)
+
+
+def test_update_without_changes_invalidates_nothing() -> None:
+    """Updating with identical colors (in any case) keeps every memoized color."""
+    graph = ColorGraph(BASE, DERIVED)
+    graph.to_dict()
+
+    assert graph.update({**BASE, "accent": "#FF0000"}) == set()
+
+
+def test_update_drops_removed_palette_colors() -> None:
+    """Palette colors removed from the new base are dropped from the graph."""
+    graph = ColorGraph(BASE, DERIVED)
+    graph.to_dict()
+
+    invalidated = graph.update({"background": "#202020", "accent": "#ff0000"})
+
+    assert invalidated == set()
+    assert "spare" not in graph
+    assert "spare" not in graph.base
+
+
+def test_update_rejects_removing_referenced_colors() -> None:
+    """Removing a color derived colors reference fails and leaves the graph unchanged."""
+    graph = ColorGraph(BASE, DERIVED)
+    before = graph.to_dict()
+
+    with pytest.raises(ValueError, match="unknown colors: accent"):
+        graph.update({"background": "#303030"})
+
+    assert graph.base == {name: parse_hex(value) for name, value in BASE.items()}
+    assert graph.to_dict() == before
+
+
+def test_update_rejects_shadowing_derived_colors() -> None:
+    """A palette color with a derived color's name fails and leaves the graph unchanged."""
+    graph = ColorGraph(BASE, DERIVED)
+
+    with pytest.raises(ValueError, match="shadow palette colors: focus"):
+        graph.update({**BASE, "focus": "#ffffff"})
+
+    assert "focus" not in graph.base
@@ -0,0 +1,26 @@
+"""Tests for the UI key -> color name -> color index of a generated theme."""
+
+from monokai_islands.color_refs import ColorIndex
+
+THEME = {
+    "colors": {"text": "#fcfcfa", "notification_bg_90": "#3a363ae5", "unused_gray": "#727072"},
+    "ui": {
+        "*": {"foreground": "text", "arc": 2},
+        "Notification": {"background": "notification_bg_90", "borderInsets": "3,3,1,3"},
+        "Link": {"foreground": "#78dce8", "hoverForeground": "lnk_hover"},
+    },
+}
+
+
+def test_flat_view_resolves_every_color_key() -> None:
+    """Named and inline colors resolve to packed colors; literals and typos stay out."""
+    index = ColorIndex.from_theme(THEME)
+
+    assert index.flat() == {
+        "*.foreground": 0xFCFCFAFF,
+        "Notification.background": 0x3A363AE5,
+        "Link.foreground": 0x78DCE8FF,
+    }
+    assert index.literals == {"*.arc": 2, "Notification.borderInsets": "3,3,1,3"}
+    assert index.dangling == {"Link.hoverForeground": "lnk_hover"}
+    assert index.unused() == ["unused_gray"]
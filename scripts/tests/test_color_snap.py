@@ -0,0 +1,56 @@
+"""Tests for snapping off-palette literals to palette-derived colors."""
+
+import json
+
+from monokai_islands.color_graph import ColorGraph
+from monokai_islands.color_snap import DEFAULT_MAX_DISTANCE, CandidateIndex
+from monokai_islands.color_table import parse_hex
+from monokai_islands.paths import DEFAULT_PALETTE_PATH, base_derived_colors
+from monokai_islands.validate import snap_palette_literals
+
+
+def test_white_and_black_snap_exactly() -> None:
+    """Full lighten and darken factors reach white and black."""
+    index = CandidateIndex({"background": parse_hex("#2d2a2e")}, {})
+
+    white, black = index.snap({parse_hex("#ffffff"): ["a"], parse_hex("#000000"): ["b"]})
+
+    assert (white.candidate.expression(), white.distance) == ({"lighten": ["background", 1.0]}, 0)
+    assert (black.candidate.expression(), black.distance) == ({"darken": ["background", 1.0]}, 0)
+
+
+def test_derived_color_is_not_snapped_to_its_readers() -> None:
+    """A literal is never replaced by a derived color that reads the literal's color."""
+    base = {"background": parse_hex("#000000")}
+    derived = {"border": parse_hex("#123456"), "alias": parse_hex("#123456")}
+    index = CandidateIndex(base, {"alias": derived["alias"]}, {"alias": {"border"}})
+
+    [snap] = index.snap({derived["border"]: ["border"]})
+
+    assert snap.candidate.first != "alias"
+
+
+def test_applying_every_suggestion_keeps_the_graph_valid() -> None:
+    """Derived literals replaced by their suggestions still form an acyclic graph."""
+    with DEFAULT_PALETTE_PATH.open() as f:
+        palette = json.load(f)
+    derived = dict(palette.get("_derived", base_derived_colors()))
+
+    snaps, _ = snap_palette_literals(palette)
+    applied = 0
+    for snap in snaps:
+        if snap.distance >= DEFAULT_MAX_DISTANCE:
+            continue
+        for source in snap.sources:
+            if source in derived:
+                derived[source] = snap.candidate.expression(parse_hex(snap.literal) & 0xFF)
+                applied += 1
+    assert applied
+
+    graph = ColorGraph.from_palette({**palette, "_derived": derived}, {})
+    colors = graph.to_dict()
+
+    for snap in snaps:
+        for source in snap.sources:
+            if source in derived and snap.distance < DEFAULT_MAX_DISTANCE:
+                assert colors[source] & 0xFF == parse_hex(snap.literal) & 0xFF
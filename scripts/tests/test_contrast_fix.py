@@ -0,0 +1,45 @@
+"""Tests for the lightness search of contrast fix suggestions."""
+
+import pytest
+
+from monokai_islands.contrast_fix import FixRequest, suggest_fixes
+from monokai_islands.contrast_matrix import ContrastMatrix
+
+UNDERLAYS = {"background": "#2d2a2e", "dark1": "#221f22", "popup_bg": "#403e41"}
+
+
+def displayed_ratio(fg: str, bg: str) -> float:
+    """Worst ratio of a pair over the underlays, as the contrast matrix audits it."""
+    colors = UNDERLAYS | {"fg": fg, "bg": bg}
+    matrix = ContrastMatrix.from_colors(colors)
+    return float(matrix.ratios[matrix.names.index("fg"), matrix.names.index("bg")])
+
+
+def test_translucent_background_fix_is_measured_over_its_underlays() -> None:
+    """A translucent background only darkens as far as its worst underlay needs."""
+    request = FixRequest("notification_bg", "#b0a8b0e5", "#fcfcfa", 4.5, None, "bg")
+    [opaque] = suggest_fixes([request])
+    [fix] = suggest_fixes([request._replace(underlays=tuple(UNDERLAYS.values()))])
+
+    assert fix.new.endswith("e5")
+    assert displayed_ratio("#fcfcfa", fix.new) == pytest.approx(4.5, abs=0.1)
+    assert displayed_ratio("#fcfcfa", fix.new) >= 4.5
+    # Solved as an opaque color, the fix overshoots
+    assert displayed_ratio("#fcfcfa", opaque.new) > displayed_ratio("#fcfcfa", fix.new) + 0.3
+
+
+def test_translucent_foreground_fix_is_measured_over_its_underlays() -> None:
+    """A translucent foreground passes as displayed, or is reported as unfixable."""
+    request = FixRequest("muted", "#a0a0a0b3", "#2d2a2e", 7.0, None, "fg")
+    unfixable = FixRequest("faint", "#fcfcfa80", "#b0a8b0", 4.5, None, "fg")
+    underlays = tuple(UNDERLAYS.values())
+
+    [opaque] = suggest_fixes([request])
+    fix, impossible = suggest_fixes(
+        [request._replace(underlays=underlays), unfixable._replace(underlays=underlays)]
+    )
+
+    assert displayed_ratio(fix.new, "#2d2a2e") >= 7.0
+    assert impossible.new is None
+    # Solved as an opaque color, the fix still fails once blended
+    assert displayed_ratio(opaque.new, "#2d2a2e") < 7.0
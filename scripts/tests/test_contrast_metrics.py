@@ -0,0 +1,51 @@
+"""Tests for the WCAG 2.1 and APCA contrast metrics."""
+
+import pytest
+
+from monokai_islands.contrast_metrics import APCA, WCAG, evaluate
+
+# Reference Lc values of the APCA 0.0.98G-4g test suite (text, background, Lc)
+APCA_REFERENCE = [
+    ("#888888", "#ffffff", 63.056469930209424),
+    ("#ffffff", "#888888", -68.54146436644962),
+    ("#000000", "#aaaaaa", 58.146262578561334),
+    ("#aaaaaa", "#000000", -56.24113336839742),
+    ("#112233", "#ddeeff", 91.66830811481631),
+    ("#ddeeff", "#112233", -93.06770049484275),
+    ("#112233", "#444444", 8.32326136957393),
+    ("#444444", "#112233", -7.526878460278154),
+]
+
+
+@pytest.mark.parametrize(("text", "background", "expected"), APCA_REFERENCE)
+def test_apca_matches_reference_values(text: str, background: str, expected: float) -> None:
+    """APCA Lc matches the reference implementation, including its polarity."""
+    colors = {"text": text, "background": background}
+
+    [result] = evaluate([("text", "background", 4.5)], colors, [APCA])
+
+    assert result.values[0] == pytest.approx(expected, abs=1e-9)
+
+
+def test_apca_clips_low_contrast_to_zero() -> None:
+    """Contrast below the low clip (Lc 10 before offsetting) is reported as zero."""
+    colors = {"text": "#777777", "background": "#787878"}
+
+    [result] = evaluate([("text", "background", 4.5)], colors, [APCA])
+
+    assert result.values == (0.0,)
+
+
+def test_metrics_share_one_pass_and_apply_their_thresholds() -> None:
+    """Every metric is evaluated per pair against its own threshold for the requirement."""
+    colors = {"text": "#888888", "background": "#ffffff", "accent": "#767676"}
+    pairs = [("text", "background", 4.5), ("accent", "background", 4.5)]
+
+    results = evaluate(pairs, colors, [WCAG, APCA])
+
+    assert [result.fg for result in results] == ["text", "accent"]
+    text, accent = results
+    assert text.values[0] == pytest.approx(3.54, abs=0.01)
+    assert text.failing == (True, False)  # 3.54:1 < 4.5:1, but Lc 63.1 >= 60
+    assert accent.values[0] == pytest.approx(4.54, abs=0.01)
+    assert accent.failing == (False, False)
@@ -0,0 +1,100 @@
+"""Tests for comparing generated files with their version at a git revision."""
+
+from pathlib import Path
+import shutil
+import subprocess
+
+import pytest
+
+from monokai_islands.diff import compare_revision, main
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def git(repo: Path, *args: str) -> None:
+    """Run a git command in a repository."""
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Repository with generated files committed, then changed in the working tree."""
+    git(tmp_path, "init", "--quiet")
+    git(tmp_path, "config", "user.email", "tests@example.com")
+    git(tmp_path, "config", "user.name", "Tests")
+    themes = tmp_path / "themes"
+    schemes = tmp_path / "schemes"
+    themes.mkdir()
+    schemes.mkdir()
+    (themes / "changed.theme.json").write_text('{"colors": {"text": "#fcfcfa"}}\n')
+    (themes / "same.theme.json").write_text('{"colors": {"text": "#fcfcfa"}}\n')
+    (themes / "notes.txt").write_text("not generated\n")
+    (schemes / "deleted.xml").write_text("<scheme />\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "-c", "commit.gpgsign=false", "commit", "--quiet", "-m", "Generated files")
+
+    (themes / "changed.theme.json").write_text('{"colors": {"text": "#ffffff"}}\n')
+    (schemes / "deleted.xml").unlink()
+    (schemes / "added.xml").write_text("<scheme />\n")
+    return tmp_path
+
+
+def test_pairs_working_tree_with_revision(repo: Path) -> None:
+    """Generated files are paired by path; added and deleted ones have one side None."""
+    pairs = compare_revision("HEAD", [repo / "themes", repo / "schemes"], repo)
+
+    assert pairs == {
+        "schemes/added.xml": (None, b"<scheme />\n"),
+        "schemes/deleted.xml": (b"<scheme />\n", None),
+        "themes/changed.theme.json": (
+            b'{"colors": {"text": "#fcfcfa"}}\n',
+            b'{"colors": {"text": "#ffffff"}}\n',
+        ),
+        "themes/same.theme.json": (
+            b'{"colors": {"text": "#fcfcfa"}}\n',
+            b'{"colors": {"text": "#fcfcfa"}}\n',
+        ),
+    }
+
+
+def test_roots_limit_the_compared_files(repo: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only files under the given roots are compared, whatever the working directory."""
+    monkeypatch.chdir(repo.parent)
+
+    pairs = compare_revision("HEAD", [repo / "schemes"], repo)
+
+    assert sorted(pairs) == ["schemes/added.xml", "schemes/deleted.xml"]
+
+
+def test_roots_outside_the_repository_are_rejected(
+    repo: Path, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    """A root outside the repository is reported instead of failing inside git."""
+    outside = tmp_path_factory.mktemp("outside")
+
+    with pytest.raises(ValueError, match="not inside the repository"):
+        compare_revision("HEAD", [outside], repo)
+
+
+def test_unknown_revision_exits_with_an_error(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """An unknown revision is reported (exit 2), even outside the checkout."""
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--rev", "no-such-revision"])
+
+    assert exit_info.value.code == 2
+    assert "❌ git ls-tree failed" in capsys.readouterr().out
+
+
+def test_missing_paths_exit_with_an_error(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A mistyped path fails instead of comparing nothing."""
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(tmp_path / "old"), str(tmp_path / "new")])
+
+    assert exit_info.value.code == 2
+    assert "No such file or directory" in capsys.readouterr().out
@@ -0,0 +1,53 @@
+"""Tests for resolving editor scheme template colors."""
+
+import pytest
+
+from monokai_islands.editor_scheme import iter_scheme_xml, resolve_scheme
+
+COLORS = {"text": "#fcfcfa", "accent4": "#a9dc76"}
+
+
+def template(colors: dict[str, str], attributes: dict[str, dict]) -> dict:
+    """Build a minimal scheme template."""
+    return {"version": "142", "metaInfo": {}, "colors": colors, "attributes": attributes}
+
+
+def test_names_and_hex_literals_resolve() -> None:
+    """Color names resolve against the theme; hex literals and "" (no color) are kept."""
+    scheme = template(
+        {"CARET_COLOR": "text", "ScrollBar.Mac.thumbColor": "FFFFFF26", "SELECTION_FOREGROUND": ""},
+        {"TEXT": {"FOREGROUND": "accent4", "BACKGROUND": "2d2a2e", "FONT_TYPE": "1"}},
+    )
+
+    resolved = resolve_scheme(scheme, COLORS)
+
+    assert resolved["colors"] == {
+        "CARET_COLOR": "#fcfcfa",
+        "ScrollBar.Mac.thumbColor": "#ffffff26",
+        "SELECTION_FOREGROUND": "",
+    }
+    assert resolved["attributes"]["TEXT"] == {
+        "FOREGROUND": "#a9dc76",
+        "BACKGROUND": "#2d2a2e",
+        "FONT_TYPE": "1",
+    }
+
+
+@pytest.mark.parametrize(
+    ("colors", "attributes", "key"),
+    [
+        ({"CARET_COLOR": "txet"}, {}, "CARET_COLOR"),
+        ({}, {"TEXT": {"FOREGROUND": "acent4"}}, "TEXT.FOREGROUND"),
+        ({}, {"TEXT": {"BACKGROUND": "2d2a2"}}, "TEXT.BACKGROUND"),
+    ],
+)
+def test_unknown_color_names_the_option(
+    colors: dict[str, str], attributes: dict[str, dict], key: str
+) -> None:
+    """A misspelled color name is an error instead of a literal in the output."""
+    scheme = template(colors, attributes)
+
+    with pytest.raises(ValueError, match=rf"option {key}:"):
+        "".join(iter_scheme_xml(scheme, COLORS, "Test"))
+    with pytest.raises(ValueError, match=rf"option {key}:"):
+        resolve_scheme(scheme, COLORS)
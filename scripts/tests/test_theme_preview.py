@@ -0,0 +1,111 @@
+"""Tests for the PNG encoder and decoder and the preview pixel diff."""
+
+from pathlib import Path
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from monokai_islands.color_table import composite, parse_hex, unpack
+from monokai_islands.theme_preview import (
+    DIFF_HIGHLIGHT,
+    PNG_SIGNATURE,
+    Shape,
+    compare_images,
+    decode_png,
+    encode_png,
+    png_chunk,
+    render_preview,
+)
+
+BASELINE_DIR = Path(__file__).parent.parent.parent / "previews"
+
+
+def random_image(height: int = 7, width: int = 5) -> np.ndarray:
+    """Deterministic random RGB image."""
+    return np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+
+
+def filtered_png(image: np.ndarray, filters: list[int]) -> bytes:
+    """Encode an image with the given Sub (1) or Up (2) filter per row."""
+    height, width, _ = image.shape
+    rows = []
+    previous = np.zeros((width, 3), dtype=np.uint8)
+    for row, kind in zip(image, filters, strict=True):
+        if kind == 1:
+            left = np.concatenate([np.zeros((1, 3), dtype=np.uint8), row[:-1]])
+            data = row - left
+        else:
+            data = row - previous
+        rows.append(bytes([kind]) + data.tobytes())
+        previous = row
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return b"".join(
+        (
+            PNG_SIGNATURE,
+            png_chunk(b"IHDR", header),
+            png_chunk(b"IDAT", zlib.compress(b"".join(rows))),
+            png_chunk(b"IEND", b""),
+        )
+    )
+
+
+def test_round_trip() -> None:
+    """Decoding an encoded image gives back the same pixels."""
+    image = random_image()
+
+    decoded = decode_png(encode_png(image))
+
+    assert decoded.dtype == np.uint8
+    np.testing.assert_array_equal(decoded, image)
+
+
+@pytest.mark.parametrize("baseline", sorted(BASELINE_DIR.glob("*.png")), ids=lambda p: p.name)
+def test_baselines_reencode_identically(baseline: Path) -> None:
+    """Stored baselines decode and encode back to the same bytes."""
+    data = baseline.read_bytes()
+
+    assert encode_png(decode_png(data)) == data
+
+
+def test_decodes_sub_and_up_filters() -> None:
+    """Rows filtered with Sub and Up are reconstructed."""
+    image = random_image()
+
+    decoded = decode_png(filtered_png(image, [1, 2, 1, 1, 2, 2, 1]))
+
+    np.testing.assert_array_equal(decoded, image)
+
+
+def test_rejects_other_files() -> None:
+    """Data without the PNG signature is rejected."""
+    with pytest.raises(ValueError, match="not a PNG file"):
+        decode_png(b"GIF89a")
+
+
+def test_compare_images_allows_tolerance() -> None:
+    """Channel differences up to the tolerance match; larger ones are highlighted."""
+    baseline = np.full((2, 2, 3), 100, dtype=np.uint8)
+    rendered = baseline.copy()
+    rendered[0, 0, 1] = 102
+    rendered[1, 1, 2] = 110
+
+    diff = compare_images(rendered, baseline, tolerance=2)
+
+    assert (diff.mismatched, diff.max_delta) == (1, 10)
+    assert tuple(diff.image[1, 1]) == tuple(DIFF_HIGHLIGHT)
+    assert tuple(diff.image[0, 0]) == (25, 25, 25)
+
+
+def test_stacked_layers_match_color_table_composite() -> None:
+    """Translucent layers round to 8 bits one by one, like color_table.composite."""
+    layers = ["#2d2a2e", "#fcfcfae5", "#221f2233", "#ff618833"]
+    colors = {f"layer{i}": parse_hex(color) for i, color in enumerate(layers)}
+    layout = tuple(Shape(0, 0, 1, 1, key) for key in colors)
+
+    expected = parse_hex(layers[0])
+    for color in layers[1:]:
+        expected = composite(parse_hex(color), expected)
+
+    assert render_preview(colors, layout)[0, 0].tolist() == list(unpack(expected)[:3])
@@ -0,0 +1,54 @@
+"""Tests for synthesizing and screening palette variants."""
+
+import json
+
+from monokai_islands.color_table import ColorTable
+from monokai_islands.paths import DEFAULT_PALETTE_PATH
+from monokai_islands.variant_synth import DERIVED_FOREGROUND_SUFFIX, VariantSpec, synthesize
+
+LIGHT_SPECS = [VariantSpec(True, shift, 4.5) for shift in (-0.02, 0.0, 0.02)]
+
+
+def load_base() -> dict:
+    """Load the default palette."""
+    with DEFAULT_PALETTE_PATH.open() as f:
+        return json.load(f)
+
+
+def luminance(color: str) -> float:
+    """Relative luminance of a hex color."""
+    return ColorTable({"color": color}).luminance("color")
+
+
+def test_light_counterpart_passes_screening() -> None:
+    """At least one light counterpart passes the palette and generated theme checks."""
+    variants = synthesize(load_base(), LIGHT_SPECS)
+
+    passing = [variant.spec.name for variant in variants if variant.passed]
+
+    assert passing, [issue for variant in variants for issue in variant.issues]
+
+
+def test_derived_literals_follow_the_light_transform() -> None:
+    """Literal derived surfaces turn light; translucent literals keep their alpha."""
+    base = load_base()
+    [variant] = synthesize(base, [VariantSpec(True, 0.0, 4.5)])
+
+    for name in ("tab_active_bg", "popup_bg", "input_bg"):
+        assert luminance(variant.derived[name]) > luminance(base["_derived"][name])
+        assert luminance(variant.derived[name]) > 0.5
+    assert variant.derived["notification_bg_90"].endswith("e5")
+    assert variant.derived["transparent"] == base["_derived"]["transparent"]
+    assert variant.derived["notification_bg"] == base["_derived"]["notification_bg"]
+
+
+def test_dark_variant_keeps_derived_literals() -> None:
+    """Without mirroring or shift, derived surfaces survive the OKLCH round trip."""
+    base = load_base()
+    [variant] = synthesize(base, [VariantSpec(False, 0.0, 3.0)])
+
+    for name, expression in base["_derived"].items():
+        if isinstance(expression, str) and expression.startswith("#"):
+            if name.endswith(DERIVED_FOREGROUND_SUFFIX):
+                continue  # Boosted to 4.5:1 like "text"
+            assert variant.derived[name] == expression.lower(), name
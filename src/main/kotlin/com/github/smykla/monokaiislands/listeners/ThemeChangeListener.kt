@@ -26,7 +26,7 @@ class ThemeChangeListener : LafManagerListener {
         fun isMonokaiThemeActive(): Boolean =
             LafManager.getInstance().currentUIThemeLookAndFeel?.id == THEME_ID
 
-        private const val CSS_RESOURCE_PATH = "/styles/markdown-preview.css"
+        private const val CSS_RESOURCE_PATH = "/styles/markdown-preview-dark.css"
         private const val MARKDOWN_SETTINGS_CLASS = "org.intellij.plugins.markdown.settings.MarkdownSettings"
         private const val MARKDOWN_COMPANION_CLASS = $$"$$MARKDOWN_SETTINGS_CLASS$Companion"
 